@@ -0,0 +1,175 @@
+# resources.py
+from benefits.models import Benefit, ArchivedBenefit
+from workers.lookups import CostCenter
+from workers.models import Workers, ArchivedWorker, WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from workers.registry import LOOKUP_KEY_FIELDS, LOOKUP_MODELS, lookup_registry
+
+
+API_PAGE_SIZE = 100
+API_MAX_PAGE_SIZE = 1000
+
+# ?sicil_no=a,b,c ile tek istekte sorgulanabilecek sicil sayısı
+API_MAX_SICIL_FILTER = 500
+
+
+class ApiError(Exception):
+    """İstek parametre hatası (view 400 döner)"""
+
+
+def _model_fields(model, exclude=(), joined=None):
+    """
+    Çıktı alanı → (values() yolu, lookup model).
+    Lookup FK'lar id olarak okunur, registry'den kod / isim olarak yazılır;
+    personel ilişkisi gibi diğer FK'lar sadece joined ile açılır.
+    """
+    fields = {}
+    for field in model._meta.concrete_fields:
+        if field.name in exclude:
+            continue
+        if field.is_relation:
+            if field.related_model in LOOKUP_MODELS:
+                fields[field.name] = (field.attname, field.related_model)
+            continue
+        fields[field.name] = (field.name, None)
+    fields.update({name: (path, None) for name, path in (joined or {}).items()})
+    return fields
+
+
+class Resource:
+    def __init__(self, model, fields, sicil_path, cost_center_path, periodic):
+        self.model = model
+        self.fields = fields
+        self.sicil_path = sicil_path
+        self.cost_center_path = cost_center_path
+        self.periodic = periodic
+
+
+WORKER_EXCLUDE = ["author", "search_key"]
+
+API_RESOURCES = {
+    "workers": Resource(
+        Workers, _model_fields(Workers, WORKER_EXCLUDE),
+        "sicil_no", "s_no_id", periodic=False,
+    ),
+    "archived_workers": Resource(
+        ArchivedWorker, _model_fields(ArchivedWorker, WORKER_EXCLUDE),
+        "sicil_no", "s_no_id", periodic=False,
+    ),
+    "salaries": Resource(
+        WorkerGrossMonthly,
+        _model_fields(WorkerGrossMonthly, joined={
+            "sicil_no": "worker__sicil_no", "name_surname": "worker__name_surname",
+        }),
+        "worker__sicil_no", "s_no_id", periodic=True,
+    ),
+    "archived_salaries": Resource(
+        ArchivedWorkerGrossMonthly,
+        _model_fields(ArchivedWorkerGrossMonthly, joined={
+            "sicil_no": "archived_worker__sicil_no", "name_surname": "archived_worker__name_surname",
+        }),
+        "archived_worker__sicil_no", "s_no_id", periodic=True,
+    ),
+    "benefits": Resource(
+        Benefit,
+        _model_fields(Benefit, joined={
+            "sicil_no": "worker_id", "name_surname": "worker__name_surname",
+        }),
+        "worker_id", "worker__s_no_id", periodic=True,
+    ),
+    "archived_benefits": Resource(
+        ArchivedBenefit,
+        _model_fields(ArchivedBenefit, joined={
+            "name_surname": "archived_worker__name_surname",
+        }),
+        "sicil_no", "archived_worker__s_no_id", periodic=True,
+    ),
+}
+
+
+def _csv_param(value):
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def _int_param(params, name, default=None):
+    value = params.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(f"'{name}' must be an integer")
+
+
+def _lookup_keys(model):
+    # Lookup'lar Excel import'larındaki anahtarla yazılır (kod / isim)
+    field = LOOKUP_KEY_FIELDS.get(model, "name")
+    return {obj.pk: getattr(obj, field) for obj in lookup_registry.all(model)}
+
+
+def resource_page(resource_name, params):
+    """
+    Tek sorguluk sayfa: values() + gerekli JOIN'ler, pk üzerinden keyset (cursor).
+
+    params: ?fields=a,b&year=&month=&sicil_no=a,b&cost_center=<kod>&cursor=&limit=
+    Dönüş: {"results": [...], "next": sonraki sayfanın cursor'ı | None}
+    """
+    resource = API_RESOURCES.get(resource_name)
+    if resource is None:
+        raise ApiError(f"Unknown resource: {resource_name}. Choose one of: {', '.join(API_RESOURCES)}")
+
+    names = _csv_param(params.get("fields")) or list(resource.fields)
+    unknown = [name for name in names if name not in resource.fields]
+    if unknown:
+        raise ApiError(f"Unknown fields: {', '.join(unknown)}")
+    if "id" not in names:
+        names.insert(0, "id")
+
+    limit = min(max(_int_param(params, "limit", API_PAGE_SIZE), 1), API_MAX_PAGE_SIZE)
+    cursor = _int_param(params, "cursor")
+
+    queryset = resource.model.objects.all()
+    if cursor is not None:
+        queryset = queryset.filter(pk__gt=cursor)
+
+    year, month = _int_param(params, "year"), _int_param(params, "month")
+    if (year or month) and not resource.periodic:
+        raise ApiError(f"'{resource_name}' cannot be filtered by year/month")
+    if year:
+        queryset = queryset.filter(year=year)
+    if month:
+        queryset = queryset.filter(month=month)
+
+    sicil_nos = _csv_param(params.get("sicil_no"))
+    if len(sicil_nos) > API_MAX_SICIL_FILTER:
+        raise ApiError(f"At most {API_MAX_SICIL_FILTER} sicil_no values per request")
+    if sicil_nos:
+        queryset = queryset.filter(**{f"{resource.sicil_path}__in": sicil_nos})
+
+    cost_center = params.get("cost_center")
+    if cost_center:
+        cost_center_id = lookup_registry.id_map(CostCenter).get(cost_center)
+        if cost_center_id is None:
+            raise ApiError(f"Unknown cost center: {cost_center}")
+        queryset = queryset.filter(**{resource.cost_center_path: cost_center_id})
+
+    paths = [resource.fields[name][0] for name in names]
+    rows = list(queryset.order_by("pk").values_list(*paths)[:limit + 1])
+
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    lookups = {
+        i: _lookup_keys(resource.fields[name][1])
+        for i, name in enumerate(names) if resource.fields[name][1]
+    }
+    results = []
+    for row in rows:
+        item = dict(zip(names, row))
+        for i, keys in lookups.items():
+            item[names[i]] = keys.get(row[i])
+        results.append(item)
+
+    return {
+        "results": results,
+        "next": str(results[-1]["id"]) if has_next else None,
+    }
@@ -0,0 +1,12 @@
+from django.urls import path
+from . import views
+
+
+app_name = "api"
+
+
+urlpatterns = [
+    path("salaries/bulk/", views.bulk_salaries, name="bulk_salaries"),
+    path("benefits/bulk/", views.bulk_benefits, name="bulk_benefits"),
+    path("<str:resource>/", views.resource_list, name="list"),
+]
@@ -0,0 +1,74 @@
+import json
+from decimal import Decimal
+from functools import wraps
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET, require_POST
+
+from user.permissions import request_role
+from .resources import ApiError, resource_page
+from .writes import API_MAX_BULK_RECORDS, write_benefit_records, write_salary_records
+
+
+def api_access(write=False):
+    """login_required / write_access_required'ın JSON karşılığı (redirect yerine 401 / 403)"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not request.user.is_authenticated:
+                return JsonResponse({"error": "Authentication required"}, status=401)
+            if write and request_role(request) not in ("admin", "editor"):
+                return JsonResponse({"error": "Write access required"}, status=403)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@require_GET
+@api_access()
+def resource_list(request, resource):
+    """
+    GET /api/<resource>/ → workers, archived_workers, salaries, archived_salaries,
+    benefits, archived_benefits. Filtreler ve sayfalama: api/resources.py
+    """
+    try:
+        return JsonResponse(resource_page(resource, request.GET))
+    except ApiError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+
+def _records(request):
+    try:
+        # Tutarlar float'a çevrilmeden Decimal olarak okunur
+        body = json.loads(request.body, parse_float=Decimal)
+    except (ValueError, UnicodeDecodeError):
+        raise ApiError("Request body must be JSON")
+
+    records = body.get("records") if isinstance(body, dict) else None
+    if not isinstance(records, list):
+        raise ApiError("Expected {\"records\": [...]}")
+    if len(records) > API_MAX_BULK_RECORDS:
+        raise ApiError(f"At most {API_MAX_BULK_RECORDS} records per request")
+    return records
+
+
+def _bulk_write(request, write_records):
+    try:
+        records = _records(request)
+    except ApiError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse(write_records(records))
+
+
+@require_POST
+@api_access(write=True)
+def bulk_salaries(request):
+    """POST /api/salaries/bulk/ {"records": [...]} → WorkerGrossMonthly upsert"""
+    return _bulk_write(request, write_salary_records)
+
+
+@require_POST
+@api_access(write=True)
+def bulk_benefits(request):
+    """POST /api/benefits/bulk/ {"records": [...]} → Benefit upsert"""
+    return _bulk_write(request, write_benefit_records)
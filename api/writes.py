@@ -0,0 +1,231 @@
+# writes.py
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from benefits.bulk import (
+    BENEFIT_ALLOWED_MONTHS, BENEFIT_AMOUNT_FIELDS, existing_benefit_keys, upsert_benefits,
+)
+from benefits.importers import MIN_YEAR, MAX_YEAR
+from benefits.models import Benefit
+from benefits.utils import get_bayram_months_for_year, parse_tr_decimal
+from workers.lookups import Currency
+from workers.models import Workers, WorkerGrossMonthly
+from workers.registry import lookup_registry
+from workers.salaries import MONTHLY_ORG_FIELDS, monthly_gross_payment, upsert_monthly_salaries
+
+
+# Tek çağrıda kabul edilen kayıt sayısı
+API_MAX_BULK_RECORDS = 1000
+
+
+class RecordError(Exception):
+    pass
+
+
+def _amount(value):
+    """JSON sayısı olduğu gibi, metin TR formatında (10.000,32)"""
+    if value is None or value == "":
+        return Decimal("0")
+    if isinstance(value, bool):
+        raise RecordError("amount must be a number")
+    if isinstance(value, (int, float, Decimal)):
+        try:
+            amount = Decimal(str(value))
+        except InvalidOperation:
+            raise RecordError("amount must be a number")
+    else:
+        amount = parse_tr_decimal(value)
+    # JSON'da NaN / Infinity geçerli; DecimalField'a yazılırken InvalidOperation (500) verir
+    if not amount.is_finite():
+        raise RecordError("amount must be a finite number")
+    return amount
+
+
+def _period(record):
+    try:
+        year, month = int(record.get("year")), int(record.get("month"))
+    except (TypeError, ValueError):
+        raise RecordError("year/month is not a whole number")
+    if not (MIN_YEAR <= year <= MAX_YEAR and 1 <= month <= 12):
+        raise RecordError("year/month out of range")
+    return year, month
+
+
+class _Batch:
+    """
+    Kayıtları doğrular; hatalı olanlar sebebiyle atlanır (import'lardaki skipped_rows),
+    aynı (sicil, year, month) tekrar ederse sonraki geçerlidir.
+    """
+
+    def __init__(self, records):
+        self.skipped = []
+        self.valid = {}
+        self.records = records
+
+    def skip(self, index, record, reason):
+        sicil_no = record.get("sicil_no") if isinstance(record, dict) else None
+        self.skipped.append({"row": index, "sicil_no": sicil_no, "reason": reason})
+
+    def parse(self, parse_record, workers):
+        for index, record in enumerate(self.records):
+            if not isinstance(record, dict):
+                self.skip(index, record, "record must be an object")
+                continue
+            worker = workers.get(str(record.get("sicil_no") or "").strip())
+            if worker is None:
+                self.skip(index, record, "unknown sicil_no")
+                continue
+            try:
+                year, month = _period(record)
+                values = parse_record(record, worker, year, month)
+            except RecordError as e:
+                self.skip(index, record, str(e))
+                continue
+
+            key = (worker.sicil_no, year, month)
+            if key in self.valid:
+                self.skip(self.valid[key][0], record, "duplicate sicil_no/year/month, a later row wins")
+            self.valid[key] = (index, worker, values)
+
+    def result(self, updated):
+        return {
+            "rows": len(self.records),
+            "inserted": len(self.valid) - updated,
+            "updated": updated,
+            "skipped": len(self.skipped),
+            "skipped_rows": sorted(self.skipped, key=lambda r: r["row"]),
+        }
+
+
+def _workers_for(records, only=None):
+    sicil_nos = {
+        str(r.get("sicil_no") or "").strip() for r in records if isinstance(r, dict)
+    } - {""}
+    queryset = Workers.objects.filter(sicil_no__in=sicil_nos)
+    if only:
+        queryset = queryset.only(*only)
+    return {w.sicil_no: w for w in queryset}
+
+
+def write_salary_records(records):
+    """
+    [{"sicil_no", "year", "month", "gross_salary_hourly", "currency"?, "bonus"?}, ...]
+    → WorkerGrossMonthly upsert (upsert_monthly_salaries).
+
+    Org alanları personelden kopyalanır ve gross_payment hesaplanır (WorkerGrossMonthly.save()
+    ile aynı); bonus verilmezse yılın ilk ayı personelin bonusunu alır, diğer aylar 0.
+    """
+    workers = _workers_for(records, ["id", "sicil_no", "bonus", *(f"{f}_id" for f in MONTHLY_ORG_FIELDS)])
+    currencies = lookup_registry.id_map(Currency)
+    batch = _Batch(records)
+
+    def _parse(record, worker, year, month):
+        hourly = _amount(record.get("gross_salary_hourly"))
+        if hourly <= 0:
+            raise RecordError("gross_salary_hourly must be greater than 0")
+
+        currency_id = worker.currency_id
+        if record.get("currency"):
+            currency_id = currencies.get(record["currency"])
+            if currency_id is None:
+                raise RecordError(f"unknown currency: {record['currency']}")
+
+        bonus = record.get("bonus")
+        if bonus is not None:
+            try:
+                bonus = int(bonus)
+            except (TypeError, ValueError):
+                raise RecordError("bonus must be an integer")
+            if not 0 <= bonus <= 100:
+                raise RecordError("bonus must be between 0 and 100")
+        return {"hourly": hourly, "currency_id": currency_id, "bonus": bonus}
+
+    batch.parse(_parse, workers)
+    if not batch.valid:
+        return batch.result(0)
+
+    with transaction.atomic():
+        existing = set(
+            WorkerGrossMonthly.objects
+            .filter(
+                worker_id__in={worker.pk for _, worker, _ in batch.valid.values()},
+                year__in={year for _, year, _ in batch.valid},
+            )
+            .values_list("worker_id", "year", "month")
+        )
+
+        # Yılın ilk ayı: mevcut kayıtlar + bu çağrıdaki aylar
+        first_months = {}
+        for worker_id, year, month in existing:
+            first_months[(worker_id, year)] = min(month, first_months.get((worker_id, year), 13))
+        for (_, year, month), (_, worker, _) in batch.valid.items():
+            first_months[(worker.pk, year)] = min(month, first_months.get((worker.pk, year), 13))
+
+        rows = []
+        for (_, year, month), (_, worker, values) in batch.valid.items():
+            bonus = values["bonus"]
+            if bonus is None:
+                bonus = worker.bonus if first_months[(worker.pk, year)] == month else 0
+
+            salary = WorkerGrossMonthly(
+                worker_id=worker.pk,
+                year=year,
+                month=month,
+                sicil_no=worker.sicil_no,
+                bonus=bonus,
+                gross_salary_hourly=values["hourly"],
+                gross_payment=monthly_gross_payment(values["hourly"], year, month),
+            )
+            for field in MONTHLY_ORG_FIELDS:
+                setattr(salary, f"{field}_id", getattr(worker, f"{field}_id"))
+            salary.currency_id = values["currency_id"]
+            rows.append(salary)
+
+        updated = sum((s.worker_id, s.year, s.month) in existing for s in rows)
+        upsert_monthly_salaries(rows)
+
+    return batch.result(updated)
+
+
+def write_benefit_records(records):
+    """
+    [{"sicil_no", "year", "month", <tutar alanları>}, ...] → Benefit upsert (upsert_benefits).
+    Verilmeyen tutarlar 0; ay kuralları (erzak, altın, fon, bayram) bulk form / import ile aynı.
+    """
+    workers = _workers_for(records, ["id", "sicil_no"])
+    batch = _Batch(records)
+    bayram_months = {}
+
+    def _parse(record, worker, year, month):
+        if year not in bayram_months:
+            bayram_months[year] = get_bayram_months_for_year(year)
+
+        amounts = {}
+        for field in BENEFIT_AMOUNT_FIELDS:
+            value = _amount(record.get(field))
+            if value < 0:
+                raise RecordError(f"{field} must not be negative")
+            allowed = BENEFIT_ALLOWED_MONTHS.get(field)
+            if field == "bayram":
+                allowed = bayram_months[year]
+            amounts[field] = value if allowed is None or month in allowed else Decimal("0")
+        return amounts
+
+    batch.parse(_parse, workers)
+    if not batch.valid:
+        return batch.result(0)
+
+    with transaction.atomic():
+        existing = existing_benefit_keys(
+            list({sicil_no for sicil_no, _, _ in batch.valid}),
+            list({year for _, year, _ in batch.valid}),
+        )
+        rows = [
+            Benefit(worker_id=sicil_no, year=year, month=month, **values)
+            for (sicil_no, year, month), (_, _, values) in batch.valid.items()
+        ]
+        updated = sum((b.worker_id, b.year, b.month) in existing for b in rows)
+        upsert_benefits(rows)
+
+    return batch.result(updated)
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class BenchmarksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'benchmarks'
+
+    def ready(self):
+        from .middleware import install_render_timer, instrumentation_enabled
+        if instrumentation_enabled():
+            install_render_timer()
@@ -0,0 +1,247 @@
+# generator.py
+import datetime
+import random
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from benefits.bulk import BENEFIT_ALLOWED_MONTHS
+from benefits.models import Benefit
+from benefits.utils import get_bayram_months_for_year
+from reports.summary import rebuild_summary
+from workers.archive import archive_workers
+from workers.lookups import (
+    Group, ShortClass, DirectorName, Currency,
+    WorkClass, ClassName, Department, CostCenter, ExitReason, LocationName
+)
+from workers.models import Workers, WorkerGrossMonthly
+from workers.registry import lookup_registry
+from workers.salaries import MONTHLY_ORG_FIELDS, monthly_gross_payment
+
+
+GENERATOR_BATCH_SIZE = 5000
+
+# Arşivleme archive_workers() ile bu büyüklükte gruplarla yapılır
+ARCHIVE_CHUNK_SIZE = 200
+
+BENCHMARK_USERNAME = "benchmark"
+
+FIRST_NAMES = [
+    "Ahmet", "Mehmet", "Ayşe", "Fatma", "Mustafa", "Emine", "Ali", "Hatice", "Hüseyin", "Zeynep",
+    "İbrahim", "Elif", "Hasan", "Şule", "Murat", "Özlem", "Çağrı", "Gül", "Yusuf", "Büşra",
+]
+LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+]
+
+# Lookup tabloları boşsa oluşturulan değerler (varsa mevcutlar kullanılır)
+LOOKUP_SEEDS = {
+    Group: [{"name": f"Group {i}"} for i in range(1, 6)],
+    ShortClass: [{"name": name} for name in ("W", "B", "I")],
+    DirectorName: [{"name": f"Directorship {i}"} for i in range(1, 9)],
+    Currency: [{"code": code} for code in ("TRY", "EUR", "USD")],
+    WorkClass: [{"name": f"Work Class {i}"} for i in range(1, 7)],
+    ClassName: [{"name": f"Class {i}"} for i in range(1, 11)],
+    Department: [{"name": f"Department {i}"} for i in range(1, 16)],
+    CostCenter: [{"code": f"{36000 + i}", "name": f"Cost Center {i}"} for i in range(1, 41)],
+    LocationName: [{"name": f"Location {i}"} for i in range(1, 6)],
+    ExitReason: [{"name": name} for name in ("Resignation", "Retirement", "Termination", "Contract End")],
+}
+
+# Worker'da rastgele seçilen lookup FK'ları (departman grubu ve currency ayrıca)
+WORKER_LOOKUP_FIELDS = {
+    "group": Group, "short_class": ShortClass, "work_class": WorkClass,
+    "class_name": ClassName, "location_name": LocationName,
+}
+
+
+def benchmark_user():
+    """Üretilen kayıtların author'u ve benchmark istemcisinin oturumu"""
+    user, created = User.objects.get_or_create(
+        username=BENCHMARK_USERNAME, defaults={"is_superuser": True, "is_staff": True}
+    )
+    if created:
+        user.set_unusable_password()
+        user.save(update_fields=["password"])
+    return user
+
+
+def _ensure_lookups():
+    ids = {}
+    for model, seeds in LOOKUP_SEEDS.items():
+        if not model.objects.exists():
+            model.objects.bulk_create([model(**seed) for seed in seeds])
+        ids[model] = list(model.objects.order_by("pk").values_list("pk", flat=True))
+    lookup_registry.invalidate()
+    return ids
+
+
+def _department_org(rng, lookups):
+    """
+    Departman → directorship ve 2-3 masraf yeri; gerçek veride olduğu gibi
+    org alanları birbirinden bağımsız dağılmaz.
+    """
+    departments = lookups[Department]
+    index = rng.randrange(len(departments))
+    cost_centers = lookups[CostCenter]
+    directorships = lookups[DirectorName]
+    return {
+        "department_id": departments[index],
+        "department_short_name_id": directorships[index % len(directorships)],
+        "s_no_id": cost_centers[(index * 3 + rng.randint(0, 2)) % len(cost_centers)],
+    }
+
+
+def _amount(rng, low, high):
+    return Decimal(rng.randrange(low * 100, high * 100)) / 100
+
+
+class _Worker:
+    """Üretim sırasında worker başına tutulan durum (maaş artışı, org değişikliği)"""
+
+    def __init__(self, worker, rng, lookups):
+        self.worker = worker
+        self.org = {f"{field}_id": getattr(worker, f"{field}_id") for field in MONTHLY_ORG_FIELDS}
+        self.hourly = worker.gross_payment_hourly
+        self.rng = rng
+        self.lookups = lookups
+
+    def next_year(self):
+        # Yıllık zam (%5-%40) ve ara sıra departman / masraf yeri değişikliği
+        self.hourly = (self.hourly * Decimal(100 + self.rng.randint(5, 40)) / 100).quantize(Decimal("0.01"))
+        if self.rng.random() < 0.1:
+            self.org.update(_department_org(self.rng, self.lookups))
+
+
+def _build_workers(sicil_nos, rng, lookups, start_year, author_id):
+    workers = []
+    for sicil_no in sicil_nos:
+        gross = _amount(rng, 30000, 150000)
+        worker = Workers(
+            sicil_no=sicil_no,
+            name_surname=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            date_of_recruitment=timezone.make_aware(
+                datetime.datetime(rng.randint(start_year - 15, start_year), rng.randint(1, 12), 1)
+            ),
+            gross_payment=gross,
+            total_work_hours=Decimal("225"),
+            gross_payment_hourly=(gross / Decimal("225")).quantize(Decimal("0.01")),
+            update_date_user=datetime.date(start_year, 1, 1),
+            bonus=rng.choice([0, 0, 5, 10, 15]),
+            author_id=author_id,
+        )
+        for field, model in WORKER_LOOKUP_FIELDS.items():
+            setattr(worker, f"{field}_id", rng.choice(lookups[model]))
+        for field, value in _department_org(rng, lookups).items():
+            setattr(worker, field, value)
+        # Çoğunluk yerel para birimi (ilk currency)
+        currencies = lookups[Currency]
+        worker.currency_id = currencies[0] if rng.random() < 0.9 else rng.choice(currencies)
+        worker.refresh_search_key()
+        workers.append(worker)
+    return workers
+
+
+def _monthly_rows(state, year, bayram_months):
+    worker = state.worker
+    salaries, benefits = [], []
+    rng = state.rng
+
+    for month in range(1, 13):
+        salary = WorkerGrossMonthly(
+            worker_id=worker.pk,
+            year=year,
+            month=month,
+            sicil_no=worker.sicil_no,
+            bonus=worker.bonus if month == 1 else 0,
+            gross_salary_hourly=state.hourly,
+            gross_payment=monthly_gross_payment(state.hourly, year, month),
+            **state.org,
+        )
+        salaries.append(salary)
+
+        amounts = {
+            "aile_yakacak": _amount(rng, 500, 1500),
+            "yol_parasi": _amount(rng, 1000, 3000),
+            "harcirah": _amount(rng, 0, 2000) if rng.random() < 0.2 else Decimal("0"),
+            "prim": _amount(rng, 1000, 10000) if rng.random() < 0.1 else Decimal("0"),
+            "dogum_evlenme": _amount(rng, 2000, 5000) if rng.random() < 0.01 else Decimal("0"),
+            "erzak": _amount(rng, 500, 1500) if month in BENEFIT_ALLOWED_MONTHS["erzak"] else Decimal("0"),
+            "altin": _amount(rng, 3000, 8000) if month in BENEFIT_ALLOWED_MONTHS["altin"] else Decimal("0"),
+            "fon": _amount(rng, 1000, 4000) if month in BENEFIT_ALLOWED_MONTHS["fon"] else Decimal("0"),
+            "bayram": _amount(rng, 2000, 6000) if month in bayram_months else Decimal("0"),
+        }
+        benefits.append(Benefit(worker_id=worker.sicil_no, year=year, month=month, **amounts))
+
+    return salaries, benefits
+
+
+def _bulk_insert(model, rows, force=False):
+    if rows and (force or len(rows) >= GENERATOR_BATCH_SIZE):
+        model.objects.bulk_create(rows, batch_size=1000)
+        rows.clear()
+
+
+def generate_payroll_data(workers=1000, years=5, archived=100, prefix="S", end_year=None, seed=0, log=None):
+    """
+    Sentetik bordro verisi: workers + archived worker, her biri için `years` yıl × 12 ay
+    WorkerGrossMonthly ve Benefit. Arşiv popülasyonu archive_workers() ile gerçek yoldan
+    oluşturulur; sonunda bordro özeti yeniden kurulur.
+
+    Dönüş: {"workers", "archived", "salaries", "benefits"}
+    """
+    log = log or (lambda message: None)
+    rng = random.Random(seed)
+    end_year = end_year or datetime.date.today().year
+    start_year = end_year - years + 1
+    total = workers + archived
+    sicil_nos = [f"{prefix}{i:06d}" for i in range(total)]
+
+    with transaction.atomic():
+        lookups = _ensure_lookups()
+        author_id = benchmark_user().pk
+
+        log(f"Creating {total} workers ...")
+        Workers.objects.bulk_create(
+            _build_workers(sicil_nos, rng, lookups, start_year, author_id), batch_size=1000
+        )
+        created = list(Workers.objects.filter(sicil_no__in=sicil_nos).order_by("sicil_no"))
+
+        log(f"Creating {years} years of salaries and benefits ...")
+        bayram = {year: get_bayram_months_for_year(year) for year in range(start_year, end_year + 1)}
+        salaries, benefits = [], []
+        counts = {"salaries": 0, "benefits": 0}
+        for worker in created:
+            state = _Worker(worker, rng, lookups)
+            for year in range(start_year, end_year + 1):
+                if year > start_year:
+                    state.next_year()
+                monthly_salaries, monthly_benefits = _monthly_rows(state, year, bayram[year])
+                salaries.extend(monthly_salaries)
+                benefits.extend(monthly_benefits)
+                counts["salaries"] += len(monthly_salaries)
+                counts["benefits"] += len(monthly_benefits)
+            _bulk_insert(WorkerGrossMonthly, salaries)
+            _bulk_insert(Benefit, benefits)
+        _bulk_insert(WorkerGrossMonthly, salaries, force=True)
+        _bulk_insert(Benefit, benefits, force=True)
+
+        to_archive = created[workers:]
+        log(f"Archiving {len(to_archive)} workers ...")
+        for start in range(0, len(to_archive), ARCHIVE_CHUNK_SIZE):
+            archive_workers([
+                (
+                    worker,
+                    datetime.date(rng.randint(start_year, end_year), rng.randint(1, 12), 28),
+                    rng.choice(lookups[ExitReason]),
+                )
+                for worker in to_archive[start:start + ARCHIVE_CHUNK_SIZE]
+            ])
+
+        log("Rebuilding payroll summary ...")
+        rebuild_summary()
+
+    return {"workers": workers, "archived": archived, **counts}
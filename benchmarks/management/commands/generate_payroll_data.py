@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.generator import generate_payroll_data
+from workers.models import Workers, ArchivedWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark için sentetik personel, aylık maaş, yan hak ve arşiv verisi üretir. "
+        "Sadece lokal / test veritabanında çalıştırın."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=1000, help="Aktif personel sayısı.")
+        parser.add_argument("--years", type=int, default=5, help="Personel başına yıl sayısı (12 ay).")
+        parser.add_argument("--archived", type=int, default=100, help="Arşivlenecek personel sayısı.")
+        parser.add_argument("--end-year", type=int, default=None, help="Son yıl (varsayılan bu yıl).")
+        parser.add_argument("--prefix", default="S", help="Üretilen sicil no'ların ön eki.")
+        parser.add_argument("--seed", type=int, default=0, help="Tekrarlanabilir veri için random seed.")
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if prefix.startswith("P"):
+            raise CommandError("Sicil numbers starting with 'P' are never archived; choose another --prefix.")
+        if (
+            Workers.objects.filter(sicil_no__startswith=prefix).exists()
+            or ArchivedWorker.objects.filter(sicil_no__startswith=prefix).exists()
+        ):
+            raise CommandError(f"Workers with prefix '{prefix}' already exist; choose another --prefix.")
+
+        counts = generate_payroll_data(
+            workers=options["workers"],
+            years=options["years"],
+            archived=options["archived"],
+            prefix=prefix,
+            end_year=options["end_year"],
+            seed=options["seed"],
+            log=self.stdout.write,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"{counts['workers']} workers, {counts['archived']} archived, "
+            f"{counts['salaries']} salary rows, {counts['benefits']} benefit rows."
+        ))
@@ -0,0 +1,65 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from benchmarks.suite import BENCHMARKS, compare, run_suite
+
+
+class Command(BaseCommand):
+    help = (
+        "Ana yolları (import, bulk, liste sayfaları) mevcut veritabanında ölçer: "
+        "süre, sorgu sayısı, tepe bellek. Sonuç JSON olarak yazılır; her tur geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names", nargs="*", metavar="benchmark",
+            help=f"Çalıştırılacak benchmark'lar (varsayılan hepsi): {', '.join(BENCHMARKS)}",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Süre ölçümü tur sayısı.")
+        parser.add_argument("--import-rows", type=int, default=500, help="Import sheet'lerindeki personel sayısı.")
+        parser.add_argument("--output", help="JSON sonuç dosyası (varsayılan benchmarks/results/<db>-<zaman>.json).")
+        parser.add_argument("--compare", metavar="BASELINE", help="Önceki bir sonuç dosyasıyla karşılaştır.")
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                baseline = json.load(f)
+
+        try:
+            report = run_suite(
+                names=options["names"] or None,
+                repeat=max(options["repeat"], 1),
+                import_rows=options["import_rows"],
+                log=self.stdout.write,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        output = options["output"] or os.path.join(
+            settings.BASE_DIR, "benchmarks", "results",
+            f"{connection.vendor}-{timezone.now():%Y%m%d-%H%M%S}.json",
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+
+        self.stdout.write(f"{'benchmark':<26}{'median ms':>12}{'queries':>10}{'peak KB':>12}")
+        for name, result in report["results"].items():
+            self.stdout.write(
+                f"{name:<26}{result['median_ms']:>12.1f}{result['queries']:>10}{result['peak_memory_kb']:>12.1f}"
+            )
+
+        if baseline:
+            self.stdout.write("")
+            self.stdout.write(f"{'vs baseline':<26}{'median ms':>12}{'baseline':>12}{'ratio':>8}{'Δ queries':>11}")
+            for name, median, base, ratio, query_delta in compare(report, baseline):
+                line = f"{name:<26}{median:>12.1f}{base:>12.1f}{ratio or 0:>8.2f}{query_delta:>+11}"
+                self.stdout.write(self.style.ERROR(line) if ratio and ratio > 1.2 else line)
+
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
@@ -0,0 +1,60 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.startup import DEFAULT_IMPORT_BUDGET_MS, HEAVY_MODULES, measure_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker açılış süresini `python -X importtime` ile ölçer (Django + URLconf). "
+        "Import süresi STARTUP_IMPORT_BUDGET_MS'i aşarsa ya da pandas gibi ağır bir "
+        "kütüphane açılışta yüklenirse hata koduyla çıkar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="Ölçüm sayısı (median alınır).")
+        parser.add_argument(
+            "--budget-ms", type=float,
+            help="Import süresi sınırı (varsayılan STARTUP_IMPORT_BUDGET_MS).",
+        )
+        parser.add_argument("--output", help="Sonucu JSON olarak yaz.")
+
+    def handle(self, *args, **options):
+        budget = options["budget_ms"]
+        if budget is None:
+            budget = getattr(settings, "STARTUP_IMPORT_BUDGET_MS", DEFAULT_IMPORT_BUDGET_MS)
+
+        try:
+            report = measure_startup(repeat=options["repeat"])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+        report["budget_ms"] = budget
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+
+        self.stdout.write(f"{'module':<40}{'cumulative ms':>16}")
+        for item in report["top_imports"]:
+            self.stdout.write(f"{item['module']:<40}{item['ms']:>16.1f}")
+        self.stdout.write("")
+        self.stdout.write(
+            f"Import time (median of {len(report['runs'])}): {report['import_ms']:.1f} ms "
+            f"(budget {budget:.0f} ms), process wall time {report['wall_ms']:.1f} ms"
+        )
+
+        errors = []
+        if report["heavy_modules"]:
+            loaded = ", ".join(f"{m} ({ms:.0f} ms)" for m, ms in report["heavy_modules"].items())
+            errors.append(
+                f"Loaded at startup: {loaded}. {', '.join(HEAVY_MODULES)} must be imported "
+                f"inside the import/export functions that use them."
+            )
+        if report["import_ms"] > budget:
+            errors.append(f"Startup import time {report['import_ms']:.1f} ms exceeds {budget:.0f} ms budget.")
+
+        if errors:
+            raise CommandError("\n".join(errors))
+        self.stdout.write(self.style.SUCCESS("Startup within budget."))
@@ -0,0 +1,191 @@
+# benchmarks/middleware.py
+import contextvars
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import time
+import traceback
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import Template as DjangoTemplate
+
+
+logger = logging.getLogger(__name__)
+
+# Örneklenen isteğin ölçümü; örneklenmeyen isteklerde None
+_current = contextvars.ContextVar("request_instrumentation", default=None)
+
+# Yavaş istek logunda sorgu başına gösterilen proje frame'i
+STACK_FRAMES = 8
+
+
+class _Measurement:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []      # [(süre sn, sql, stack | None)]
+        self.sql_time = 0.0
+        self.render_time = 0.0
+        self.render_depth = 0
+
+    def record_query(self, sql, duration, stack):
+        self.queries.append((duration, sql, stack))
+        self.sql_time += duration
+
+
+def _query_wrapper(measurement, capture_stacks, stack_min_seconds, slow_request_seconds):
+    def wrapper(execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            end = time.perf_counter()
+            # Yavaş istek logu için çağıran yer; sadece yavaş sorguda ya da istek bütçeyi
+            # zaten aştıysa (log kesin yazılacak) alınır, satırlar sadece loglanırken okunur
+            stack = None
+            if capture_stacks and (
+                end - start >= stack_min_seconds or end - measurement.started >= slow_request_seconds
+            ):
+                stack = traceback.StackSummary.extract(
+                    traceback.walk_stack(sys._getframe(1)), lookup_lines=False
+                )
+            measurement.record_query(sql, end - start, stack)
+    return wrapper
+
+
+def instrumentation_enabled():
+    """RequestInstrumentationMiddleware MIDDLEWARE'da ve örnekleme açık"""
+    path = f"{__name__}.RequestInstrumentationMiddleware"
+    return path in settings.MIDDLEWARE and getattr(settings, "INSTRUMENTATION_SAMPLE_RATE", 0.0) > 0
+
+
+def install_render_timer():
+    """
+    Template render süresi için DjangoTemplate.render sarılır; BenchmarksConfig.ready()
+    ölçüm açıksa bir kez çağırır. Örneklenmeyen render'a maliyeti tek bir ContextVar okuması.
+    """
+    original = DjangoTemplate.render
+    if getattr(original, "instrumented", False):
+        return
+
+    @functools.wraps(original)
+    def render(self, context=None, request=None):
+        measurement = _current.get()
+        if measurement is None:
+            return original(self, context, request)
+
+        # render_to_string içinden başka bir template render edilirse iki kez sayılmaz
+        measurement.render_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            measurement.render_depth -= 1
+            if measurement.render_depth == 0:
+                measurement.render_time += time.perf_counter() - start
+
+    render.instrumented = True
+    DjangoTemplate.render = render
+
+
+def _project_frames(stack):
+    """Stack'ten proje kodundaki frame'ler (Django / site-packages hariç), çağrı sırasıyla"""
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in stack
+        if frame.filename.startswith(base_dir) and "site-packages" not in frame.filename
+        and not frame.filename.endswith(os.path.join("benchmarks", "middleware.py"))
+    ]
+    frames.reverse()
+    return [f"{os.path.relpath(f.filename, base_dir)}:{f.lineno} {f.name}" for f in frames[-STACK_FRAMES:]]
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Örneklenen isteklerde (INSTRUMENTATION_SAMPLE_RATE) sorgu sayısı, toplam SQL süresi,
+    en yavaş sorgular ve template render süresini ölçer:
+      - Server-Timing header'ı (tarayıcı devtools → Network → Timing)
+      - tek satır JSON log (logger "benchmarks.middleware")
+      - INSTRUMENTATION_SLOW_REQUEST_MS aşılırsa tüm sorgular WARNING olarak; stack'ler
+        INSTRUMENTATION_STACK_MIN_QUERY_MS'ten yavaş sorgular ve bütçe aşıldıktan sonrakiler için
+
+    Örneklenmeyen isteğe maliyeti tek bir random() çağrısı.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "INSTRUMENTATION_SAMPLE_RATE", 0.0)
+        self.slow_request_ms = getattr(settings, "INSTRUMENTATION_SLOW_REQUEST_MS", 1000)
+        self.slowest_queries = getattr(settings, "INSTRUMENTATION_SLOWEST_QUERIES", 3)
+        self.capture_stacks = getattr(settings, "INSTRUMENTATION_CAPTURE_STACKS", True)
+        self.stack_min_query_ms = getattr(settings, "INSTRUMENTATION_STACK_MIN_QUERY_MS", 20)
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        measurement = _Measurement()
+        token = _current.set(measurement)
+        try:
+            with ExitStack() as stack:
+                wrapper = _query_wrapper(
+                    measurement, self.capture_stacks, self.stack_min_query_ms / 1000, self.slow_request_ms / 1000
+                )
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        total = time.perf_counter() - measurement.started
+        self._report(request, response, measurement, total)
+        return response
+
+    def _report(self, request, response, measurement, total):
+        total_ms = total * 1000
+        db_ms = measurement.sql_time * 1000
+        render_ms = measurement.render_time * 1000
+        # SQL ve render dışındaki süre (view kodu, pandas, form işleme ...)
+        app_ms = max(total_ms - db_ms - render_ms, 0)
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_ms:.1f};desc="{len(measurement.queries)} queries"',
+            f"render;dur={render_ms:.1f}",
+            f"app;dur={app_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        slowest = sorted(measurement.queries, key=lambda q: q[0], reverse=True)[:self.slowest_queries]
+        match = getattr(request, "resolver_match", None)
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            # StreamingHttpResponse: gövdeyi üreten sorgular middleware döndükten sonra çalışır
+            "streaming": response.streaming,
+            "total_ms": round(total_ms, 1),
+            "db_ms": round(db_ms, 1),
+            "queries": len(measurement.queries),
+            "render_ms": round(render_ms, 1),
+            "app_ms": round(app_ms, 1),
+            "slowest_queries": [
+                {"ms": round(duration * 1000, 2), "sql": sql[:500]} for duration, sql, _ in slowest
+            ],
+        }
+        logger.info(json.dumps(record, ensure_ascii=False))
+
+        if total_ms > self.slow_request_ms:
+            record["query_log"] = [
+                {
+                    "ms": round(duration * 1000, 2),
+                    "sql": sql,
+                    "stack": _project_frames(stack) if stack else None,
+                }
+                for duration, sql, stack in measurement.queries
+            ]
+            logger.warning(json.dumps(record, ensure_ascii=False))
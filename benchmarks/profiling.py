@@ -0,0 +1,192 @@
+# profiling.py
+import cProfile
+import datetime
+import json
+import logging
+import os
+import pstats
+import re
+import secrets
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from user.permissions import request_role
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_QUERY_PARAM = "__profile"
+
+# Capture id: 20261018-142501-052317-3fa9 (mikrosaniyeli; sıralanınca kronolojik)
+CAPTURE_ID_RE = re.compile(r"^\d{8}-\d{6}-\d{6}-[0-9a-f]{4}$")
+
+# tracemalloc process geneli, cProfile da aynı anda tek profiler ister → bir seferde tek capture
+_lock = threading.Lock()
+
+
+def capture_dir():
+    return getattr(settings, "PROFILE_CAPTURE_DIR", os.path.join(settings.BASE_DIR, "profiles"))
+
+
+def profiling_requested(request):
+    """?__profile=1 ve admin rolü"""
+    return PROFILE_QUERY_PARAM in request.GET and request_role(request) == "admin"
+
+
+def _top_functions(profiler, limit):
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            "function": f"{filename}:{lineno}({name})",
+            "calls": ncalls,
+            "tottime_ms": round(tottime * 1000, 2),
+            "cumtime_ms": round(cumtime * 1000, 2),
+        })
+    rows.sort(key=lambda r: r["cumtime_ms"], reverse=True)
+    return rows[:limit]
+
+
+def _top_allocations(snapshot, limit):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def _prune(directory, keep):
+    """Ring buffer: en eski capture'lar silinir"""
+    for capture_id in [c["id"] for c in list_captures()][keep:]:
+        for ext in ("prof", "json"):
+            try:
+                os.remove(os.path.join(directory, f"{capture_id}.{ext}"))
+            except OSError:
+                pass
+
+
+@contextmanager
+def profile_capture(label, **meta):
+    """
+    Blok cProfile + tracemalloc altında çalışır; .prof dosyası ve özet (.json: en pahalı
+    fonksiyonlar, en çok ayıran satırlar) PROFILE_CAPTURE_DIR'e yazılır, en fazla
+    PROFILE_CAPTURE_LIMIT capture tutulur.
+
+    Yield edilen dict'e capture id'si yazılır; başka bir capture sürüyorsa blok
+    profilsiz çalışır ve id None kalır.
+    """
+    capture = {"id": None}
+    if not _lock.acquire(blocking=False):
+        logger.warning("Profile capture skipped (%s): another capture is running", label)
+        yield capture
+        return
+
+    try:
+        profiler = cProfile.Profile()
+        tracemalloc.start(getattr(settings, "PROFILE_TRACEMALLOC_FRAMES", 1))
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield capture
+        finally:
+            profiler.disable()
+            duration = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            capture["id"] = _save(profiler, snapshot, {
+                "label": label,
+                **meta,
+                "duration_ms": round(duration * 1000, 1),
+                "peak_memory_kb": round(peak / 1024, 1),
+            })
+    finally:
+        _lock.release()
+
+
+def _save(profiler, snapshot, summary):
+    directory = capture_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    now = datetime.datetime.now()
+    capture_id = f"{now:%Y%m%d-%H%M%S-%f}-{secrets.token_hex(2)}"
+    limit = getattr(settings, "PROFILE_TOP_ENTRIES", 30)
+
+    profiler.dump_stats(os.path.join(directory, f"{capture_id}.prof"))
+    summary = {
+        "id": capture_id,
+        "created_at": now.isoformat(timespec="seconds"),
+        **summary,
+        "top_functions": _top_functions(profiler, limit),
+        "top_allocations": _top_allocations(snapshot, limit),
+    }
+    with open(os.path.join(directory, f"{capture_id}.json"), "w") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=1)
+
+    _prune(directory, getattr(settings, "PROFILE_CAPTURE_LIMIT", 20))
+    logger.info("Profile captured: %s (%s, %.0f ms)", capture_id, summary["label"], summary["duration_ms"])
+    return capture_id
+
+
+def list_captures():
+    """Capture özetleri, en yenisi başta"""
+    directory = capture_dir()
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+
+    captures = []
+    for name in sorted(names, reverse=True):
+        capture_id, ext = os.path.splitext(name)
+        if ext != ".json" or not CAPTURE_ID_RE.match(capture_id):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                captures.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return captures
+
+
+def capture_path(capture_id, ext):
+    """Dosya yolu; geçersiz id / uzantı ya da silinmiş capture için None"""
+    if not CAPTURE_ID_RE.match(capture_id) or ext not in ("prof", "json"):
+        return None
+    path = os.path.join(capture_dir(), f"{capture_id}.{ext}")
+    return path if os.path.exists(path) else None
+
+
+class ProfileCaptureMiddleware:
+    """
+    Admin kullanıcı ?__profile=1 ile istek yaparsa view profil altında çalışır;
+    capture id'si X-Profile-Capture header'ında döner, liste: benchmarks:profiles.
+    UserRoleMiddleware'den sonra gelmeli.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not profiling_requested(request):
+            return self.get_response(request)
+
+        with profile_capture(
+            f"{request.method} {request.path}", path=request.get_full_path(), user=request.user.username
+        ) as capture:
+            response = self.get_response(request)
+        if capture["id"]:
+            response["X-Profile-Capture"] = capture["id"]
+        return response
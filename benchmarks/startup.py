@@ -0,0 +1,80 @@
+# startup.py
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+
+
+# Worker'ın ilk istekten önce yüklediği her şey: Django + tüm app'ler + URLconf (tüm view modülleri)
+STARTUP_CODE = "import django; django.setup(); import config.urls"
+
+# Sadece import / export yollarında yüklenmesi gereken kütüphaneler
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "hijridate")
+
+# STARTUP_IMPORT_BUDGET_MS verilmemişse
+DEFAULT_IMPORT_BUDGET_MS = 600
+
+
+def _parse_importtime(stderr):
+    """
+    -X importtime çıktısı → (toplam import ms, {modül: kümülatif ms}, en üst seviye importlar)
+    Satır: "import time:  self [us] | cumulative | <girinti>modül"
+    """
+    total_us = 0
+    cumulative = {}
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        total_us += int(self_us)
+        cumulative[module] = int(cumulative_us) / 1000
+        # Girinti yok → STARTUP_CODE'un doğrudan yüklediği modül
+        if name[1:2] != " ":
+            top_level.append((module, int(cumulative_us) / 1000))
+    return total_us / 1000, cumulative, top_level
+
+
+def _run_once(python, env):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", STARTUP_CODE],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, timeout=120,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup failed:\n{result.stderr[-2000:]}")
+    return wall_ms, _parse_importtime(result.stderr)
+
+
+def measure_startup(repeat=5, python=None, top=15):
+    """
+    STARTUP_CODE'u taze bir Python process'inde `-X importtime` ile repeat kez çalıştırır.
+
+    Dönüş: {"import_ms", "wall_ms" (median), "runs", "heavy_modules" (yüklenen HEAVY_MODULES
+    ve kümülatif ms), "top_imports" (en pahalı paketler, son tur)}
+    """
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings"),
+    }
+    runs = []
+    for _ in range(max(repeat, 1)):
+        wall_ms, (import_ms, cumulative, top_level) = _run_once(python or sys.executable, env)
+        runs.append({"wall_ms": round(wall_ms, 1), "import_ms": round(import_ms, 1)})
+
+    top_imports = sorted(top_level, key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "code": STARTUP_CODE,
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 1),
+        "runs": runs,
+        "heavy_modules": {
+            module: round(cumulative[module], 1) for module in HEAVY_MODULES if module in cumulative
+        },
+        "top_imports": [{"module": module, "ms": round(ms, 1)} for module, ms in top_imports],
+    }
@@ -0,0 +1,297 @@
+# suite.py
+import datetime
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from io import BytesIO
+
+import django
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from openpyxl import Workbook
+
+from benefits.importers import BENEFIT_REQUIRED_COLUMNS
+from benefits.models import Benefit, ArchivedBenefit
+from jobs.models import ImportJob
+from jobs.runner import run_job
+from workers.importers import WORKER_COLUMN_MAPPING
+from workers.models import Workers, ArchivedWorker, WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from workers.registry import lookup_registry
+from .generator import benchmark_user
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    setup(ctx) → run() döndüren fonksiyonu kaydeder. Sadece run() ölçülür;
+    her tur (setup dahil) geri alınan bir transaction içinde çalışır.
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+class Context:
+    """Benchmark'ların paylaştığı örnek veri ve oturum açmış istemci"""
+
+    def __init__(self, import_rows):
+        self.user = benchmark_user()
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.import_rows = import_rows
+
+        self.year = (
+            WorkerGrossMonthly.objects.order_by("-year").values_list("year", flat=True).first()
+            or datetime.date.today().year
+        )
+        # Tablonun ortasından, maaş kaydı olan bir worker
+        count = Workers.objects.count()
+        self.worker = Workers.objects.order_by("sicil_no")[count // 2] if count else None
+        self.sample = lookup_registry.attach(Workers.objects.order_by("sicil_no")[:import_rows])
+
+    def get(self, url, data=None):
+        response = self.client.get(url, data)
+        _check(response, url)
+
+    def post(self, url, data):
+        response = self.client.post(url, data)
+        _check(response, url)
+
+
+def _check(response, url):
+    if response.status_code >= 400:
+        raise RuntimeError(f"{url} returned HTTP {response.status_code}")
+
+
+def _xlsx(headers, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return ContentFile(buffer.getvalue(), name="benchmark.xlsx")
+
+
+def _import_job(ctx, kind, headers, rows):
+    job = ImportJob.objects.create(kind=kind, file=_xlsx(headers, rows), author=ctx.user)
+    ctx.cleanup.append(job.file.path)
+    ctx.cleanup.append(job.progress_path)
+
+    def run():
+        if run_job(job).status != ImportJob.STATUS_DONE:
+            raise RuntimeError(f"{job} failed: {job.error}")
+    return run
+
+
+def _label(obj):
+    return str(obj) if obj else None
+
+
+@benchmark("import_workers")
+def _import_workers(ctx):
+    # Yarısı mevcut worker güncellemesi, yarısı yeni worker
+    headers = list(WORKER_COLUMN_MAPPING)
+    rows = []
+    for i, worker in enumerate(ctx.sample):
+        sicil_no = worker.sicil_no if i % 2 else f"BN{i:06d}"
+        rows.append([
+            _label(worker.group), sicil_no, worker.s_no.code if worker.s_no else None,
+            _label(worker.department_short_name), _label(worker.short_class), worker.name_surname,
+            worker.date_of_recruitment.date(), _label(worker.work_class), _label(worker.class_name),
+            _label(worker.department), _label(worker.currency), worker.bonus, _label(worker.location_name),
+            # Tam sayı: parse_tr_decimal "." karakterini binlik ayırıcı sayar
+            int((worker.gross_payment or 50000) * 11 / 10), datetime.date(ctx.year, 6, 1),
+        ])
+    return _import_job(ctx, ImportJob.KIND_WORKERS, headers, rows)
+
+
+@benchmark("import_benefits")
+def _import_benefits(ctx):
+    rows = [
+        [worker.sicil_no, ctx.year, month, 1000, 500, 0, 0, 0, 0, 250, 1500, 0]
+        for worker in ctx.sample
+        for month in range(1, 13)
+    ]
+    return _import_job(ctx, ImportJob.KIND_BENEFITS, BENEFIT_REQUIRED_COLUMNS, rows)
+
+
+@benchmark("benefit_bulk")
+def _benefit_bulk(ctx):
+    # "W" grubundaki tüm worker'lar × 12 ay
+    data = {
+        "short_class_action": "W", "year": ctx.year, "months": [str(m) for m in range(1, 13)],
+        "overwrite_existing": "on", "aile_yakacak": "1.000", "yol_parasi": "2.000", "erzak": "750",
+    }
+    return lambda: ctx.post(reverse("benefits:bulk"), data)
+
+
+@benchmark("bulk_set_gross_salaries")
+def _bulk_set_gross_salaries(ctx):
+    data = {
+        "worker": ctx.worker.sicil_no, "year": ctx.year, "months": [str(m) for m in range(1, 13)],
+        "overwrite_existing": "on", "gross_salary_hourly": "321,50",
+        "currency": ctx.worker.currency_id or "",
+    }
+    return lambda: ctx.post(reverse("workers:bulk_set_gross_salaries"), data)
+
+
+@benchmark("deleteWorkers")
+def _delete_workers(ctx):
+    data = {"exit_date": f"{ctx.year}-06-30"}
+    return lambda: ctx.post(reverse("workers:deleteworkers", args=[ctx.worker.id]), data)
+
+
+@benchmark("dashboard")
+def _dashboard(ctx):
+    return lambda: ctx.get(reverse("workers:dashboard"))
+
+
+@benchmark("benefit_list")
+def _benefit_list(ctx):
+    return lambda: ctx.get(reverse("benefits:list"), {"year": ctx.year})
+
+
+@benchmark("list_worker_salaries")
+def _list_worker_salaries(ctx):
+    return lambda: ctx.get(
+        reverse("workers:list_worker_salaries", args=[ctx.worker.id]), {"year": ctx.year}
+    )
+
+
+def _measure(setup, ctx, trace_memory):
+    """Tek tur: (süre sn, sorgu sayısı, tracemalloc tepe byte | None)"""
+    with transaction.atomic():
+        run = setup(ctx)
+        if trace_memory:
+            tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+            transaction.set_rollback(True)
+    return elapsed, len(queries), peak
+
+
+def run_benchmark(name, ctx, repeat=3):
+    """
+    Önce tracemalloc açık bir tur (aynı zamanda template / registry ısınması),
+    sonra repeat tur süre ölçümü (tracemalloc süreyi bozduğu için kapalı).
+    Bellek Python tarafındaki tepe ayırmadır.
+    """
+    setup = BENCHMARKS[name]
+    ctx.cleanup = []
+    try:
+        _, _, peak = _measure(setup, ctx, trace_memory=True)
+        timings = []
+        for _ in range(repeat):
+            elapsed, query_count, _ = _measure(setup, ctx, trace_memory=False)
+            timings.append(elapsed)
+    finally:
+        for path in ctx.cleanup:
+            if os.path.exists(path):
+                os.remove(path)
+
+    return {
+        "wall_ms": [round(t * 1000, 2) for t in timings],
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "queries": query_count,
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _database_version():
+    if connection.vendor == "postgresql":
+        connection.ensure_connection()
+        return connection.pg_version
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version
+    return None
+
+
+def dataset_counts():
+    return {
+        "workers": Workers.objects.count(),
+        "salaries": WorkerGrossMonthly.objects.count(),
+        "benefits": Benefit.objects.count(),
+        "archived_workers": ArchivedWorker.objects.count(),
+        "archived_salaries": ArchivedWorkerGrossMonthly.objects.count(),
+        "archived_benefits": ArchivedBenefit.objects.count(),
+    }
+
+
+def run_suite(names=None, repeat=3, import_rows=500, log=None):
+    """
+    Dönüş: {"meta": {...}, "results": {benchmark: {...}}} — JSON olarak saklanıp
+    sürümler arasında karşılaştırılır (run_benchmarks --compare).
+    """
+    log = log or (lambda message: None)
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    # Test istemcisinin host'u (testserver) ALLOWED_HOSTS'ta olmayabilir
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        ctx = Context(import_rows)
+        if ctx.worker is None:
+            raise ValueError("No workers in the database; run generate_payroll_data first.")
+
+        results = {}
+        for name in names:
+            log(f"Running {name} ...")
+            results[name] = run_benchmark(name, ctx, repeat)
+
+    return {
+        "meta": {
+            "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "database": connection.vendor,
+            "database_version": _database_version(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "repeat": repeat,
+            "import_rows": import_rows,
+            "dataset": dataset_counts(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline):
+    """[(benchmark, mevcut median, baseline median, oran, sorgu farkı)]"""
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = result["median_ms"] / base["median_ms"] if base["median_ms"] else None
+        rows.append((name, result["median_ms"], base["median_ms"], ratio, result["queries"] - base["queries"]))
+    return rows
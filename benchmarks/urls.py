@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+
+app_name = "benchmarks"
+
+
+urlpatterns = [
+    path("profiles/", views.profile_list, name="profiles"),
+    path("profiles/<str:capture_id>.<str:ext>", views.profile_download, name="profile_download"),
+]
@@ -0,0 +1,22 @@
+from django.http import FileResponse, Http404
+from django.shortcuts import render
+
+from user.permissions import admin_only
+from .profiling import PROFILE_QUERY_PARAM, list_captures, capture_path
+
+
+@admin_only
+def profile_list(request):
+    """Kaydedilmiş profil capture'ları (benchmarks/profiling.py)"""
+    return render(request, "benchmarks/profile_list.html", {
+        "captures": list_captures(),
+        "query_param": PROFILE_QUERY_PARAM,
+    })
+
+
+@admin_only
+def profile_download(request, capture_id, ext):
+    path = capture_path(capture_id, ext)
+    if path is None:
+        raise Http404("Capture not found")
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=f"{capture_id}.{ext}")
@@ -0,0 +1,109 @@
+# bulk.py
+from decimal import Decimal
+
+from reports.summary import PayrollScope, track_payroll
+from .models import Benefit
+from .utils import parse_tr_decimal, get_bayram_months_for_year
+
+
+BENEFIT_AMOUNT_FIELDS = [
+    "aile_yakacak", "erzak", "altin",
+    "bayram", "dogum_evlenme", "fon",
+    "harcirah", "yol_parasi", "prim",
+]
+
+# Sadece belirli aylarda girilen tutarlar, diğer aylarda otomatik 0
+# (bayram ayları yıla göre değişir → get_bayram_months_for_year)
+BENEFIT_ALLOWED_MONTHS = {
+    "erzak": (3, 6, 9, 12),
+    "altin": (12,),
+    "fon": (12,),
+}
+
+BENEFIT_BATCH_SIZE = 500
+
+
+def existing_benefit_keys(worker_ids, years):
+    """
+    Var olan (worker_id, year, month) anahtarlarını tek sorguda döner.
+    worker_id = sicil_no (Benefit.worker to_field='sicil_no')
+    """
+    return set(
+        Benefit.objects
+        .filter(worker_id__in=worker_ids, year__in=years)
+        .values_list("worker_id", "year", "month")
+    )
+
+
+def upsert_benefits(rows, batch_size=BENEFIT_BATCH_SIZE):
+    """
+    ('worker', 'year', 'month') unique key üzerinden chunk'lı native upsert
+    (INSERT ... ON CONFLICT DO UPDATE). Tutarlar ve updated_at güncellenir.
+    """
+    if not rows:
+        return
+
+    with track_payroll(PayrollScope.from_rows(rows, "worker_id")):
+        Benefit.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["worker", "year", "month"],
+            update_fields=BENEFIT_AMOUNT_FIELDS + ["updated_at"],
+        )
+
+
+def benefit_amounts_for_month(values, year, month, bayram_months=None):
+    """
+    Form/sheet değerlerini ay kurallarına göre Decimal tutarlara çevirir:
+    erzak 3,6,9,12; altın ve fon 12; bayram sadece bayram aylarında.
+    """
+    if bayram_months is None:
+        bayram_months = get_bayram_months_for_year(year)
+
+    amounts = {}
+    for field in BENEFIT_AMOUNT_FIELDS:
+        if field == "bayram":
+            allowed = month in bayram_months
+        else:
+            allowed = month in BENEFIT_ALLOWED_MONTHS.get(field, (month,))
+        amounts[field] = parse_tr_decimal(values.get(field)) if allowed else Decimal("0")
+    return amounts
+
+
+def apply_benefit_bulk(sicil_nos, year, months, values, overwrite):
+    """
+    Verilen worker'lar × aylar için benefit kayıtlarını set bazlı yazar.
+    Ay bazındaki tutarlar bir kez hesaplanır, mevcut kayıtlar tek sorguda çekilir.
+
+    overwrite=True  → tek upsert (yeni + mevcut)
+    overwrite=False → sadece olmayan (worker, month) kayıtları eklenir
+
+    Dönüş: (created_count, updated_count)
+    """
+    bayram_months = get_bayram_months_for_year(year)
+    amounts_by_month = {
+        m: benefit_amounts_for_month(values, year, m, bayram_months) for m in months
+    }
+
+    # Bordro özeti: bu worker'lar × aylar (reports/summary.py)
+    with track_payroll(PayrollScope.of(sicil_nos, [(year, m) for m in months])):
+        existing = {
+            (worker_id, month)
+            for worker_id, _, month in existing_benefit_keys(sicil_nos, [year])
+        }
+
+        rows = [
+            Benefit(worker_id=sicil_no, year=year, month=m, **amounts_by_month[m])
+            for sicil_no in sicil_nos
+            for m in months
+            if overwrite or (sicil_no, m) not in existing
+        ]
+        updated_count = sum((b.worker_id, b.month) in existing for b in rows)
+
+        if overwrite:
+            upsert_benefits(rows)
+        else:
+            Benefit.objects.bulk_create(rows, batch_size=BENEFIT_BATCH_SIZE)
+
+    return len(rows) - updated_count, updated_count
@@ -6,7 +6,7 @@ from decimal import Decimal
 from django import forms
 
 from .models import Benefit
-from workers.models import Workers
+from workers.forms import WorkerChoiceField
 from .utils import parse_tr_decimal
 
 
@@ -23,18 +23,10 @@ def money_field():
         })
     )
 
-class SicilNoChoiceField(forms.ModelChoiceField):
-    """Dropdown ve search'te sadece sicil_no göster"""
-    def label_from_instance(self, obj):
-        return str(obj.sicil_no)
-
-
 class BenefitForm(forms.ModelForm):
-    worker = SicilNoChoiceField(
-        queryset=Workers.objects.only("id", "sicil_no").order_by("sicil_no"),
+    worker = WorkerChoiceField(
         required=True,
         label="Sicil No (Worker)",
-        empty_label="— Select Worker —",
     )
 
     year = forms.IntegerField(
@@ -107,12 +99,9 @@ MONTH_CHOICES = [(m, calendar.month_name[m]) for m in range(1, 13)]
 
 
 class BenefitBulkForm(forms.Form):
-    worker = forms.ModelChoiceField(
-        queryset=Workers.objects.all().order_by('sicil_no'),
-        to_field_name='sicil_no',
+    worker = WorkerChoiceField(
         required=False,   # 🔥 KRİTİK
         label='Sicil No (Worker)',
-        empty_label="— Select Worker —",
     )
 
     year = forms.IntegerField(
@@ -148,12 +137,6 @@ class BenefitBulkForm(forms.Form):
     yol_parasi   = money_field()
     prim         = money_field()
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['worker'].label_from_instance = (
-            lambda obj: (obj.sicil_no or "").strip()
-        )
-
     def clean_months(self):
         months = self.cleaned_data.get("months") or []
         if not months:
@@ -0,0 +1,81 @@
+# holidays.py
+import datetime
+
+
+RAMAZAN_BAYRAMI = "Ramazan Bayramı"
+KURBAN_BAYRAMI = "Kurban Bayramı"
+
+# (isim, hicri ay, hicri ilk gün, gün sayısı)
+# Ramazan Bayramı → Şevval 1-3, Kurban Bayramı → Zilhicce 10-13
+BAYRAMS = [
+    (RAMAZAN_BAYRAMI, 10, 1, 3),
+    (KURBAN_BAYRAMI, 12, 10, 4),
+]
+
+# hijridate (Umm al-Qura) 1343-1500 hicri yıllarını destekler → miladi 1925-2077
+MIN_YEAR, MAX_YEAR = 1925, 2077
+
+# Sunucu açılışında (config/warmup.py) önceden hesaplanan aralık; diğer yıllar ilk kullanımda
+WARM_YEARS = range(1990, MAX_YEAR + 1)
+
+
+class HolidayCalendar:
+    """
+    Miladi yıl → bayram günleri. Her yıl bir kez hesaplanır ve process içinde saklanır;
+    sonraki sorgular sözlük erişimidir.
+    """
+
+    def __init__(self):
+        self._days = {}
+        self._months = {}
+
+    def _compute(self, year):
+        from hijridate import Hijri
+
+        if not MIN_YEAR <= year <= MAX_YEAR:
+            raise ValueError(f"Holiday calendar covers {MIN_YEAR}-{MAX_YEAR}, got {year}")
+
+        approx_hijri_year = int((year - 622) * 33 / 32)
+
+        days = []
+        for hy in range(approx_hijri_year - 1, approx_hijri_year + 3):
+            for name, month, first_day, length in BAYRAMS:
+                try:
+                    g = Hijri(hy, month, first_day).to_gregorian()
+                except OverflowError:
+                    # hijridate aralığı dışında → bu yıla denk gelemez
+                    continue
+
+                start = datetime.date(g.year, g.month, g.day)
+                for offset in range(length):
+                    day = start + datetime.timedelta(days=offset)
+                    if day.year == year:
+                        days.append((day, name, offset == 0))
+
+        days.sort()
+        self._days[year] = tuple((day, name) for day, name, _ in days)
+        # Bayram tutarı bayramın başladığı AYDA girilir
+        self._months[year] = frozenset(day.month for day, _, is_first in days if is_first)
+
+    def bayram_months(self, year):
+        """Ramazan + Kurban Bayramlarının başladığı ay numaraları. Örn: {3, 6}"""
+        if year not in self._months:
+            self._compute(year)
+        return self._months[year]
+
+    def holiday_dates(self, year):
+        """Yıl içindeki tüm bayram günleri: ((date, isim), ...) tarih sırasıyla"""
+        if year not in self._days:
+            self._compute(year)
+        return self._days[year]
+
+    def is_holiday(self, day):
+        return any(d == day for d, _ in self.holiday_dates(day.year))
+
+    def warm(self, years=WARM_YEARS):
+        for year in years:
+            if year not in self._months:
+                self._compute(year)
+
+
+holiday_calendar = HolidayCalendar()
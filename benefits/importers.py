@@ -0,0 +1,133 @@
+# importers.py
+from decimal import Decimal
+
+from django.db import transaction
+
+from workers.models import Workers
+from .bulk import BENEFIT_AMOUNT_FIELDS, BENEFIT_ALLOWED_MONTHS, existing_benefit_keys, upsert_benefits
+from .models import Benefit
+from .utils import parse_tr_decimal, get_bayram_months_for_year
+
+
+BENEFIT_REQUIRED_COLUMNS = [
+    "sicil_no", "year", "month",
+    "aile_yakacak", "erzak", "altin",
+    "bayram", "dogum_evlenme", "fon",
+    "harcirah", "yol_parasi", "prim"
+]
+
+# BenefitForm ile aynı sınırlar
+MIN_YEAR, MAX_YEAR = 2000, 2100
+
+
+class BenefitImportError(Exception):
+    """Import'u hiç başlatmadan durduran sheet hataları (eksik kolon vb.)."""
+
+
+class _SkipLog:
+    """Atlanan satırları (excel satırı, sicil_no, sebep) toplar."""
+
+    def __init__(self):
+        self.rows = []
+
+    def drop(self, df, mask, reason):
+        for index, sicil_no in df.loc[mask, "sicil_no"].items():
+            self.rows.append({"row": int(index), "sicil_no": sicil_no, "reason": reason})
+        return df[~mask]
+
+
+def _month_masked(values, allowed):
+    return values.where(allowed, Decimal("0"))
+
+
+def import_benefits_frame(df):
+    """
+    Benefit excel'ini set bazlı import eder:
+    - tüm sicil_no'lar tek `__in` sorgusuyla worker'a eşlenir
+    - year/month kolon bazında normalize edilip doğrulanır
+    - (worker, year, month) üzerinden chunk'lı native upsert
+
+    Dönüş: {"rows", "inserted", "updated", "skipped", "skipped_rows"}
+    skipped_rows: [{"row", "sicil_no", "reason"}, ...]
+    """
+    import pandas as pd
+
+    missing = [c for c in BENEFIT_REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise BenefitImportError(f"Missing columns: {', '.join(missing)}")
+
+    total = len(df)
+    log = _SkipLog()
+
+    df = df.copy()
+    df["sicil_no"] = df["sicil_no"].astype(str).str.strip()
+
+    # Eşleşmeyen sicil_no → atla
+    known = set(
+        Workers.objects
+        .filter(sicil_no__in=df["sicil_no"].unique().tolist())
+        .values_list("sicil_no", flat=True)
+    )
+    df = log.drop(df, ~df["sicil_no"].isin(known), "unknown sicil_no")
+
+    # Year/month okunamazsa ya da aralık dışındaysa o satırı atla
+    year = pd.to_numeric(df["year"], errors="coerce")
+    month = pd.to_numeric(df["month"], errors="coerce")
+    unreadable = year.isna() | month.isna() | (year % 1 != 0) | (month % 1 != 0)
+    df = log.drop(df, unreadable, "year/month is not a whole number")
+    year, month = year[~unreadable], month[~unreadable]
+
+    out_of_range = ~year.between(MIN_YEAR, MAX_YEAR) | ~month.between(1, 12)
+    df = log.drop(df, out_of_range, "year/month out of range")
+    df["year"] = year[~out_of_range].astype(int)
+    df["month"] = month[~out_of_range].astype(int)
+
+    # Aynı (sicil, year, month) birden fazla satırda → son satır geçerli
+    duplicated = df.duplicated(subset=["sicil_no", "year", "month"], keep="last")
+    df = log.drop(df, duplicated, "duplicate sicil_no/year/month, a later row wins")
+
+    if df.empty:
+        return {
+            "rows": total, "inserted": 0, "updated": 0,
+            "skipped": len(log.rows), "skipped_rows": log.rows,
+        }
+
+    # Tutarlar: kolon bazında parse + ay kuralları
+    for field in BENEFIT_AMOUNT_FIELDS:
+        df[field] = df[field].map(parse_tr_decimal)
+        allowed = BENEFIT_ALLOWED_MONTHS.get(field)
+        if allowed:
+            df[field] = _month_masked(df[field], df["month"].isin(allowed))
+
+    bayram_months = {y: get_bayram_months_for_year(y) for y in df["year"].unique().tolist()}
+    in_bayram = pd.Series(
+        [m in bayram_months[y] for y, m in zip(df["year"], df["month"])],
+        index=df.index,
+    )
+    df["bayram"] = _month_masked(df["bayram"], in_bayram)
+
+    with transaction.atomic():
+        existing = existing_benefit_keys(
+            df["sicil_no"].unique().tolist(), df["year"].unique().tolist()
+        )
+
+        rows = [
+            Benefit(
+                worker_id=rec["sicil_no"],
+                year=rec["year"],
+                month=rec["month"],
+                **{field: rec[field] for field in BENEFIT_AMOUNT_FIELDS},
+            )
+            for rec in df[["sicil_no", "year", "month"] + BENEFIT_AMOUNT_FIELDS].to_dict("records")
+        ]
+        updated = sum((b.worker_id, b.year, b.month) in existing for b in rows)
+
+        upsert_benefits(rows)
+
+    return {
+        "rows": total,
+        "inserted": len(rows) - updated,
+        "updated": updated,
+        "skipped": len(log.rows),
+        "skipped_rows": log.rows,
+    }
@@ -51,6 +51,25 @@ class Benefit(models.Model):
     def __str__(self):
         return f"{self.worker.sicil_no} - {self.worker.name_surname} ({self.month}/{self.year})"
 
+    def save(self, *args, **kwargs):
+        from reports.summary import PayrollScope, track_payroll
+
+        # Özette sadece bu ay değişir; kayıt başka bir personele / aya taşınmış olabilir: eski yeri de kapsamda
+        scope = PayrollScope.of([self.worker_id], [(self.year, self.month)])
+        if self.pk:
+            old = Benefit.objects.filter(pk=self.pk).values_list("worker_id", "year", "month").first()
+            if old:
+                scope.merge(PayrollScope.of([old[0]], [old[1:]]))
+
+        with track_payroll(scope):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        from reports.summary import PayrollScope, track_payroll
+
+        with track_payroll(PayrollScope.of([self.worker_id], [(self.year, self.month)])):
+            return super().delete(*args, **kwargs)
+
     @property
     def name_surname(self):
         return self.worker.name_surname
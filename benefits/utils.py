@@ -2,6 +2,7 @@
 import math
 from decimal import Decimal, InvalidOperation
 import datetime
+from .holidays import holiday_calendar
 
 
 def parse_tr_decimal(value):
@@ -26,5 +27,102 @@ def parse_tr_decimal(value):
         return Decimal("0")
 
 
+def count_excel_rows(excel_file):
+    """
+    Aktif sheet'teki veri satırı sayısı (başlık hariç).
+    read_only modda sheet boyutundan okunur; dosya baştan sona taranmaz.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        max_row = wb.active.max_row
+    finally:
+        wb.close()
+    return max(max_row - 1, 0) if max_row else 0
+
+
+def iter_excel_batches(excel_file, batch_size=500):
+    """
+    Excel'i openpyxl read_only modunda satır satır okur ve batch_size satırlık
+    DataFrame'ler üretir. Bellekte en fazla bir batch tutulur.
+
+    Kolon isimleri ilk satırdan alınır (pd.read_excel ile aynı; boş başlık → "Unnamed: n"),
+    tamamen boş satırlar atlanır. DataFrame index'i excel satır numarasıdır.
+    """
+    # pandas / openpyxl yüklemesi ~300 ms: sadece excel okunurken (bkz. benchmarks/startup.py)
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        columns = [
+            str(c) if c is not None else f"Unnamed: {i}"
+            for i, c in enumerate(header)
+        ]
+
+        # DataFrame index = excel satır numarası (hata raporlarında kullanılır)
+        batch, index = [], []
+        for row_number, row in enumerate(rows, start=2):
+            if all(v is None for v in row):
+                continue
+            # Sondaki boş hücreler yazılmamış olabilir (boyut bilgisi olmayan dosyalar) → None ile tamamlanır
+            batch.append(row[:len(columns)] + (None,) * (len(columns) - len(row)))
+            index.append(row_number)
+            if len(batch) >= batch_size:
+                yield pd.DataFrame(batch, columns=columns, index=index, dtype=object)
+                batch, index = [], []
+
+        if batch:
+            yield pd.DataFrame(batch, columns=columns, index=index, dtype=object)
+    finally:
+        wb.close()
+
+
 def is_after_exit(year: int, month: int, exit_date: datetime.date) -> bool:
-    return (year, month) > (exit_date.year, exit_date.month)
\ No newline at end of file
+    return (year, month) > (exit_date.year, exit_date.month)
+
+
+def get_bayram_months_for_year(year: int):
+    """
+    Verilen miladi yıl için Ramazan + Kurban Bayramlarının
+    denk geldiği AY numaralarını döner.
+
+    Örn: {3, 5}
+    Önceden hesaplanmış takvimden okunur (benefits.holidays).
+    """
+    return holiday_calendar.bayram_months(year)
+
+def parse_bayram_by_year(value, year, month):
+    """
+    Bayram sadece Ramazan/Kurban bayramının olduğu AYDA girilir.
+    Diğer aylarda otomatik 0.
+    """
+    bayram_months = get_bayram_months_for_year(year)
+    if month in bayram_months:
+        return parse_tr_decimal(value)
+    return Decimal("0")
+
+
+def parse_erzak_by_month(value, month):
+    """
+    Erzak sadece 3,6,9,12 aylarda girilir
+    Diğer aylarda otomatik 0 basılır
+    """
+    if month in (3, 6, 9, 12):
+        return parse_tr_decimal(value)
+    return Decimal("0")
+
+def parse_value_by_allowed_months(value, month, allowed_months):
+    """
+    Değer sadece allowed_months içindeyse alınır,
+    aksi halde otomatik 0 basılır
+    """
+    if month in allowed_months:
+        return parse_tr_decimal(value)
+    return Decimal("0")
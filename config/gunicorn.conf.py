@@ -0,0 +1,48 @@
+# config/gunicorn.conf.py
+# gunicorn -c config/gunicorn.conf.py config.wsgi
+#
+# Ayarlar ortam değişkenleriyle değiştirilebilir:
+#   GUNICORN_BIND, GUNICORN_WORKERS, GUNICORN_MAX_WORKERS, GUNICORN_THREADS, GUNICORN_TIMEOUT,
+#   GUNICORN_MAX_REQUESTS
+import gc
+import os
+
+
+def _default_workers():
+    """
+    2 × CPU + 1, GUNICORN_MAX_WORKERS ile sınırlı. Container'da cpu_count() host'un
+    çekirdeklerini verir; sched_getaffinity cpuset'e uyar ama CPU kotasını (--cpus) görmez.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    return min(cpus * 2 + 1, int(os.environ.get("GUNICORN_MAX_WORKERS", 8)))
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 0)) or _default_workers()
+# gthread: worker başına thread havuzu (streaming export'lar bir thread'i tutar, worker'ı değil)
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+
+# Bellek sızıntılarına karşı worker'lar bu kadar istekten sonra yenilenir (jitter: hepsi aynı anda değil)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+# Django master process'te yüklenir; worker'lar fork ile kopyalar
+preload_app = True
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    """Fork'tan önce: cache'leri doldur, DB bağlantılarını kapat, nesneleri GC'den ayır"""
+    from django.db import connections
+    from config.warmup import warm_up
+
+    warm_up()
+    # Master'ın açtığı bağlantı worker'lar arasında paylaşılmasın
+    connections.close_all()
+    # Isınmış nesneler GC taramasında dokunulup kopyalanmasın (copy-on-write korunur)
+    gc.freeze()
@@ -0,0 +1,28 @@
+# config/health.py
+import logging
+
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+@never_cache
+def live(request):
+    """Liveness: process istek alabiliyor (DB'ye bakılmaz)"""
+    return JsonResponse({"status": "ok"})
+
+
+@never_cache
+def ready(request):
+    """Readiness: DB'ye tek SELECT 1; ulaşılamazsa 503"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except DatabaseError:
+        # Hata detayı (host, kullanıcı adı ...) yanıta değil loga
+        logger.exception("Readiness check failed: database unavailable")
+        return JsonResponse({"status": "unavailable"}, status=503)
+    return JsonResponse({"status": "ok"})
@@ -38,19 +38,29 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'workers',
     'user',
     'crispy_forms',
     'crispy_bootstrap4',
     'benefits',
+    'jobs',
+    'reports',
+    'api',
+    'benchmarks',
 ]
 
 MIDDLEWARE = [
+    # En dışta: session / auth sorguları da ölçülür (INSTRUMENTATION_SAMPLE_RATE = 0 iken kapalı)
+    'benchmarks.middleware.RequestInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'user.middleware.UserRoleMiddleware',
+    # Admin ?__profile=1 → cProfile + tracemalloc capture (rol gerektiği için UserRoleMiddleware'den sonra)
+    'benchmarks.profiling.ProfileCaptureMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -91,6 +101,27 @@ DATABASES = {
 }
 
 
+# Cache: gunicorn worker'ları ve run_import_jobs ayrı process'ler; lookup (workers/registry.py) ve
+# rol (user/permissions.py) versiyonlarının hepsine ulaşması için REDIS_URL ile paylaşımlı Redis (compose).
+# REDIS_URL yoksa (runserver, tek process) locmem: diğer process'ler değişikliği
+# LOOKUP_CACHE_TIMEOUT / ROLE_CACHE_TIMEOUT sonunda görür.
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ["REDIS_URL"],
+            # Redis'e ulaşılamazsa istek beklemesin (versiyon okumaları hatada DB'ye döner)
+            'OPTIONS': {'socket_connect_timeout': 0.5, 'socket_timeout': 0.5},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -137,6 +168,69 @@ STATICFILES_DIRS = [
 
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+# Uploaded files (import jobs)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+
+# Import job'ları excel'i openpyxl read_only ile batch batch okur (False → pd.read_excel)
+IMPORT_STREAMING_READER = True
+
+# Bu kadar saniyedir RUNNING olan job, worker çökmüş sayılıp run_import_jobs açılışında FAILED yapılır
+IMPORT_JOB_STALE_SECONDS = 3 * 60 * 60
+
+# Dashboard sayfa boyutu (?per_page= ile değiştirilebilir, en fazla DASHBOARD_MAX_PAGE_SIZE)
+DASHBOARD_PAGE_SIZE = 5
+DASHBOARD_MAX_PAGE_SIZE = 500
+
+# Lookup tabloları (workers/registry.py) process içinde en fazla bu kadar saniye tutulur;
+# signal'lar versiyonu cache'te artırarak geçersiz kılar; cache paylaşımsızsa (locmem) ya da
+# ulaşılamıyorsa süre diğer process'ler için üst sınır
+LOOKUP_CACHE_TIMEOUT = 300
+
+# Registry versiyonu cache'ten en fazla bu aralıkla okunur (diğer process'lerdeki değişiklik gecikmesi)
+LOOKUP_VERSION_CHECK_SECONDS = 1
+
+# Kullanıcı rolü session'da en fazla bu kadar saniye tutulur; rol değişiklikleri
+# (user/views.py) cache'teki versiyonla geçersiz kılar; cache paylaşımsızsa (locmem) süre
+# diğer process'ler için üst sınır, cache'e ulaşılamazsa rol her istekte DB'den okunur
+ROLE_CACHE_TIMEOUT = 60
+
+# Maliyet raporu (reports/payroll.py) sorgularının süre sınırı
+REPORT_QUERY_TIMEOUT_MS = 5000
+
+# İstek ölçümü (benchmarks/middleware.py): isteklerin bu oranı ölçülür (0 → kapalı, 1 → hepsi).
+# Ölçülen istekler Server-Timing header'ı ve "benchmarks.middleware" log satırı alır;
+# INSTRUMENTATION_SLOW_REQUEST_MS'i aşanlar tüm sorgularıyla WARNING olarak loglanır; çağıran kod
+# (stack) INSTRUMENTATION_STACK_MIN_QUERY_MS'ten yavaş sorgular ve bütçe aşıldıktan sonrakiler için alınır.
+INSTRUMENTATION_SAMPLE_RATE = float(os.environ.get("INSTRUMENTATION_SAMPLE_RATE", "0"))
+INSTRUMENTATION_SLOW_REQUEST_MS = 1000
+INSTRUMENTATION_SLOWEST_QUERIES = 3
+INSTRUMENTATION_CAPTURE_STACKS = True
+INSTRUMENTATION_STACK_MIN_QUERY_MS = 20
+
+# Profil capture'ları (benchmarks/profiling.py): admin ?__profile=1 ile istek ya da import job'u
+# profillenir; .prof + özet bu klasörde tutulur, en eskiler silinerek en fazla PROFILE_CAPTURE_LIMIT
+PROFILE_CAPTURE_DIR = os.path.join(BASE_DIR, "profiles")
+PROFILE_CAPTURE_LIMIT = 20
+PROFILE_TOP_ENTRIES = 30
+
+# Açılış import süresi sınırı (manage.py startup_benchmark, Django + URLconf; ölçüldüğünde ~400 ms).
+# pandas / openpyxl / hijridate açılışta yüklenirse sınırdan bağımsız olarak hata verir.
+STARTUP_IMPORT_BUDGET_MS = 600
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "benchmarks.middleware": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        "config.warmup": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        "config.health": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+    },
+}
+
 CRISPY_ALLOWED_TEMPLATE_PACKS = ["bootstrap4"]
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
@@ -15,18 +15,29 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
+from . import health
 from workers.views import index, manage_lookups, delete_lookup, update_lookup
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('health/live/', health.live, name="health_live"),
+    path('health/ready/', health.ready, name="health_ready"),
     path('', index, name="index"),
     path('workers/', include("workers.urls")),
     path('user/', include("user.urls")),
     path('benefits/', include('benefits.urls')),
+    path('jobs/', include('jobs.urls')),
+    path('reports/', include('reports.urls')),
+    path('api/', include('api.urls')),
+    path('benchmarks/', include('benchmarks.urls')),
     path("lookups/", manage_lookups, name="manage_lookups"),
     path("lookups/delete/<str:model_name>/<int:pk>/", delete_lookup, name="delete_lookup"),
     path("lookups/<str:model_name>/<int:pk>/update/", update_lookup, name="update_lookup"),
 
 ]
+
+# gunicorn statik dosya sunmaz; DEBUG açıkken runserver'daki gibi Django sunar (DEBUG kapalıysa boş)
+urlpatterns += staticfiles_urlpatterns()
@@ -0,0 +1,67 @@
+# config/warmup.py
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.template.loader import get_template
+from django.urls import get_resolver
+
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_lookups():
+    from workers.registry import LOOKUP_MODELS, lookup_registry
+    for model in LOOKUP_MODELS:
+        lookup_registry.all(model)
+
+
+def _warm_holidays():
+    from benefits.holidays import holiday_calendar
+    holiday_calendar.warm()
+
+
+def _warm_templates():
+    """Proje template'leri derlenip cached loader'a alınır"""
+    for template_dir in settings.TEMPLATES[0]["DIRS"]:
+        template_dir = os.path.join(settings.BASE_DIR, template_dir)
+        for root, _, files in os.walk(template_dir):
+            for name in files:
+                if name.endswith(".html"):
+                    get_template(os.path.relpath(os.path.join(root, name), template_dir))
+
+
+def _warm_urls():
+    get_resolver().reverse_dict
+
+
+WARMUPS = [
+    ("urls", _warm_urls),
+    ("lookups", _warm_lookups),
+    ("holidays", _warm_holidays),
+    ("templates", _warm_templates),
+]
+
+
+def warm_up():
+    """
+    Process açılışında ilk isteklerin ödeyeceği yüklemeleri önceden yapar.
+    gunicorn preload ile fork'tan önce çalışır (config/gunicorn.conf.py), böylece
+    worker'lar bu belleği copy-on-write paylaşır. Hata olursa (ör. DB henüz hazır
+    değil) loglanır, ilgili cache ilk istekte dolar.
+
+    Dönüş: {isim: süre ms | None (hata)}
+    """
+    timings = {}
+    for name, warm in WARMUPS:
+        start = time.perf_counter()
+        try:
+            warm()
+        except Exception:
+            logger.exception("Warmup step %r failed", name)
+            timings[name] = None
+            continue
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Warmup done: %s", timings)
+    return timings
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import ImportJob
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = ["id", "kind", "status", "rows_total", "rows_processed", "rows_failed", "author", "created_at"]
+    list_filter = ["kind", "status"]
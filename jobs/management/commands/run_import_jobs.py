@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.runner import claim_next_job, fail_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Kuyruktaki import job'larını çalıştırır (harici broker gerekmez)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Kuyruk boşalınca çık (cron / test için).",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=2.0,
+            help="Kuyruk boşken bekleme süresi (saniye).",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Import worker started.")
+
+        stale = fail_stale_jobs()
+        if stale:
+            self.stdout.write(self.style.WARNING(f"{stale} stale running job(s) marked as failed."))
+
+        while True:
+            close_old_connections()
+            job = claim_next_job()
+
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            self.stdout.write(f"Running {job} ...")
+            job = run_job(job)
+
+            if job.status == job.STATUS_DONE:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{job}: {job.rows_processed} rows, {job.rows_failed} failed."
+                ))
+            else:
+                self.stdout.write(self.style.ERROR(f"{job}: {job.error}"))
@@ -0,0 +1,72 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+class ImportJob(models.Model):
+    KIND_WORKERS = "workers"
+    KIND_BENEFITS = "benefits"
+    KIND_CHOICES = [
+        (KIND_WORKERS, "Workers"),
+        (KIND_BENEFITS, "Benefits"),
+    ]
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    file = models.FileField(upload_to="import_jobs/%Y/%m/")
+    author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+
+    rows_total = models.PositiveIntegerField(default=0)
+    rows_processed = models.PositiveIntegerField(default=0)
+    rows_failed = models.PositiveIntegerField(default=0)
+    result = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    # Admin ?__profile=1 ile yüklediyse worker job'u profil altında çalıştırır (benchmarks/profiling.py)
+    profile = models.BooleanField(default=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "import_jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} import #{self.pk} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
+
+    @property
+    def progress_path(self):
+        # Çalışan job'un canlı sayaçları (transaction commit olmadan okunabilsin diye dosyada)
+        return f"{self.file.path}.progress.json"
+
+    def eta_seconds(self, rows_processed=None, now=None):
+        """
+        Şu ana kadarki hıza göre kalan süre (saniye).
+        Job başlamadıysa ya da henüz satır işlenmediyse None.
+        """
+        rows_processed = self.rows_processed if rows_processed is None else rows_processed
+        if self.is_finished:
+            return 0
+        if not self.started_at or not rows_processed or not self.rows_total:
+            return None
+
+        now = now or timezone.now()
+        elapsed = (now - self.started_at).total_seconds()
+        remaining = max(self.rows_total - rows_processed, 0)
+        return round(elapsed / rows_processed * remaining, 1)
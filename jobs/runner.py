@@ -0,0 +1,193 @@
+# runner.py
+import datetime
+import json
+import logging
+import os
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from benchmarks.profiling import profile_capture
+from benefits.importers import import_benefits_frame
+from benefits.utils import count_excel_rows, iter_excel_batches
+from workers.importers import import_workers_frame
+from .models import ImportJob
+
+
+logger = logging.getLogger(__name__)
+
+# Progress bu kadar satırda bir güncellenir
+JOB_BATCH_SIZE = 500
+
+# Job sonucunda saklanan en fazla atlanan satır detayı
+MAX_REPORTED_SKIPS = 1000
+
+
+def enqueue_import(kind, uploaded_file, author, profile=False):
+    """Yüklenen dosyayı saklar ve job'u kuyruğa ekler; import'u çalıştırmaz."""
+    return ImportJob.objects.create(kind=kind, file=uploaded_file, author=author, profile=profile)
+
+
+def claim_next_job():
+    """
+    Sıradaki job'u koşullu UPDATE ile RUNNING'e çeker.
+    Aynı anda birden fazla worker çalışsa da bir job yalnızca bir kez alınır.
+    """
+    queued = (
+        ImportJob.objects
+        .filter(status=ImportJob.STATUS_QUEUED)
+        .order_by("created_at")
+        .values_list("id", flat=True)[:10]
+    )
+    for job_id in queued:
+        claimed = ImportJob.objects.filter(
+            pk=job_id, status=ImportJob.STATUS_QUEUED
+        ).update(status=ImportJob.STATUS_RUNNING, started_at=timezone.now())
+        if claimed:
+            return ImportJob.objects.get(pk=job_id)
+    return None
+
+
+def fail_stale_jobs(max_age=None):
+    """
+    Worker çöktüğü / öldürüldüğü için RUNNING'de kalan job'ları (started_at
+    IMPORT_JOB_STALE_SECONDS'tan eski) FAILED yapar. Job tek transaction olduğu
+    için yarım yazılmış satır kalmaz. Dönüş: FAILED yapılan job sayısı.
+    """
+    if max_age is None:
+        max_age = getattr(settings, "IMPORT_JOB_STALE_SECONDS", 3 * 60 * 60)
+    now = timezone.now()
+    stale = list(
+        ImportJob.objects.filter(
+            status=ImportJob.STATUS_RUNNING,
+            started_at__lt=now - datetime.timedelta(seconds=max_age),
+        )
+    )
+    for job in stale:
+        updated = ImportJob.objects.filter(pk=job.pk, status=ImportJob.STATUS_RUNNING).update(
+            status=ImportJob.STATUS_FAILED,
+            error="The import worker stopped while running this job. Please upload the file again.",
+            finished_at=now,
+        )
+        if updated:
+            _remove_files(job)
+    return len(stale)
+
+
+def load_batches(path, batch_size=JOB_BATCH_SIZE, streaming=None):
+    """
+    Dönüş: (toplam satır, DataFrame batch iterator)
+
+    streaming=True (varsayılan, IMPORT_STREAMING_READER) → openpyxl read_only ile
+    satır satır okunur, bellek batch boyutuyla sınırlıdır.
+    streaming=False → eski davranış, tüm sheet pd.read_excel ile yüklenir.
+    """
+    if streaming is None:
+        streaming = getattr(settings, "IMPORT_STREAMING_READER", True)
+
+    if streaming:
+        return count_excel_rows(path), iter_excel_batches(path, batch_size)
+
+    import pandas as pd
+
+    df = pd.read_excel(path)
+    df.index = df.index + 2  # excel satır numarası (başlık 1. satır)
+    batches = (df.iloc[i:i + batch_size] for i in range(0, len(df), batch_size))
+    return len(df), batches
+
+
+def _import_batch(job, df):
+    if job.kind == ImportJob.KIND_WORKERS and job.author_id is None:
+        # Workers.author zorunlu; yükleyen kullanıcı silinmişse sabit bir kullanıcıya yazılmaz
+        raise ValueError("The user who uploaded this file no longer exists. Please upload it again.")
+    if job.kind == ImportJob.KIND_WORKERS:
+        return import_workers_frame(df, author_id=job.author_id)
+    if job.kind == ImportJob.KIND_BENEFITS:
+        return import_benefits_frame(df)
+    raise ValueError(f"Unknown import kind: {job.kind}")
+
+
+def read_progress(job):
+    """
+    Dönüş: (rows_processed, rows_failed)
+    Çalışan job'un sayaçları henüz commit edilmediği için progress dosyasından okunur.
+    """
+    if job.status == ImportJob.STATUS_RUNNING:
+        try:
+            with open(job.progress_path) as f:
+                data = json.load(f)
+            return data["rows_processed"], data["rows_failed"]
+        except (OSError, ValueError, KeyError):
+            pass
+    return job.rows_processed, job.rows_failed
+
+
+def _write_progress(job, rows_processed, rows_failed):
+    tmp_path = f"{job.progress_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"rows_processed": rows_processed, "rows_failed": rows_failed}, f)
+    os.replace(tmp_path, job.progress_path)
+
+
+def run_job(job):
+    """
+    Job'u tek transaction içinde batch batch çalıştırır.
+    Hata olursa hiçbir satır yazılmaz, job FAILED olur.
+    job.profile ise çalışma profillenir (benchmarks:profiles sayfasında listelenir).
+    """
+    if job.profile:
+        author = job.author.username if job.author else None
+        with profile_capture(f"{job.get_kind_display()} import #{job.pk}", user=author):
+            return _run_job(job)
+    return _run_job(job)
+
+
+def _run_job(job):
+    rows_processed = 0
+    rows_failed = 0
+    totals = {}
+
+    try:
+        rows_total, batches = load_batches(job.file.path)
+        job.rows_total = rows_total
+        job.save(update_fields=["rows_total"])
+
+        with transaction.atomic():
+            for df in batches:
+                result = _import_batch(job, df)
+                for key, value in result.items():
+                    if isinstance(value, list):
+                        reported = totals.setdefault(key, [])
+                        reported.extend(value[:MAX_REPORTED_SKIPS - len(reported)])
+                    else:
+                        totals[key] = totals.get(key, 0) + value
+
+                rows_processed += len(df)
+                rows_failed += result.get("skipped", 0)
+                _write_progress(job, rows_processed, rows_failed)
+
+        job.status = ImportJob.STATUS_DONE
+        job.result = totals
+
+    except Exception as e:
+        logger.exception("Import job #%s failed", job.pk)
+        job.status = ImportJob.STATUS_FAILED
+        job.error = str(e)
+
+    job.rows_processed = rows_processed
+    job.rows_failed = rows_failed
+    job.finished_at = timezone.now()
+    job.save()
+
+    _remove_files(job)
+    return job
+
+
+def _remove_files(job):
+    """Biten job'un progress dosyası ve yüklenen excel (adı kayıtta kalır)"""
+    for path in (job.progress_path, job.file.path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+
+app_name = "jobs"
+
+
+urlpatterns = [
+    path("<int:job_id>/", views.job_detail, name="detail"),
+    path("<int:job_id>/status/", views.job_status, name="status"),
+]
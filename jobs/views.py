@@ -0,0 +1,47 @@
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from user.permissions import request_role
+from .models import ImportJob
+from .runner import read_progress
+
+
+def job_status_data(job):
+    rows_processed, rows_failed = read_progress(job)
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "rows_total": job.rows_total,
+        "rows_processed": rows_processed,
+        "rows_failed": rows_failed,
+        "eta_seconds": job.eta_seconds(rows_processed),
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at.isoformat(),
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def _can_view(request, job):
+    # Sonuç ve atlanan satırlar sadece yükleyen kullanıcıya ve admin'e açık
+    return job.author_id == request.user.id or request_role(request) == "admin"
+
+
+@login_required(login_url="user:login")
+def job_detail(request, job_id):
+    job = get_object_or_404(ImportJob, id=job_id)
+    if not _can_view(request, job):
+        return render(request, "403.html", status=403)
+    return render(request, "jobs/job_detail.html", {
+        "job": job,
+        "status": job_status_data(job),
+    })
+
+
+@login_required(login_url="user:login")
+def job_status(request, job_id):
+    job = get_object_or_404(ImportJob, id=job_id)
+    if not _can_view(request, job):
+        return JsonResponse({"error": "Forbidden"}, status=403)
+    return JsonResponse(job_status_data(job))
@@ -0,0 +1,152 @@
+# exports.py
+import csv
+import tempfile
+
+from benefits.models import Benefit, ArchivedBenefit
+from workers.lookups import CostCenter, Currency, Department, DirectorName, Group
+from workers.models import WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from workers.registry import lookup_registry
+
+from .payroll import BENEFIT_FIELDS
+
+
+# Sunucu tarafı cursor'dan her seferde çekilen satır
+EXPORT_CHUNK_SIZE = 2000
+
+# XLSX dosyası response'a bu boyutta parçalarla yazılır
+EXPORT_FILE_CHUNK = 64 * 1024
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class ExportError(Exception):
+    """Geçersiz dataset / filtre (view 400 döner)"""
+
+
+def _salary_columns(relation):
+    return [
+        ("sicil_no", f"{relation}__sicil_no", None),
+        ("name_surname", f"{relation}__name_surname", None),
+        ("year", "year", None),
+        ("month", "month", None),
+        ("cost_center", "s_no_id", CostCenter),
+        ("department", "department_id", Department),
+        ("directorship", "department_short_name_id", DirectorName),
+        ("group", "group_id", Group),
+        ("currency", "currency_id", Currency),
+        ("gross_salary_hourly", "gross_salary_hourly", None),
+        ("gross_payment", "gross_payment", None),
+        ("bonus", "bonus", None),
+    ]
+
+
+def _benefit_columns(relation, sicil_field):
+    return [
+        ("sicil_no", sicil_field, None),
+        ("name_surname", f"{relation}__name_surname", None),
+        ("year", "year", None),
+        ("month", "month", None),
+        ("cost_center", f"{relation}__s_no_id", CostCenter),
+        *((name, name, None) for name in BENEFIT_FIELDS),
+    ]
+
+
+# dataset → (model, kolonlar [(başlık, values_list alanı, lookup model)], cost center alanı, sıralama)
+# Sıralama unique (personel, yıl, ay) indeksini izler; ek sort gerekmez.
+EXPORT_DATASETS = {
+    "salaries": (
+        WorkerGrossMonthly, _salary_columns("worker"), "s_no_id",
+        ["worker_id", "year", "month"],
+    ),
+    "benefits": (
+        Benefit, _benefit_columns("worker", "worker_id"), "worker__s_no_id",
+        ["worker_id", "year", "month"],
+    ),
+    "archived_salaries": (
+        ArchivedWorkerGrossMonthly, _salary_columns("archived_worker"), "s_no_id",
+        ["archived_worker_id", "year", "month"],
+    ),
+    "archived_benefits": (
+        ArchivedBenefit, _benefit_columns("archived_worker", "sicil_no"), "archived_worker__s_no_id",
+        ["archived_worker_id", "year", "month"],
+    ),
+}
+
+
+def export_rows(dataset, year=None, month=None, cost_center=None):
+    """
+    (başlıklar, satır generator'ı). Satırlar values_list + iterator(chunk_size) ile
+    okunur (Postgres'te server-side cursor); lookup id'leri registry'den yazıya çevrilir.
+
+    cost_center: CostCenter kodu
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise ExportError(f"Unknown dataset: {dataset}. Choose one of: {', '.join(EXPORT_DATASETS)}")
+    model, columns, cost_center_field, ordering = EXPORT_DATASETS[dataset]
+
+    queryset = model.objects.all()
+    if year:
+        queryset = queryset.filter(year=year)
+    if month:
+        queryset = queryset.filter(month=month)
+    if cost_center:
+        cost_center_id = lookup_registry.id_map(CostCenter).get(cost_center)
+        if cost_center_id is None:
+            raise ExportError(f"Unknown cost center: {cost_center}")
+        queryset = queryset.filter(**{cost_center_field: cost_center_id})
+
+    # id → yazı haritaları export başına bir kez (satır başına registry erişimi yok)
+    labels = [
+        (i, {obj.pk: str(obj) for obj in lookup_registry.all(lookup)})
+        for i, (_, _, lookup) in enumerate(columns) if lookup
+    ]
+
+    def _rows():
+        for row in (
+            queryset
+            .order_by(*ordering)
+            .values_list(*(field for _, field, _ in columns))
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        ):
+            if labels:
+                row = list(row)
+                for i, names in labels:
+                    row[i] = names.get(row[i])
+            yield row
+
+    return [header for header, _, _ in columns], _rows()
+
+
+class _Echo:
+    """csv.writer için yazılanı geri döndüren sahte dosya"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(headers, rows):
+    writer = csv.writer(_Echo())
+    # Excel'in UTF-8 olarak açması için BOM
+    yield "\ufeff" + writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_xlsx(headers, rows, title):
+    """
+    write_only workbook satırları hücre nesnesi tutmadan geçici dosyaya yazar;
+    tamamlanan .xlsx diskten parça parça okunur (RSS satır sayısından bağımsız).
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=title[:31])
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
+
+    with tempfile.TemporaryFile() as f:
+        wb.save(f)
+        f.seek(0)
+        while chunk := f.read(EXPORT_FILE_CHUNK):
+            yield chunk
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.summary import rebuild_summary, verify_summary
+
+
+class Command(BaseCommand):
+    help = "Aylık bordro özet tablosunu ham maaş / yan hak tablolarından yeniden kurar."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Yeniden kurmadan sadece özet tabloyu ham tablolarla karşılaştır.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            count = rebuild_summary()
+            self.stdout.write(f"Payroll summary rebuilt: {count} rows.")
+
+        mismatches = verify_summary()
+        if mismatches:
+            for key, diff in mismatches[:20]:
+                self.stdout.write(self.style.ERROR(f"{key}: {diff}"))
+            raise CommandError(f"Payroll summary is out of sync: {len(mismatches)} keys differ.")
+
+        self.stdout.write(self.style.SUCCESS("Payroll summary matches the source tables."))
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField()),
+                ('month', models.PositiveIntegerField()),
+                ('s_no_id', models.PositiveIntegerField(default=0, verbose_name='CostCenter')),
+                ('department_id', models.PositiveIntegerField(default=0, verbose_name='Department')),
+                ('department_short_name_id', models.PositiveIntegerField(default=0, verbose_name='Directorships')),
+                ('group_id', models.PositiveIntegerField(default=0, verbose_name='Group')),
+                ('currency_id', models.PositiveIntegerField(default=0, verbose_name='Currency')),
+                ('headcount', models.IntegerField(default=0)),
+                ('gross_total', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Gross Payment')),
+                ('bonus_total', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Bonus')),
+                ('aile_yakacak', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Family')),
+                ('erzak', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Provision')),
+                ('altin', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Gold')),
+                ('bayram', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Holiday')),
+                ('dogum_evlenme', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Birth & Marriage')),
+                ('fon', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Funding')),
+                ('harcirah', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Subsistence')),
+                ('yol_parasi', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Fare')),
+                ('prim', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Premium')),
+            ],
+            options={
+                'db_table': 'payroll_monthly_summary',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='payrollsummary',
+            constraint=models.UniqueConstraint(fields=('year', 'month', 's_no_id', 'department_id', 'department_short_name_id', 'group_id', 'currency_id'), name='payroll_summary_key'),
+        ),
+    ]
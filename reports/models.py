@@ -0,0 +1,51 @@
+from django.db import models
+
+
+def _amount(verbose_name):
+    return models.DecimalField(max_digits=18, decimal_places=2, default=0, verbose_name=verbose_name)
+
+
+class PayrollSummary(models.Model):
+    """
+    Aylık bordro özeti: (yıl, ay, cost center, departman, direktörlük, grup, para birimi)
+    başına toplamlar. Yazma yolları reports/summary.py track_payroll() ile delta uygular,
+    `manage.py rebuild_payroll_summary` baştan kurar ve doğrular.
+
+    Boyut kolonları lookup id'leridir, 0 = atanmamış (unique anahtarda NULL olmasın diye).
+    """
+    year = models.PositiveIntegerField()
+    month = models.PositiveIntegerField()
+    s_no_id = models.PositiveIntegerField(default=0, verbose_name="CostCenter")
+    department_id = models.PositiveIntegerField(default=0, verbose_name="Department")
+    department_short_name_id = models.PositiveIntegerField(default=0, verbose_name="Directorships")
+    group_id = models.PositiveIntegerField(default=0, verbose_name="Group")
+    currency_id = models.PositiveIntegerField(default=0, verbose_name="Currency")
+
+    headcount = models.IntegerField(default=0)
+    gross_total = _amount("Gross Payment")
+    bonus_total = _amount("Bonus")
+
+    aile_yakacak = _amount("Family")
+    erzak = _amount("Provision")
+    altin = _amount("Gold")
+    bayram = _amount("Holiday")
+    dogum_evlenme = _amount("Birth & Marriage")
+    fon = _amount("Funding")
+    harcirah = _amount("Subsistence")
+    yol_parasi = _amount("Fare")
+    prim = _amount("Premium")
+
+    class Meta:
+        db_table = "payroll_monthly_summary"
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "year", "month", "s_no_id", "department_id",
+                    "department_short_name_id", "group_id", "currency_id",
+                ],
+                name="payroll_summary_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.month}/{self.year} – {self.headcount} workers"
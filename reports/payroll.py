@@ -0,0 +1,258 @@
+# payroll.py
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, FilteredRelation, Q, Sum, Value
+from django.db.models.functions import Coalesce, Round
+
+from benefits.models import Benefit, ArchivedBenefit
+from workers.lookups import CostCenter, Currency, Department, DirectorName, Group
+from workers.models import WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from workers.registry import lookup_registry
+
+from .models import PayrollSummary
+
+
+# ?by=… → WorkerGrossMonthly üzerindeki org alanı
+REPORT_DIMENSIONS = {
+    "s_no": CostCenter,
+    "department": Department,
+    "department_short_name": DirectorName,
+    "group": Group,
+}
+
+BENEFIT_FIELDS = [
+    "aile_yakacak", "erzak", "altin", "bayram", "dogum_evlenme",
+    "fon", "harcirah", "yol_parasi", "prim",
+]
+
+# aggregate_facts() her anahtar için bu toplamları döner
+FACT_VALUES = ["headcount", "gross_total", "bonus_total", *BENEFIT_FIELDS]
+
+REPORT_COLUMNS = [
+    "year", "month", "dimension_id", "dimension", "currency",
+    "headcount", "gross_payment", "bonus", "benefits", "total",
+]
+
+MONEY = DecimalField(max_digits=20, decimal_places=2)
+ZERO = Value(Decimal("0"), output_field=MONEY)
+
+# Maaş tabloları: (model, personel ilişkisi)
+SALARY_SOURCES = [
+    (WorkerGrossMonthly, "worker"),
+    (ArchivedWorkerGrossMonthly, "archived_worker"),
+]
+
+# Yan hak tabloları: (model, personel ilişkisi, personelin aylık maaş ilişkisi)
+BENEFIT_SOURCES = [
+    (Benefit, "worker", "monthly_gross_salaries"),
+    (ArchivedBenefit, "archived_worker", "archived_monthly_salaries"),
+]
+
+
+class ReportTimeout(Exception):
+    pass
+
+
+@contextmanager
+def query_budget(timeout_ms=None):
+    """
+    Rapor sorgularına süre sınırı: Postgres'te SET LOCAL statement_timeout,
+    SQLite'ta progress handler ile sorgu kesilir. Aşılırsa ReportTimeout.
+    """
+    if timeout_ms is None:
+        timeout_ms = getattr(settings, "REPORT_QUERY_TIMEOUT_MS", 5000)
+    deadline = time.monotonic() + timeout_ms / 1000
+
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", [int(timeout_ms)])
+        elif connection.vendor == "sqlite":
+            connection.ensure_connection()
+            connection.connection.set_progress_handler(lambda: time.monotonic() > deadline, 10000)
+
+        try:
+            yield
+        except OperationalError as e:
+            # QueryCanceled (Postgres) / "interrupted" (SQLite) → OperationalError
+            if time.monotonic() > deadline or "statement timeout" in str(e):
+                raise ReportTimeout(f"Report exceeded the {timeout_ms} ms time budget.") from e
+            raise
+        finally:
+            if connection.vendor == "sqlite" and connection.connection is not None:
+                connection.connection.set_progress_handler(None, 0)
+
+
+def period_filter(year=None, month=None):
+    """aggregate_facts() için filtre: sadece yıl / ay"""
+    def _filter(relation):
+        q = Q()
+        if year:
+            q &= Q(year=year)
+        if month:
+            q &= Q(month=month)
+        return q
+    return _filter
+
+
+def _bonus_amount():
+    # bonus yüzde (0-100) olarak tutulur; tutar = gross_payment * bonus / 100, kuruşa yuvarlanır
+    # (özet tablo kuruş tutar: satır bazında yuvarlanmazsa delta toplamı ile rebuild farklı yuvarlanır)
+    return Coalesce(
+        Sum(Round(
+            ExpressionWrapper(F("gross_payment") * F("bonus") / Value(100), output_field=MONEY), 2,
+            output_field=MONEY,
+        )),
+        ZERO,
+    )
+
+
+def _salary_rows(model, relation, dimensions, filters):
+    return (
+        model.objects
+        .filter(filters(relation))
+        .values("year", "month", *(f"{d}_id" for d in dimensions), "currency_id")
+        .annotate(
+            headcount=Count(f"{relation}_id", distinct=True),
+            gross_total=Coalesce(Sum("gross_payment"), ZERO),
+            bonus_total=_bonus_amount(),
+        )
+        .order_by()
+    )
+
+
+def _benefit_rows(model, relation, monthly_relation, dimensions, filters):
+    """
+    Yan haklar o ayın maaş kaydındaki org / para birimine yazılır (LEFT JOIN);
+    maaş kaydı yoksa personelin güncel değerleri kullanılır.
+    """
+    monthly = f"{relation}__{monthly_relation}"
+    snapshot = FilteredRelation(
+        monthly,
+        condition=Q(**{f"{monthly}__year": F("year"), f"{monthly}__month": F("month")}),
+    )
+
+    def _snapshot(field):
+        return Coalesce(F(f"snapshot__{field}"), F(f"{relation}__{field}"))
+
+    keys = {f"key_{d}": _snapshot(f"{d}_id") for d in dimensions}
+    keys["key_currency"] = _snapshot("currency_id")
+
+    return (
+        model.objects
+        .filter(filters(relation))
+        .annotate(snapshot=snapshot)
+        .annotate(**keys)
+        .values("year", "month", *keys)
+        .annotate(**{f"{name}_total": Coalesce(Sum(name), ZERO) for name in BENEFIT_FIELDS})
+        .order_by()
+    )
+
+
+def empty_values():
+    return {name: (0 if name == "headcount" else Decimal("0")) for name in FACT_VALUES}
+
+
+def aggregate_facts(dimensions, filters):
+    """
+    Ham tablolardan (aktif + arşiv maaş ve yan hak) GROUP BY ile toplamlar.
+    filters(relation) → Q; relation "worker" / "archived_worker" (personel ilişkisi).
+
+    Dönüş: {(year, month, *dimension_ids, currency_id): {FACT_VALUES…}}
+    """
+    totals = {}
+
+    def _values(key):
+        if key not in totals:
+            totals[key] = empty_values()
+        return totals[key]
+
+    for model, relation in SALARY_SOURCES:
+        for rec in _salary_rows(model, relation, dimensions, filters):
+            key = (rec["year"], rec["month"], *(rec[f"{d}_id"] for d in dimensions), rec["currency_id"])
+            values = _values(key)
+            values["headcount"] += rec["headcount"]
+            values["gross_total"] += rec["gross_total"]
+            values["bonus_total"] += rec["bonus_total"]
+
+    for model, relation, monthly_relation in BENEFIT_SOURCES:
+        for rec in _benefit_rows(model, relation, monthly_relation, dimensions, filters):
+            key = (rec["year"], rec["month"], *(rec[f"key_{d}"] for d in dimensions), rec["key_currency"])
+            values = _values(key)
+            for name in BENEFIT_FIELDS:
+                values[name] += rec[f"{name}_total"]
+
+    return totals
+
+
+def _report_row(row_year, row_month, dimension, dimension_id, currency_id, values):
+    label = lookup_registry.get(REPORT_DIMENSIONS[dimension], dimension_id)
+    currency = lookup_registry.get(Currency, currency_id)
+    benefits = sum((values[name] for name in BENEFIT_FIELDS), Decimal("0"))
+    return {
+        "year": row_year,
+        "month": row_month,
+        "dimension_id": dimension_id or None,
+        "dimension": str(label) if label else None,
+        "currency": currency.code if currency else None,
+        "headcount": values["headcount"],
+        "gross_payment": values["gross_total"],
+        "bonus": values["bonus_total"],
+        "benefits": benefits,
+        "total": values["gross_total"] + values["bonus_total"] + benefits,
+    }
+
+
+def _sorted(rows):
+    rows.sort(key=lambda r: (r["year"], r["month"], r["dimension"] or "", r["currency"] or ""))
+    return rows
+
+
+def payroll_report_from_facts(year, month=None, dimension="s_no", timeout_ms=None):
+    """payroll_report() ile aynı çıktı, özet tablo yerine ham tablolardan"""
+    if dimension not in REPORT_DIMENSIONS:
+        raise ValueError(f"Unknown report dimension: {dimension}")
+
+    with query_budget(timeout_ms):
+        totals = aggregate_facts([dimension], period_filter(year, month))
+
+    return _sorted([
+        _report_row(row_year, row_month, dimension, dimension_id, currency_id, values)
+        for (row_year, row_month, dimension_id, currency_id), values in totals.items()
+    ])
+
+
+def payroll_report(year, month=None, dimension="s_no", timeout_ms=None):
+    """
+    year/month × dimension × para birimi bazında maliyet (aktif + arşiv),
+    aylık özet tablodan (reports/summary.py) tek GROUP BY sorgusuyla.
+
+    Dönüş: [{"year", "month", "dimension_id", "dimension", "currency",
+             "headcount", "gross_payment", "bonus", "benefits", "total"}, ...]
+    """
+    if dimension not in REPORT_DIMENSIONS:
+        raise ValueError(f"Unknown report dimension: {dimension}")
+
+    queryset = PayrollSummary.objects.filter(year=year)
+    if month:
+        queryset = queryset.filter(month=month)
+
+    with query_budget(timeout_ms):
+        records = list(
+            queryset
+            .values("year", "month", f"{dimension}_id", "currency_id")
+            .annotate(**{f"{name}_sum": Sum(name) for name in FACT_VALUES})
+            .order_by()
+        )
+
+    return _sorted([
+        _report_row(
+            rec["year"], rec["month"], dimension, rec[f"{dimension}_id"], rec["currency_id"],
+            {name: rec[f"{name}_sum"] for name in FACT_VALUES},
+        )
+        for rec in records
+    ])
@@ -0,0 +1,255 @@
+# summary.py
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete
+
+from workers.lookups import Currency
+
+from .models import PayrollSummary
+from .payroll import FACT_VALUES, REPORT_DIMENSIONS, aggregate_facts, empty_values
+
+
+SUMMARY_DIMENSIONS = ["s_no", "department", "department_short_name", "group"]
+
+SUMMARY_KEY = ["year", "month", *(f"{d}_id" for d in SUMMARY_DIMENSIONS), "currency_id"]
+
+SUMMARY_BATCH_SIZE = 500
+
+_local = threading.local()
+
+
+class PayrollScope:
+    """
+    Özetine dokunulan personel + ay kümesi: {sicil_no: None (tüm aylar) | {(year, month), ...}}
+    """
+
+    def __init__(self, units=None):
+        self.units = units or {}
+
+    @classmethod
+    def of(cls, sicil_nos, periods=None):
+        periods = None if periods is None else set(periods)
+        return cls({sicil_no: periods for sicil_no in sicil_nos if sicil_no})
+
+    @classmethod
+    def from_rows(cls, rows, sicil_field):
+        """Model objelerinden (sicil, year, month) kapsamı"""
+        units = defaultdict(set)
+        for row in rows:
+            units[getattr(row, sicil_field)].add((row.year, row.month))
+        return cls(dict(units))
+
+    def __bool__(self):
+        return bool(self.units)
+
+    def minus(self, other):
+        """self içinde olup other'da olmayan kısım"""
+        units = {}
+        for sicil_no, periods in self.units.items():
+            if sicil_no not in other.units:
+                units[sicil_no] = periods
+                continue
+            covered = other.units[sicil_no]
+            if covered is None:
+                continue
+            if periods is None:
+                # "tüm aylar" kısmen kapsanmışsa farkı ay bazında ifade edemeyiz
+                raise ValueError("Cannot widen a payroll scope after it has been snapshotted.")
+            remaining = periods - covered
+            if remaining:
+                units[sicil_no] = remaining
+        return PayrollScope(units)
+
+    def merge(self, other):
+        for sicil_no, periods in other.units.items():
+            if periods is None or self.units.get(sicil_no, set()) is None:
+                self.units[sicil_no] = None
+            else:
+                self.units[sicil_no] = self.units.get(sicil_no, set()) | periods
+
+    def filters(self, relation):
+        """aggregate_facts() filtresi: aynı ay kümesine sahip siciller tek IN'de"""
+        lookup = f"{relation}__sicil_no__in"
+        groups = defaultdict(list)
+        for sicil_no, periods in self.units.items():
+            groups[None if periods is None else frozenset(periods)].append(sicil_no)
+
+        q = Q(pk__in=[])
+        for periods, sicil_nos in groups.items():
+            part = Q(**{lookup: sicil_nos})
+            if periods is not None:
+                by_year = defaultdict(list)
+                for year, month in periods:
+                    by_year[year].append(month)
+                period_q = Q(pk__in=[])
+                for year, months in by_year.items():
+                    period_q |= Q(year=year, month__in=months)
+                part &= period_q
+            q |= part
+        return q
+
+
+def _summary_key(key):
+    # NULL boyutlar özet tabloda 0
+    return tuple(value or 0 for value in key)
+
+
+def _facts(scope=None, filters=None):
+    totals = aggregate_facts(SUMMARY_DIMENSIONS, filters or scope.filters)
+    merged = {}
+    for key, values in totals.items():
+        key = _summary_key(key)
+        if key in merged:
+            for name in FACT_VALUES:
+                merged[key][name] += values[name]
+        else:
+            merged[key] = values
+    return merged
+
+
+def _apply_deltas(deltas):
+    """
+    Delta'ları özet satırlarına ekler: INSERT ... ON CONFLICT DO UPDATE SET col = col + excluded.col
+    (Postgres ve SQLite 3.24+). Tamamen sıfırlanan satırlar silinir.
+    """
+    rows = [
+        (*key, *(values[name] for name in FACT_VALUES))
+        for key, values in deltas.items()
+        if any(values[name] for name in FACT_VALUES)
+    ]
+    if not rows:
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(PayrollSummary._meta.db_table)
+    columns = SUMMARY_KEY + FACT_VALUES
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    updates = ", ".join(f"{qn(c)} = {table}.{qn(c)} + excluded.{qn(c)}" for c in FACT_VALUES)
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), SUMMARY_BATCH_SIZE):
+            batch = rows[start:start + SUMMARY_BATCH_SIZE]
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(qn(c) for c in columns)}) "
+                f"VALUES {', '.join([placeholders] * len(batch))} "
+                f"ON CONFLICT ({', '.join(qn(c) for c in SUMMARY_KEY)}) DO UPDATE SET {updates}",
+                [value for row in batch for value in row],
+            )
+
+    PayrollSummary.objects.filter(**{name: 0 for name in FACT_VALUES}).delete()
+
+
+class _Tracker:
+    def __init__(self):
+        self.scope = PayrollScope()
+        self.before = defaultdict(empty_values)
+
+    def extend(self, scope):
+        # Önceki snapshot'ta olmayan kısmın "önceki" değerleri yazmadan önce alınır
+        new = scope.minus(self.scope)
+        if not new:
+            return
+        for key, values in _facts(new).items():
+            for name in FACT_VALUES:
+                self.before[key][name] += values[name]
+        self.scope.merge(new)
+
+    def apply(self):
+        if not self.scope:
+            return
+        after = _facts(self.scope)
+        deltas = defaultdict(empty_values)
+        for key in set(after) | set(self.before):
+            for name in FACT_VALUES:
+                deltas[key][name] = after.get(key, empty_values())[name] - self.before[key][name]
+        _apply_deltas(deltas)
+
+
+@contextmanager
+def track_payroll(scope):
+    """
+    Bordro verisine yazan her yol bununla sarılır: kapsamdaki personelin özete katkısı
+    yazmadan önce ve sonra toplanır, fark özet tabloya eklenir.
+
+    İç içe kullanımda (Workers.save → upsert_monthly_salaries gibi) sadece en dıştaki
+    farkı uygular; iç kapsamlar dıştakine eklenir. Aynı transaction içinde çalışır,
+    rollback'te özet de geri alınır.
+    """
+    tracker = getattr(_local, "tracker", None)
+
+    with transaction.atomic():
+        if tracker is not None:
+            tracker.extend(scope)
+            yield
+            return
+
+        tracker = _local.tracker = _Tracker()
+        try:
+            tracker.extend(scope)
+            yield
+            tracker.apply()
+        finally:
+            _local.tracker = None
+
+
+def rebuild_summary():
+    """Özet tabloyu ham tablolardan baştan kurar, yazılan satır sayısını döner"""
+    with transaction.atomic():
+        PayrollSummary.objects.all().delete()
+        totals = _facts(filters=lambda relation: Q())
+        PayrollSummary.objects.bulk_create(
+            [
+                PayrollSummary(**dict(zip(SUMMARY_KEY, key)), **values)
+                for key, values in totals.items()
+                if any(values[name] for name in FACT_VALUES)
+            ],
+            batch_size=SUMMARY_BATCH_SIZE,
+        )
+    return PayrollSummary.objects.count()
+
+
+def verify_summary():
+    """
+    Özet tabloyu ham tablolarla karşılaştırır.
+    Dönüş: farklı anahtarlar [(key, {alan: (özet, ham)})]
+    """
+    expected = {
+        key: values for key, values in _facts(filters=lambda relation: Q()).items()
+        if any(values[name] for name in FACT_VALUES)
+    }
+    actual = {
+        tuple(row[c] for c in SUMMARY_KEY): {name: row[name] for name in FACT_VALUES}
+        for row in PayrollSummary.objects.values(*SUMMARY_KEY, *FACT_VALUES)
+    }
+
+    cent = Decimal("0.01")
+    mismatches = []
+    for key in sorted(set(expected) | set(actual)):
+        have = actual.get(key, empty_values())
+        want = expected.get(key, empty_values())
+        diff = {
+            name: (have[name], want[name])
+            for name in FACT_VALUES
+            if Decimal(have[name]).quantize(cent) != Decimal(want[name]).quantize(cent)
+        }
+        if diff:
+            mismatches.append((key, diff))
+    return mismatches
+
+
+def _rebuild_after_lookup_delete(sender, **kwargs):
+    # Lookup silinince ham tablolardaki FK'lar SET_NULL olur, özet anahtarları eskir
+    transaction.on_commit(rebuild_summary)
+
+
+def connect_signals():
+    for model in [*REPORT_DIMENSIONS.values(), Currency]:
+        post_delete.connect(
+            _rebuild_after_lookup_delete, sender=model,
+            dispatch_uid=f"payroll-summary-delete-{model.__name__}",
+        )
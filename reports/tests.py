@@ -0,0 +1,288 @@
+import datetime
+import json
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openpyxl import Workbook
+
+from benchmarks.generator import benchmark_user, generate_payroll_data
+from benefits.importers import BENEFIT_REQUIRED_COLUMNS
+from benefits.models import Benefit
+from jobs.models import ImportJob
+from jobs.runner import run_job
+from workers.archive import archive_workers, offboard_excel
+from workers.importers import WORKER_COLUMN_MAPPING
+from workers.lookups import ExitReason
+from workers.models import Workers, WorkerGrossMonthly
+from workers.registry import lookup_registry
+from .summary import rebuild_summary, verify_summary
+
+
+YEAR = 2025
+
+
+def _xlsx(headers, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def _label(obj):
+    return str(obj) if obj else None
+
+
+class PayrollSummaryWritePathTests(TestCase):
+    """Her yazma yolundan sonra payroll_monthly_summary ham tablolarla aynı kalmalı"""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_payroll_data(workers=12, years=2, archived=2, end_year=YEAR, seed=1)
+        cls.user = benchmark_user()
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        lookup_registry.invalidate()
+        self.client.force_login(self.user)
+        self.worker = Workers.objects.order_by("sicil_no").first()
+        self.assertEqual(verify_summary(), [])
+
+    def assertSummaryMatches(self):
+        self.assertEqual(verify_summary(), [])
+
+    def _worker_form_data(self, worker, **overrides):
+        data = {
+            "group": worker.group_id, "sicil_no": worker.sicil_no, "s_no": worker.s_no_id,
+            "department_short_name": worker.department_short_name_id, "department": worker.department_id,
+            "short_class": worker.short_class_id, "name_surname": worker.name_surname,
+            "date_of_recruitment": worker.date_of_recruitment.strftime("%Y-%m-%d"),
+            "work_class": worker.work_class_id, "location_name": worker.location_name_id,
+            "class_name": worker.class_name_id, "gross_payment": "90.000", "currency": worker.currency_id,
+            "bonus": worker.bonus, "total_work_hours": "225", "update_date_user": f"{YEAR}-03-01",
+        }
+        data.update(overrides)
+        return data
+
+    # --- workers views ---
+
+    def test_add_worker(self):
+        data = self._worker_form_data(self.worker, sicil_no="T000001")
+        response = self.client.post(reverse("workers:addworkers"), data)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Workers.objects.filter(sicil_no="T000001").exists())
+        self.assertSummaryMatches()
+
+    def test_update_worker(self):
+        data = self._worker_form_data(self.worker)
+        response = self.client.post(reverse("workers:updateworkers", args=[self.worker.id]), data)
+        self.assertEqual(response.status_code, 302)
+        self.assertSummaryMatches()
+
+    def test_worker_org_change_moves_benefits_without_salary(self):
+        # Maaş kaydı olmayan aydaki yan hak personelin güncel org alanlarıyla özetlenir
+        WorkerGrossMonthly.objects.filter(worker=self.worker, year=YEAR, month=7).delete()
+        rebuild_summary()
+
+        other = Workers.objects.exclude(department=self.worker.department).exclude(department=None).first()
+        self.worker.department = other.department
+        self.worker.update_date_user = None
+        self.worker.save()
+        self.assertSummaryMatches()
+
+    def test_delete_worker_archives(self):
+        response = self.client.post(
+            reverse("workers:deleteworkers", args=[self.worker.id]), {"exit_date": f"{YEAR}-06-30"}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Workers.objects.filter(pk=self.worker.pk).exists())
+        self.assertSummaryMatches()
+
+    def test_delete_archive_exempt_worker(self):
+        # 'P' ile başlayan sicil arşivlenmeden, maaş ve yan haklarıyla silinir
+        Workers.objects.filter(pk=self.worker.pk).update(sicil_no="P000001")
+        WorkerGrossMonthly.objects.filter(worker=self.worker).update(sicil_no="P000001")
+        Benefit.objects.filter(worker_id=self.worker.sicil_no).update(worker_id="P000001")
+        rebuild_summary()
+
+        response = self.client.post(reverse("workers:deleteworkers", args=[self.worker.id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Workers.objects.filter(pk=self.worker.pk).exists())
+        self.assertFalse(Benefit.objects.filter(worker_id="P000001").exists())
+        self.assertSummaryMatches()
+
+    def test_bulk_set_gross_salaries(self):
+        response = self.client.post(reverse("workers:bulk_set_gross_salaries"), {
+            "worker": self.worker.sicil_no, "year": YEAR, "months": [str(m) for m in range(1, 13)],
+            "overwrite_existing": "on", "gross_salary_hourly": "321,50", "currency": self.worker.currency_id,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertSummaryMatches()
+
+    def test_update_and_delete_salary_record(self):
+        salary = WorkerGrossMonthly.objects.filter(worker=self.worker, year=YEAR, month=3).get()
+        response = self.client.post(reverse("workers:update_salary_record", args=[salary.id]), {
+            "year": YEAR, "month": 3, "gross_salary_hourly": "512,75", "bonus": 0,
+            "group": salary.group_id, "short_class": salary.short_class_id, "class_name": salary.class_name_id,
+            "department": salary.department_id, "work_class": salary.work_class_id,
+            "location_name": salary.location_name_id, "department_short_name": salary.department_short_name_id,
+            "s_no": salary.s_no_id,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertSummaryMatches()
+
+        response = self.client.post(reverse("workers:delete_salary_record", args=[salary.id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(WorkerGrossMonthly.objects.filter(pk=salary.pk).exists())
+        self.assertSummaryMatches()
+
+    def test_salary_record_moved_to_another_worker(self):
+        other = Workers.objects.order_by("sicil_no").last()
+        salary = WorkerGrossMonthly.objects.filter(worker=self.worker, year=YEAR, month=5).get()
+        WorkerGrossMonthly.objects.filter(worker=other, year=YEAR - 1, month=2).delete()
+        rebuild_summary()
+
+        salary.worker, salary.year, salary.month = other, YEAR - 1, 2
+        salary.save()
+        self.assertSummaryMatches()
+
+    def test_benefit_moved_to_another_worker(self):
+        other = Workers.objects.order_by("sicil_no").last()
+        benefit = Benefit.objects.filter(worker_id=self.worker.sicil_no, year=YEAR, month=5).get()
+        Benefit.objects.filter(worker_id=other.sicil_no, year=YEAR - 1, month=2).delete()
+        rebuild_summary()
+
+        benefit.worker, benefit.year, benefit.month = other, YEAR - 1, 2
+        benefit.save()
+        self.assertSummaryMatches()
+
+    # --- benefits views ---
+
+    def test_benefit_create_update_delete(self):
+        Benefit.objects.filter(worker_id=self.worker.sicil_no, year=YEAR, month=4).delete()
+        rebuild_summary()
+
+        amounts = {
+            "aile_yakacak": "1.000", "erzak": "0", "altin": "0", "bayram": "0", "dogum_evlenme": "0",
+            "fon": "0", "harcirah": "250", "yol_parasi": "2.000", "prim": "0",
+        }
+        data = {"worker": self.worker.sicil_no, "year": YEAR, "month": 4, **amounts}
+        self.assertEqual(self.client.post(reverse("benefits:create"), data).status_code, 302)
+        self.assertSummaryMatches()
+
+        benefit = Benefit.objects.get(worker_id=self.worker.sicil_no, year=YEAR, month=4)
+        data["prim"] = "5.000"
+        self.assertEqual(self.client.post(reverse("benefits:update", args=[benefit.pk]), data).status_code, 302)
+        self.assertSummaryMatches()
+
+        self.assertEqual(self.client.post(reverse("benefits:delete", args=[benefit.pk])).status_code, 302)
+        self.assertSummaryMatches()
+
+    def test_benefit_bulk(self):
+        response = self.client.post(reverse("benefits:bulk"), {
+            "short_class_action": "W", "year": YEAR, "months": [str(m) for m in range(1, 13)],
+            "overwrite_existing": "on", "aile_yakacak": "1.000", "yol_parasi": "2.000", "erzak": "750",
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertSummaryMatches()
+
+    # --- import jobs ---
+
+    def _run_import(self, kind, headers, rows):
+        job = ImportJob.objects.create(
+            kind=kind, author=self.user,
+            file=ContentFile(_xlsx(headers, rows).getvalue(), name="import.xlsx"),
+        )
+        job = run_job(job)
+        self.assertEqual(job.status, ImportJob.STATUS_DONE, job.error)
+        return job
+
+    def test_import_workers_job(self):
+        workers = lookup_registry.attach(Workers.objects.order_by("sicil_no")[:4])
+        rows = []
+        for i, worker in enumerate(workers):
+            # Yarısı mevcut worker güncellemesi, yarısı yeni worker
+            rows.append([
+                _label(worker.group), worker.sicil_no if i % 2 else f"N{i:06d}",
+                worker.s_no.code if worker.s_no else None, _label(worker.department_short_name),
+                _label(worker.short_class), worker.name_surname, worker.date_of_recruitment.date(),
+                _label(worker.work_class), _label(worker.class_name), _label(worker.department),
+                _label(worker.currency), worker.bonus, _label(worker.location_name),
+                60000 + i * 1000, datetime.date(YEAR, 6, 1),
+            ])
+        self._run_import(ImportJob.KIND_WORKERS, list(WORKER_COLUMN_MAPPING), rows)
+        self.assertSummaryMatches()
+
+    def test_import_benefits_job(self):
+        rows = [
+            [worker.sicil_no, YEAR, month, 1000, 500, 0, 0, 0, 0, 250, 1500, 0]
+            for worker in Workers.objects.order_by("sicil_no")[:4]
+            for month in range(1, 13)
+        ]
+        self._run_import(ImportJob.KIND_BENEFITS, BENEFIT_REQUIRED_COLUMNS, rows)
+        self.assertSummaryMatches()
+
+    # --- archive ---
+
+    def test_archive_workers(self):
+        workers = list(Workers.objects.order_by("sicil_no")[:3])
+        reason = ExitReason.objects.first()
+        archive_workers([(worker, datetime.date(YEAR, 5, 28), reason.pk) for worker in workers])
+        self.assertSummaryMatches()
+
+    def test_offboard_excel(self):
+        workers = list(Workers.objects.order_by("-sicil_no")[:2])
+        sheet = _xlsx(
+            ["Sicil No", "Exit Date", "Exit Reason"],
+            [[worker.sicil_no, f"{YEAR}-08-31", None] for worker in workers],
+        )
+        result = offboard_excel(sheet)
+        self.assertEqual(result["archived"], 2)
+        self.assertSummaryMatches()
+
+    # --- API ---
+
+    def _post_json(self, name, records):
+        response = self.client.post(
+            reverse(name), json.dumps({"records": records}), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_api_bulk_salaries(self):
+        result = self._post_json("api:bulk_salaries", [
+            {"sicil_no": self.worker.sicil_no, "year": YEAR, "month": month, "gross_salary_hourly": 400.5}
+            for month in range(1, 13)
+        ])
+        self.assertEqual(result["skipped"], 0)
+        self.assertSummaryMatches()
+
+    def test_api_bulk_benefits(self):
+        result = self._post_json("api:bulk_benefits", [
+            {"sicil_no": self.worker.sicil_no, "year": YEAR, "month": month, "yol_parasi": 1750.25, "prim": "2.500"}
+            for month in range(1, 13)
+        ])
+        self.assertEqual(result["skipped"], 0)
+        self.assertSummaryMatches()
+
+    def test_api_rejects_non_finite_amounts(self):
+        body = '{"records": [{"sicil_no": "%s", "year": %d, "month": 1, "yol_parasi": NaN}]}' % (
+            self.worker.sicil_no, YEAR
+        )
+        response = self.client.post(reverse("api:bulk_benefits"), body, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["skipped"], 1)
+        self.assertSummaryMatches()
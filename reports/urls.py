@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+
+app_name = "reports"
+
+
+urlpatterns = [
+    path("payroll/", views.payroll_report, name="payroll"),
+    path("exports/<str:dataset>/", views.export_data, name="export"),
+]
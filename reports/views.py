@@ -0,0 +1,102 @@
+import datetime
+from io import BytesIO
+
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+
+from .exports import XLSX_CONTENT_TYPE, ExportError, export_rows, stream_csv, stream_xlsx
+from .payroll import (
+    REPORT_COLUMNS, REPORT_DIMENSIONS, ReportTimeout,
+    payroll_report as build_payroll_report, payroll_report_from_facts,
+)
+
+
+def _int_param(request, name, default=None):
+    try:
+        return int(request.GET.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _payroll_sheet(rows, dimension, year):
+    """Rapor satırları → .xlsx (write_only: satırlar bellekte hücre nesnesi tutmaz)"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=f"{dimension} {year}")
+    ws.append([dimension if col == "dimension" else col for col in REPORT_COLUMNS])
+    for row in rows:
+        ws.append([row[col] for col in REPORT_COLUMNS])
+
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+@login_required(login_url="user:login")
+def payroll_report(request):
+    """
+    Maliyet raporu: ?year=2025&month=3&by=s_no|department|department_short_name|group
+    ?format=xlsx → indirilebilir sheet, aksi halde JSON
+    ?source=facts → özet tablo yerine ham tablolardan (kontrol için)
+    """
+    year = _int_param(request, "year", datetime.date.today().year)
+    month = _int_param(request, "month")
+    dimension = request.GET.get("by", "s_no")
+
+    if dimension not in REPORT_DIMENSIONS:
+        return JsonResponse(
+            {"error": f"'by' must be one of: {', '.join(REPORT_DIMENSIONS)}"}, status=400
+        )
+
+    try:
+        build = payroll_report_from_facts if request.GET.get("source") == "facts" else build_payroll_report
+        rows = build(year, month=month, dimension=dimension)
+    except ReportTimeout as e:
+        return JsonResponse({"error": str(e)}, status=504)
+
+    if request.GET.get("format") == "xlsx":
+        suffix = f"{year}-{month:02d}" if month else str(year)
+        response = HttpResponse(
+            _payroll_sheet(rows, dimension, year),
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+        response["Content-Disposition"] = f'attachment; filename="payroll_{dimension}_{suffix}.xlsx"'
+        return response
+
+    return JsonResponse({
+        "year": year,
+        "month": month,
+        "by": dimension,
+        "rows": rows,
+    })
+
+
+@login_required(login_url="user:login")
+def export_data(request, dataset):
+    """
+    salaries / benefits / archived_salaries / archived_benefits dışa aktarımı:
+    ?year=2025&month=3&cost_center=<kod>&format=csv|xlsx (varsayılan csv)
+    Satırlar DB'den okundukça response'a akar; tüm geçmiş bellekte toplanmaz.
+    """
+    year = _int_param(request, "year")
+    month = _int_param(request, "month")
+    fmt = request.GET.get("format", "csv")
+
+    if fmt not in ("csv", "xlsx"):
+        return JsonResponse({"error": "'format' must be csv or xlsx"}, status=400)
+
+    try:
+        headers, rows = export_rows(
+            dataset, year=year, month=month, cost_center=request.GET.get("cost_center") or None
+        )
+    except ExportError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    filename = "_".join(str(part) for part in [dataset, year, month and f"{month:02d}"] if part)
+    if fmt == "xlsx":
+        response = StreamingHttpResponse(stream_xlsx(headers, rows, dataset), content_type=XLSX_CONTENT_TYPE)
+    else:
+        response = StreamingHttpResponse(stream_csv(headers, rows), content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return response
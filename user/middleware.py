@@ -0,0 +1,17 @@
+# user/middleware.py
+from .permissions import request_role
+
+
+class UserRoleMiddleware:
+    """
+    Rolü istek başına bir kez request.user_role'e yazar (session'dan, gerekirse
+    tek UserRole sorgusu). Decorator'lar ve template'ler bunu kullanır.
+    AuthenticationMiddleware'den sonra gelmeli.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_role(request)
+        return self.get_response(request)
@@ -1,20 +1,101 @@
 # user/permissions.py
+import logging
+import time
 from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import redirect, render
 
+
+logger = logging.getLogger(__name__)
+
+ROLE_SESSION_KEY = "_user_role"
+
+
 def get_user_role(user):
     if user.is_superuser:
         return "admin"
     return getattr(getattr(user, "role_info", None), "role", None)
 
 
+def _role_version_key(user_id):
+    return f"user-role:{user_id}"
+
+
+def _role_version(user_id):
+    """Cache'e ulaşılamazsa None: session'daki role güvenilmez"""
+    try:
+        return cache.get(_role_version_key(user_id), 0)
+    except Exception:
+        logger.warning("Role version unavailable, reading role from the database", exc_info=True)
+        return None
+
+
+def invalidate_user_role(user):
+    """
+    Rol değişince çağrılır: kullanıcının versiyonu artar, session'daki rol
+    bir sonraki istekte yeniden okunur. Cache paylaşımsızsa (locmem) ya da
+    ulaşılamıyorsa ROLE_CACHE_TIMEOUT diğer process'ler için üst sınırdır.
+    """
+    key = _role_version_key(getattr(user, "pk", user))
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+    except Exception:
+        logger.warning("Role version not bumped for %s", key, exc_info=True)
+
+
+def _resolve_role(request):
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    if user.is_superuser:
+        return "admin"
+
+    session = getattr(request, "session", None)
+    if session is None:
+        return get_user_role(user)
+
+    version = _role_version(user.pk)
+    if version is None:
+        return get_user_role(user)
+
+    cached = session.get(ROLE_SESSION_KEY)
+    if (
+        cached
+        and cached.get("user_id") == user.pk
+        and cached.get("version") == version
+        and cached.get("expires", 0) > time.time()
+    ):
+        return cached.get("role")
+
+    role = get_user_role(user)
+    session[ROLE_SESSION_KEY] = {
+        "user_id": user.pk,
+        "role": role,
+        "version": version,
+        "expires": time.time() + getattr(settings, "ROLE_CACHE_TIMEOUT", 60),
+    }
+    return role
+
+
+def request_role(request):
+    """İstek başına bir kez çözülür (UserRoleMiddleware request.user_role'ü doldurur)"""
+    if not hasattr(request, "user_role"):
+        request.user_role = _resolve_role(request)
+    return request.user_role
+
+
 def admin_only(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         if not request.user.is_authenticated:
             return redirect("user:login")
 
-        if get_user_role(request.user) == "admin":
+        if request_role(request) == "admin":
             return view_func(request, *args, **kwargs)
 
         return render(request, "403.html", status=403)
@@ -27,7 +108,7 @@ def write_access_required(view_func):
         if not request.user.is_authenticated:
             return redirect("user:login")
 
-        role = get_user_role(request.user)
+        role = request_role(request)
 
         # ❗ Viewer kesinlikle geçemez
         if role in ("admin", "editor"):
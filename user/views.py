@@ -7,7 +7,7 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 from .models import UserRole
 from functools import wraps
-from .permissions import admin_only, get_user_role
+from .permissions import admin_only, get_user_role, invalidate_user_role, request_role
 
 
 def register(request):
@@ -69,11 +69,12 @@ def update_user_role(request, user_id):
         
         if role in dict(UserRole.ROLE_CHOICES):
             # Admin rolü sadece admin tarafından atanabilir (zaten @admin_only var ama açıklık için)
-            if role == 'admin' and get_user_role(request.user) != 'admin':
+            if role == 'admin' and request_role(request) != 'admin':
                 messages.warning(request, "Only admins can assign admin role.")
                 return redirect('user:user_permission_dashboard')
             
             UserRole.objects.update_or_create(user=user, defaults={'role': role})
+            invalidate_user_role(user)
             messages.success(request, f"Role updated successfully for '{user.username}'.")
         else:
             messages.error(request, "Invalid role selected.")
@@ -106,11 +107,12 @@ def create_user(request):
             role = form.cleaned_data.get('role')
             if role and role in dict(UserRole.ROLE_CHOICES):
                 # Admin rolü sadece admin tarafından atanabilir
-                if role == 'admin' and get_user_role(request.user) != 'admin':
+                if role == 'admin' and request_role(request) != 'admin':
                     messages.warning(request, "Only admins can create admin users.")
                     return redirect('user:user_permission_dashboard')
                 
                 UserRole.objects.update_or_create(user=obj, defaults={'role': role})
+                invalidate_user_role(obj)
 
             messages.success(
                 request,
@@ -118,7 +120,7 @@ def create_user(request):
             )
             return redirect('user:user_permission_dashboard')
 
-        users = User.objects.all().order_by("id")
+        users = User.objects.select_related("role_info").order_by("id")
         return render(request, 'user_permission_dashboard.html', {
             'users': users,
             'create_user_form': form
@@ -129,7 +131,7 @@ def create_user(request):
 
 @admin_only
 def user_permission_dashboard(request):
-    users = User.objects.all().order_by("id")
+    users = User.objects.select_related("role_info").order_by("id")
     form = CreateUserForm()
     return render(request, 'user_permission_dashboard.html', {
         'users': users,
@@ -157,7 +159,7 @@ def delete_user(request, user_id):
     # 3. Admin kullanıcıları sadece admin silebilir
     # (Zaten @admin_only decorator var, bu kontrol ekstra güvenlik için)
     target_role = get_user_role(target)
-    current_user_role = get_user_role(request.user)
+    current_user_role = request_role(request)
     
     if target_role == "admin" and current_user_role != "admin":
         messages.warning(request, "Only admins can delete admin users.")
@@ -165,6 +167,8 @@ def delete_user(request, user_id):
 
     # Kullanıcıyı sil
     username = target.username
+    target_id = target.id
     target.delete()
+    invalidate_user_role(target_id)
     messages.success(request, f"User '{username}' deleted successfully.")
     return redirect('user:user_permission_dashboard')
\ No newline at end of file
@@ -0,0 +1,310 @@
+# archive.py
+from django.db import connection, models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.utils import timezone
+
+from benefits.bulk import BENEFIT_AMOUNT_FIELDS
+from benefits.models import Benefit, ArchivedBenefit
+from benefits.utils import iter_excel_batches
+from .importers import _to_date
+from .lookups import ExitReason
+from .models import Workers, ArchivedWorker, WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from .registry import lookup_registry
+from reports.summary import PayrollScope, track_payroll
+
+
+OFFBOARD_BATCH_SIZE = 200
+
+# Çıkış listesi kolonları ("Sicil No" veya "sicil_no" ikisi de kabul edilir)
+OFFBOARD_COLUMN_MAPPING = {
+    "Sicil No": "sicil_no",
+    "Exit Date": "exit_date",
+    "Exit Reason": "exit_reason",
+}
+
+OFFBOARD_REQUIRED_COLUMNS = ["sicil_no", "exit_date"]
+
+OUTCOME_ARCHIVED = "archived"
+OUTCOME_DELETED = "deleted"
+OUTCOME_SKIPPED = "skipped"
+
+
+# Worker → ArchivedWorker kopyalanan alanlar (arşivde zaten varsa bunlar güncellenir)
+ARCHIVED_WORKER_FIELDS = [
+    "group", "s_no", "department_short_name", "department", "short_class",
+    "name_surname", "date_of_recruitment", "work_class", "class_name",
+    "location_name", "gross_payment_hourly", "currency", "bonus",
+]
+
+# WorkerGrossMonthly → ArchivedWorkerGrossMonthly birebir kopyalanan alanlar
+ARCHIVED_SALARY_FIELDS = [
+    "year", "month", "group", "short_class", "class_name", "department",
+    "work_class", "location_name", "department_short_name", "s_no", "bonus",
+    "gross_salary_hourly", "currency", "sicil_no", "created_at", "updated_at",
+    "gross_payment",
+]
+
+
+def _until_exit(exit_date):
+    # is_after_exit() değil → (year, month) <= (çıkış yılı, çıkış ayı)
+    return Q(year__lt=exit_date.year) | Q(year=exit_date.year, month__lte=exit_date.month)
+
+
+def _insert_from_select(model, columns, queryset):
+    """
+    INSERT INTO model (columns) SELECT ... — satırlar Python'a hiç yüklenmez.
+    columns: {hedef alan: kaynak ifade}; SELECT sırası annotate sırasıyla aynıdır.
+    """
+    aliases = {f"_archive_{i}": expr for i, expr in enumerate(columns.values())}
+    select = queryset.order_by().annotate(**aliases).values(*aliases)
+    select_sql, params = select.query.sql_with_params()
+
+    qn = connection.ops.quote_name
+    target_columns = ", ".join(qn(model._meta.get_field(f).column) for f in columns)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {qn(model._meta.db_table)} ({target_columns}) {select_sql}",
+            params,
+        )
+        return cursor.rowcount
+
+
+def _upsert_archived_workers(entries):
+    """entries: [(worker, exit_date, exit_reason_id)] → {sicil_no: ArchivedWorker}"""
+    archived = ArchivedWorker.objects.in_bulk(
+        [worker.sicil_no for worker, _, _ in entries], field_name="sicil_no"
+    )
+
+    to_create, to_update = [], []
+    for worker, exit_date, exit_reason_id in entries:
+        archived_worker = archived.get(worker.sicil_no)
+
+        if archived_worker is None:
+            # İlk kez arşivleniyor
+            archived_worker = ArchivedWorker(
+                original_id=worker.id,
+                created_date=worker.created_date,
+                author_id=worker.author_id,
+                sicil_no=worker.sicil_no,
+                gross_payment=worker.gross_payment,
+                total_work_hours=worker.total_work_hours,
+            )
+            to_create.append(archived_worker)
+        else:
+            # Daha önce arşivlenmiş olabilir → son bilgileri güncelle
+            to_update.append(archived_worker)
+
+        for field in ARCHIVED_WORKER_FIELDS:
+            field_name = ArchivedWorker._meta.get_field(field).attname
+            setattr(archived_worker, field_name, getattr(worker, field_name))
+        archived_worker.exit_date = exit_date
+        archived_worker.exit_reason_id = exit_reason_id
+        archived_worker.refresh_search_key()
+
+    ArchivedWorker.objects.bulk_create(to_create)
+    ArchivedWorker.objects.bulk_update(
+        to_update,
+        [ArchivedWorker._meta.get_field(f).name for f in ARCHIVED_WORKER_FIELDS]
+        + ["exit_date", "exit_reason", "search_key"],
+    )
+
+    # bulk_create her veritabanında pk döndürmediği için tek sorguda tekrar oku
+    return ArchivedWorker.objects.in_bulk(
+        [worker.sicil_no for worker, _, _ in entries], field_name="sicil_no"
+    )
+
+
+def _counts_by(queryset, key):
+    return dict(
+        queryset.order_by().values_list(key).annotate(n=Count("pk")).values_list(key, "n")
+    )
+
+
+def archive_workers(entries):
+    """
+    Çıkış tarihine kadarki benefit ve maaş kayıtlarını arşive taşır, sonra
+    worker'ları tüm kayıtlarıyla siler. Tek transaction, tablo başına tek
+    INSERT ... SELECT ve tek DELETE.
+
+    entries: [(worker, exit_date, exit_reason_id), ...]
+    Dönüş: {sicil_no: {"benefits": n, "salaries": n}}
+    """
+    if not entries:
+        return {}
+
+    workers = [worker for worker, _, _ in entries]
+    sicil_nos = [worker.sicil_no for worker in workers]
+    worker_ids = [worker.id for worker in workers]
+
+    # Arşive taşınan kayıtlar özette kalır (çıkış tarihinden sonrakiler düşer)
+    with track_payroll(PayrollScope.of(sicil_nos)):
+        archived = _upsert_archived_workers(entries)
+
+        benefit_filter = Q()
+        salary_filter = Q()
+        benefit_archive_id = []
+        salary_archive_id = []
+        for worker, exit_date, _ in entries:
+            archived_id = archived[worker.sicil_no].id
+            benefit_filter |= Q(worker_id=worker.sicil_no) & _until_exit(exit_date)
+            salary_filter |= Q(worker_id=worker.id) & _until_exit(exit_date)
+            benefit_archive_id.append(When(worker_id=worker.sicil_no, then=Value(archived_id)))
+            salary_archive_id.append(When(worker_id=worker.id, then=Value(archived_id)))
+
+        benefits = Benefit.objects.filter(benefit_filter)
+        salaries = WorkerGrossMonthly.objects.filter(salary_filter)
+
+        benefit_counts = _counts_by(benefits, "worker_id")
+        salary_counts = _counts_by(salaries, "worker_id")
+
+        _insert_from_select(ArchivedBenefit, {
+            "archived_worker": Case(*benefit_archive_id, output_field=models.BigIntegerField()),
+            "sicil_no": F("worker_id"),
+            "year": F("year"),
+            "month": F("month"),
+            **{field: F(field) for field in BENEFIT_AMOUNT_FIELDS},
+            "created_at": Value(timezone.now(), output_field=models.DateTimeField()),
+        }, benefits)
+
+        _insert_from_select(ArchivedWorkerGrossMonthly, {
+            "archived_worker": Case(*salary_archive_id, output_field=models.BigIntegerField()),
+            **{
+                field: F(WorkerGrossMonthly._meta.get_field(field).attname)
+                for field in ARCHIVED_SALARY_FIELDS
+            },
+        }, salaries)
+
+        # Orijinal kayıtları sil (çıkış tarihinden sonraki aylar arşive alınmadan silinir)
+        Benefit.objects.filter(worker_id__in=sicil_nos).delete()
+        WorkerGrossMonthly.objects.filter(worker_id__in=worker_ids).delete()
+        Workers.objects.filter(id__in=worker_ids).delete()
+
+    return {
+        worker.sicil_no: {
+            "benefits": benefit_counts.get(worker.sicil_no, 0),
+            "salaries": salary_counts.get(worker.id, 0),
+        }
+        for worker in workers
+    }
+
+
+def delete_without_archive(workers):
+    """'P' ile başlayan sicil no'lar arşivlenmez, kayıtlarıyla birlikte silinir."""
+    with track_payroll(PayrollScope.of([worker.sicil_no for worker in workers])):
+        Workers.objects.filter(id__in=[worker.id for worker in workers]).delete()
+
+
+def is_archive_exempt(sicil_no):
+    return bool(sicil_no) and sicil_no.startswith("P")
+
+
+class OffboardingError(Exception):
+    """Çıkış listesini hiç işlemeden durduran sheet hataları (eksik kolon vb.)."""
+
+
+def _reason_key(name):
+    # Türkçe büyük/küçük harf: "İstifa" ile "istifa" aynı sebep
+    return name.replace("İ", "i").replace("I", "ı").lower()
+
+
+def _parse_exit_date(value):
+    try:
+        return _to_date(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def offboard_frame(df):
+    """
+    Bir batch çıkış listesini işler: 'P' ile başlayanlar arşivsiz silinir,
+    diğerleri tek archive_workers() çağrısıyla arşivlenir.
+
+    Dönüş: [{"row", "sicil_no", "status", "detail"}, ...] (excel satır sırasıyla)
+    """
+    df = df.rename(columns=OFFBOARD_COLUMN_MAPPING)
+    missing = [c for c in OFFBOARD_REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise OffboardingError(f"Missing columns: {', '.join(missing)}")
+
+    rows = []
+    for index, rec in zip(df.index, df.to_dict("records")):
+        sicil_no = rec["sicil_no"]
+        sicil_no = "" if sicil_no is None or sicil_no != sicil_no else str(sicil_no).strip()
+        reason = rec.get("exit_reason")
+        reason = "" if reason is None or reason != reason else str(reason).strip()
+        rows.append({
+            "row": int(index), "sicil_no": sicil_no,
+            "exit_date": _parse_exit_date(rec["exit_date"]), "exit_reason": reason,
+        })
+
+    # Aynı sicil birden fazla satırda → son satır geçerli
+    last_row = {r["sicil_no"]: r["row"] for r in rows}
+
+    workers = Workers.objects.in_bulk(list(last_row), field_name="sicil_no")
+    archived = set(
+        ArchivedWorker.objects
+        .filter(sicil_no__in=[s for s in last_row if s not in workers])
+        .values_list("sicil_no", flat=True)
+    )
+    reasons = {_reason_key(name): pk for name, pk in lookup_registry.id_map(ExitReason).items()}
+
+    outcomes = {}
+    to_archive = []
+    to_delete = []
+    for r in rows:
+        sicil_no = r["sicil_no"]
+        outcome = {"row": r["row"], "sicil_no": sicil_no, "status": OUTCOME_SKIPPED, "detail": ""}
+        outcomes[r["row"]] = outcome
+
+        if not sicil_no:
+            outcome["detail"] = "Sicil No is empty"
+        elif last_row[sicil_no] != r["row"]:
+            outcome["detail"] = "Duplicate Sicil No, a later row wins"
+        elif sicil_no not in workers:
+            outcome["detail"] = "Already archived" if sicil_no in archived else "Worker not found"
+        elif is_archive_exempt(sicil_no):
+            to_delete.append(workers[sicil_no])
+            outcome["status"] = OUTCOME_DELETED
+            outcome["detail"] = "Deleted without archive (Sicil No starts with 'P')"
+        elif r["exit_date"] is None:
+            outcome["detail"] = "Exit date is missing or not YYYY-MM-DD"
+        elif r["exit_reason"] and _reason_key(r["exit_reason"]) not in reasons:
+            outcome["detail"] = f"Unknown exit reason: {r['exit_reason']}"
+        else:
+            to_archive.append((
+                workers[sicil_no], r["exit_date"], reasons.get(_reason_key(r["exit_reason"])),
+            ))
+            outcome["status"] = OUTCOME_ARCHIVED
+
+    with transaction.atomic():
+        delete_without_archive(to_delete)
+        counts = archive_workers(to_archive)
+
+    for r in rows:
+        outcome = outcomes[r["row"]]
+        if outcome["status"] == OUTCOME_ARCHIVED:
+            moved = counts[r["sicil_no"]]
+            outcome["detail"] = (
+                f"{moved['benefits']} benefit, {moved['salaries']} monthly salary records archived"
+            )
+
+    return list(outcomes.values())
+
+
+def offboard_excel(excel_file, batch_size=OFFBOARD_BATCH_SIZE):
+    """
+    Çıkış listesinin tamamını batch batch işler. Tüm dosya tek transaction'dır:
+    beklenmeyen bir hata olursa hiçbir worker arşivlenmez/silinmez.
+
+    Dönüş: {"rows", "archived", "deleted", "skipped", "outcomes"}
+    """
+    outcomes = []
+    with transaction.atomic():
+        for df in iter_excel_batches(excel_file, batch_size):
+            outcomes.extend(offboard_frame(df))
+
+    result = {"rows": len(outcomes), "outcomes": outcomes}
+    for status in (OUTCOME_ARCHIVED, OUTCOME_DELETED, OUTCOME_SKIPPED):
+        result[status] = sum(o["status"] == status for o in outcomes)
+    return result
@@ -1,12 +1,77 @@
 from django import forms
+from django.forms.models import ModelChoiceIterator
+from django.urls import reverse_lazy
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 from .models import Workers, WorkerGrossMonthly, Currency
+from .registry import lookup_registry
 import datetime
 import calendar
 from decimal import Decimal
 from benefits.utils import parse_tr_decimal
 
 
-class WorkersForm(forms.ModelForm):
+class LookupChoiceIterator(ModelChoiceIterator):
+    """Seçenekler DB yerine lookup registry'den"""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in lookup_registry.all(self.queryset.model):
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(lookup_registry.all(self.queryset.model)) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(lookup_registry.all(self.queryset.model))
+
+
+class LookupChoiceField(forms.ModelChoiceField):
+    """Lookup FK dropdown'ı: render ve doğrulama sorgusuz (workers/registry.py)"""
+    iterator = LookupChoiceIterator
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, self.queryset.model):
+            return value
+
+        obj = lookup_registry.get(self.queryset.model, value)
+        if obj is None:
+            raise forms.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return obj
+
+
+class LookupModelFormMixin:
+    """
+    Lookup alanları LookupChoiceField'da registry ile doğrulandı; model doğrulamasının
+    (ForeignKey.validate) her FK için attığı varlık sorgusu tekrarlanmaz.
+    """
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        exclude.update(
+            name for name, field in self.fields.items() if isinstance(field, LookupChoiceField)
+        )
+        return exclude
+
+
+# ModelForm'larda lookup FK'ları için Meta.field_classes
+LOOKUP_FIELD_CLASSES = {
+    name: LookupChoiceField
+    for name in [
+        "group", "short_class", "department_short_name", "location_name", "currency",
+        "work_class", "class_name", "department", "s_no",
+    ]
+}
+
+
+class WorkersForm(LookupModelFormMixin, forms.ModelForm):
     gross_payment = forms.CharField(
         required=False,
         localize=True,
@@ -41,6 +106,7 @@ class WorkersForm(forms.ModelForm):
             'date_of_recruitment': forms.DateInput(format="%Y-%m-%d", attrs={'type': 'date'}),
             'update_date_user': forms.DateInput(format="%Y-%m-%d", attrs={'type': 'date'})
         }
+        field_classes = LOOKUP_FIELD_CLASSES
 
     def __init__(self, *args, **kwargs):
         super(WorkersForm, self).__init__(*args, **kwargs)
@@ -68,13 +134,49 @@ class WorkersForm(forms.ModelForm):
 MONTH_CHOICES = [(m, calendar.month_name[m]) for m in range(1, 13)]
 
 
+class WorkerAutocompleteInput(forms.TextInput):
+    """
+    Sicil no metin kutusu + boş <datalist>; seçenekler yazarken
+    workers:worker_autocomplete'ten gelir (includes/worker_autocomplete.html).
+    """
+
+    def __init__(self, attrs=None):
+        super().__init__({
+            "autocomplete": "off",
+            "placeholder": "Sicil No / Ad Soyad",
+            "data-autocomplete-url": reverse_lazy("workers:worker_autocomplete"),
+            **(attrs or {}),
+        })
+
+    def render(self, name, value, attrs=None, renderer=None):
+        attrs = dict(attrs or {})
+        list_id = f"{attrs.get('id') or name}_options"
+        attrs["list"] = list_id
+        html = super().render(name, value, attrs, renderer)
+        return mark_safe(f'{html}<datalist id="{escape(list_id)}"></datalist>')
+
+
+class WorkerChoiceField(forms.ModelChoiceField):
+    """
+    Personel seçimi: tüm tablo <option> olarak basılmaz,
+    gönderilen tek sicil_no indeksli tek sorguyla doğrulanır.
+    """
+    widget = WorkerAutocompleteInput
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("queryset", Workers.objects.all())
+        kwargs.setdefault("to_field_name", "sicil_no")
+        kwargs.setdefault("empty_label", None)
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        return super().to_python(value.strip() if isinstance(value, str) else value)
+
+
 class GrossSalaryBulkForm(forms.Form):
-    worker = forms.ModelChoiceField(
-        queryset=Workers.objects.all().order_by('sicil_no'),
-        to_field_name='sicil_no',
+    worker = WorkerChoiceField(
         required=True,
         label='Sicil No (Worker)',
-        empty_label="— Select Worker —",
     )
     year = forms.IntegerField(
         required=True, min_value=2000, max_value=2100,
@@ -102,7 +204,7 @@ class GrossSalaryBulkForm(forms.Form):
     )
 
     # Currency FK dropdown
-    currency = forms.ModelChoiceField(
+    currency = LookupChoiceField(
         queryset=Currency.objects.all(),
         required=False,
         empty_label="—",
@@ -122,7 +224,6 @@ class GrossSalaryBulkForm(forms.Form):
         - refresh yoksa ve gross_salary_hourly boş ise yine Workers'tan doldur.
         """
         super().__init__(*args, **kwargs)
-        self.fields['worker'].label_from_instance = lambda obj: (obj.sicil_no or "").strip()
 
         if self.is_bound:
             data = self.data.copy()
@@ -149,7 +250,7 @@ class GrossSalaryBulkForm(forms.Form):
                     self.fields['gross_salary_hourly'].initial = w.gross_payment_hourly
 
 
-class WorkerGrossMonthlyForm(forms.ModelForm):
+class WorkerGrossMonthlyForm(LookupModelFormMixin, forms.ModelForm):
     gross_salary_hourly = forms.CharField(
         localize=True,
         widget=forms.TextInput(attrs={
@@ -180,6 +281,8 @@ class WorkerGrossMonthlyForm(forms.ModelForm):
             "gross_salary_hourly": forms.NumberInput(attrs={"step": "0.01", "min": "0"}),
             "gross_payment": forms.NumberInput(attrs={"step": "0.01", "min": "0"}),
         }
+        field_classes = LOOKUP_FIELD_CLASSES
+
     def clean_gross_salary_hourly(self):
         return parse_tr_decimal(
             self.cleaned_data.get("gross_salary_hourly")
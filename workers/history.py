@@ -0,0 +1,126 @@
+# history.py
+import calendar
+import datetime
+
+from django.db.models import CharField, Value
+
+from .models import Workers, ArchivedWorker, WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from .registry import lookup_registry
+
+
+HISTORY_YEARS = 5
+MAX_HISTORY_YEARS = 20
+
+# Matrisin her hücresinde gösterilen org alanları (lookup FK → registry)
+ORG_FIELDS = [
+    "group", "short_class", "class_name", "department", "work_class",
+    "location_name", "department_short_name", "s_no",
+]
+
+HISTORY_VALUES = [
+    "id", "year", "month", "gross_salary_hourly", "gross_payment", "bonus", "currency_id",
+    *(f"{name}_id" for name in ORG_FIELDS),
+]
+
+
+def year_range(start_year=None, end_year=None):
+    """?from / ?to → (start, end); varsayılan son HISTORY_YEARS yıl, en fazla MAX_HISTORY_YEARS"""
+    today = datetime.date.today().year
+
+    def _year(value, default):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return default
+
+    end_year = _year(end_year, today)
+    start_year = _year(start_year, end_year - HISTORY_YEARS + 1)
+    if start_year > end_year:
+        start_year, end_year = end_year, start_year
+    return max(start_year, end_year - MAX_HISTORY_YEARS + 1), end_year
+
+
+def find_worker(sicil_no):
+    """Aktif personel; yoksa arşivdeki en son kaydı (kind: "active" / "archived")"""
+    worker = Workers.objects.filter(sicil_no=sicil_no).first()
+    if worker:
+        return worker, "active"
+
+    archived = ArchivedWorker.objects.filter(sicil_no=sicil_no).order_by("-deleted_at").first()
+    return archived, "archived" if archived else None
+
+
+def _history_rows(sicil_no, start_year, end_year):
+    """Aktif + arşiv aylık kayıtları tek UNION ALL sorgusuyla"""
+    active = (
+        WorkerGrossMonthly.objects
+        .filter(worker__sicil_no=sicil_no, year__gte=start_year, year__lte=end_year)
+        .annotate(source=Value("active", output_field=CharField()))
+        .values(*HISTORY_VALUES, "source")
+    )
+    archived = (
+        ArchivedWorkerGrossMonthly.objects
+        .filter(archived_worker__sicil_no=sicil_no, year__gte=start_year, year__lte=end_year)
+        .annotate(source=Value("archived", output_field=CharField()))
+        .values(*HISTORY_VALUES, "source")
+    )
+    return active.union(archived, all=True)
+
+
+def _cell(row):
+    cell = {
+        "id": row["id"],
+        "source": row["source"],
+        "gross_salary_hourly": row["gross_salary_hourly"],
+        "gross_payment": row["gross_payment"],
+        "bonus": row["bonus"],
+        "currency": lookup_registry.get(
+            WorkerGrossMonthly._meta.get_field("currency").related_model, row["currency_id"]
+        ),
+    }
+    for name in ORG_FIELDS:
+        model = WorkerGrossMonthly._meta.get_field(name).related_model
+        cell[name] = lookup_registry.get(model, row[f"{name}_id"])
+    return cell
+
+
+def salary_history(sicil_no, start_year, end_year):
+    """
+    Yıl × ay maaş matrisi (aktif kayıt aynı ayda arşivdekinden önceliklidir).
+
+    Dönüş:
+      rows    → [{"year", "months": [cell | None] * 12, "total"}] (yeni yıl üstte)
+      changes → org alanlarının değiştiği aylar [{"year", "month", "field", "old", "new"}]
+    """
+    cells = {}
+    for row in _history_rows(sicil_no, start_year, end_year):
+        key = (row["year"], row["month"])
+        if key not in cells or row["source"] == "active":
+            cells[key] = _cell(row)
+
+    rows = []
+    for year in range(end_year, start_year - 1, -1):
+        months = [cells.get((year, m)) for m in range(1, 13)]
+        rows.append({
+            "year": year,
+            "months": months,
+            "total": sum(c["gross_payment"] or 0 for c in months if c),
+        })
+
+    changes = []
+    previous = None
+    for key in sorted(cells):
+        cell = cells[key]
+        if previous:
+            for name in ORG_FIELDS:
+                if cell[name] != previous[name]:
+                    changes.append({
+                        "year": key[0],
+                        "month": calendar.month_name[key[1]],
+                        "field": WorkerGrossMonthly._meta.get_field(name).verbose_name,
+                        "old": previous[name],
+                        "new": cell[name],
+                    })
+        previous = cell
+
+    return {"rows": rows, "changes": changes}
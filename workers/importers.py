@@ -0,0 +1,275 @@
+# importers.py
+import datetime
+from decimal import Decimal
+
+from benefits.utils import parse_tr_decimal
+from reports.summary import PayrollScope, track_payroll
+from .lookups import (
+    Group, ShortClass, DirectorName, Currency,
+    WorkClass, ClassName, Department, CostCenter, LocationName
+)
+from .models import Workers, ArchivedWorker
+from .registry import lookup_registry
+from .salaries import (
+    MONTHLY_UPSERT_FIELDS, build_monthly_salaries, first_salary_months, upsert_monthly_salaries
+)
+
+
+IMPORT_BATCH_SIZE = 500
+
+DEFAULT_TOTAL_WORK_HOURS = Decimal("225")
+
+# column mapping (excel kolonlarının adları)
+WORKER_COLUMN_MAPPING = {
+    "Group": "group",
+    "Sicil No": "sicil_no",
+    "CostCenter": "s_no",
+    "Directorships": "department_short_name",
+    "Status": "short_class",
+    "Name surname": "name_surname",
+    "Date of recruitment": "date_of_recruitment",
+    "Work class": "work_class",
+    "Class name": "class_name",
+    "Department": "department",
+    "Currency": "currency",
+    "Bonus": "bonus",
+    "LocationName": "location_name",
+    "Gross payment": "gross_payment",
+    "Update Date": "update_date_user",
+}
+
+WORKER_REQUIRED_COLUMNS = [
+    "group", "s_no", "short_class", "department_short_name",
+    "name_surname", "date_of_recruitment", "work_class",
+    "class_name", "department", "currency", "sicil_no", "location_name",
+]
+
+# excel kolonu → (lookup model, eşleşen alan)
+WORKER_LOOKUPS = {
+    "s_no": (CostCenter, "code"),
+    "group": (Group, "name"),
+    "short_class": (ShortClass, "name"),
+    "department_short_name": (DirectorName, "name"),
+    "currency": (Currency, "code"),
+    "work_class": (WorkClass, "name"),
+    "class_name": (ClassName, "name"),
+    "department": (Department, "name"),
+    "location_name": (LocationName, "name"),
+}
+
+# Var olan worker'da upsert ile güncellenen alanlar (created_date hariç)
+WORKER_UPSERT_FIELDS = [
+    "name_surname", "date_of_recruitment", "gross_payment", "gross_payment_hourly",
+    "total_work_hours", "update_date_user", "bonus", "author", "search_key",
+] + list(WORKER_LOOKUPS)
+
+
+class WorkerImportError(Exception):
+    """Import'u hiç başlatmadan durduran sheet hataları (eksik kolon, arşiv çakışması)."""
+
+
+def _to_date(value):
+    # pandas açılışta yüklenmesin (startup_benchmark): sadece import / çıkış listesi yollarında
+    import pandas as pd
+
+    if isinstance(value, str) and value:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+def _to_datetime(value):
+    import pandas as pd
+
+    if isinstance(value, str):
+        return datetime.datetime.strptime(value, "%Y-%m-%d")
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def _nullable(series):
+    # NaN / NaT / pd.NA → None (ORM'e Python objeleri gitsin)
+    series = series.astype(object)
+    return series.where(series.notna(), None)
+
+
+def _hourly_from_monthly(gross_payment):
+    # excel importunda saatlik ücret her zaman 225 saat üzerinden hesaplanır
+    return Decimal(str(round(float(gross_payment) / 225, 2))) if gross_payment else Decimal("0")
+
+
+def prepare_worker_frame(df):
+    """
+    Excel DataFrame'ini import kolonlarına çevirir ve doğrular.
+    Lookup isimleri lookup registry üzerinden id kolonlarına çevrilir.
+    """
+    df = df.rename(columns=lambda c: str(c).strip())
+    df = df.rename(columns=WORKER_COLUMN_MAPPING)
+
+    missing = [c for c in WORKER_REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise WorkerImportError(f"❌ Eksik kolon: {', '.join(missing)}")
+
+    df = df.copy()
+    df["sicil_no"] = df["sicil_no"].astype(str).str.strip()
+    df = df[(df["sicil_no"] != "") & (df["sicil_no"].str.lower() != "nan")]
+
+    # Aynı sicil birden fazla satırda varsa son satır geçerli
+    df = df.drop_duplicates(subset="sicil_no", keep="last")
+
+    archived_hits = ArchivedWorker.objects.filter(
+        sicil_no__in=df["sicil_no"].tolist()
+    ).exists()
+    if archived_hits:
+        raise WorkerImportError(
+            "Some ID numbers already exist in the archived records. Please check the Archived table."
+        )
+
+    if "gross_payment" not in df.columns:
+        df["gross_payment"] = None
+    if "update_date_user" not in df.columns:
+        df["update_date_user"] = None
+    if "bonus" not in df.columns:
+        df["bonus"] = 0
+
+    df["date_of_recruitment"] = df["date_of_recruitment"].map(_to_datetime)
+    df["update_date_user"] = _nullable(df["update_date_user"].map(_to_date))
+    df["gross_payment"] = df["gross_payment"].map(parse_tr_decimal)
+    df["gross_hourly"] = df["gross_payment"].map(_hourly_from_monthly)
+    df["bonus"] = df["bonus"].fillna(0).astype(int)
+
+    # Lookup isim/kod → id eşlemesi registry'den (sorgu yok)
+    for col, (Model, field) in WORKER_LOOKUPS.items():
+        id_map = lookup_registry.id_map(Model, field)
+        df[f"{col}_id"] = _nullable(
+            df[col].astype(str).map(id_map).astype("Int64")
+        )
+
+    return df
+
+
+def _build_workers(df, author_id, existing):
+    workers = []
+    for rec in df.to_dict("records"):
+        sicil_no = rec["sicil_no"]
+        _, total_work_hours = existing.get(sicil_no, (None, None))
+        total_work_hours = total_work_hours or DEFAULT_TOTAL_WORK_HOURS
+
+        # Workers.save() ile aynı: maaş varsa saatlik = maaş / total_work_hours
+        gross_payment = rec["gross_payment"]
+        if gross_payment:
+            hourly = (gross_payment / total_work_hours).quantize(Decimal("0.01"))
+        else:
+            hourly = rec["gross_hourly"]
+
+        worker = Workers(
+            sicil_no=sicil_no,
+            name_surname=rec["name_surname"],
+            date_of_recruitment=rec["date_of_recruitment"],
+            gross_payment=gross_payment,
+            gross_payment_hourly=hourly,
+            total_work_hours=total_work_hours,
+            update_date_user=rec["update_date_user"],
+            bonus=rec["bonus"],
+            author_id=author_id,
+        )
+        for col in WORKER_LOOKUPS:
+            setattr(worker, f"{col}_id", rec[f"{col}_id"])
+        worker.refresh_search_key()
+        workers.append(worker)
+    return workers
+
+
+def _sync_monthly_salaries(workers, df, existing):
+    """
+    update_date_user ayından yıl sonuna kadar aylık kayıtları tek upsert ile yazar.
+    - maaş girilmişse saatlik ücret = maaş / 225
+    - maaş yok ama mevcut worker güncelleniyorsa Workers.save() gibi senkronlanır,
+      gross_payment değerlerine dokunulmaz
+    """
+    gross_hourly = dict(zip(df["sicil_no"], df["gross_hourly"]))
+
+    targets = [w for w in workers if w.update_date_user]
+    first_months = first_salary_months(
+        [w.pk for w in targets],
+        {w.update_date_user.year for w in targets},
+    )
+
+    with_payment, without_payment = [], []
+    for w in targets:
+        year = w.update_date_user.year
+        first_month = first_months.get((w.pk, year))
+
+        if w.gross_payment:
+            with_payment += build_monthly_salaries(
+                w, year, w.update_date_user.month, gross_hourly[w.sicil_no], first_month
+            )
+        elif w.sicil_no in existing:
+            without_payment += build_monthly_salaries(
+                w, year, w.update_date_user.month, w.gross_payment_hourly, first_month
+            )
+
+    upsert_monthly_salaries(with_payment, batch_size=IMPORT_BATCH_SIZE)
+    upsert_monthly_salaries(
+        without_payment,
+        update_fields=[f for f in MONTHLY_UPSERT_FIELDS if f != "gross_payment"],
+        batch_size=IMPORT_BATCH_SIZE,
+    )
+    return len(with_payment) + len(without_payment)
+
+
+def import_workers_frame(df, author_id):
+    """
+    Worker excel'ini set bazlı import eder:
+    lookup'lar registry'den, Workers için chunk'lı upsert,
+    WorkerGrossMonthly için chunk'lı upsert — hepsi tek transaction içinde.
+
+    Dönüş: {"rows", "created", "updated", "monthly", "skipped"}
+    """
+    total = len(df)
+    df = prepare_worker_frame(df)
+    if df.empty:
+        return {"rows": 0, "created": 0, "updated": 0, "monthly": 0, "skipped": total}
+
+    sicils = df["sicil_no"].tolist()
+
+    # Org alanları değişen worker'ların tüm ayları bordro özetinde yeniden hesaplanır
+    with track_payroll(PayrollScope.of(sicils)):
+        existing = {
+            sicil_no: (pk, total_work_hours)
+            for sicil_no, pk, total_work_hours in Workers.objects
+            .filter(sicil_no__in=sicils)
+            .values_list("sicil_no", "id", "total_work_hours")
+        }
+
+        workers = _build_workers(df, author_id, existing)
+
+        Workers.objects.bulk_create(
+            workers,
+            batch_size=IMPORT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["sicil_no"],
+            update_fields=WORKER_UPSERT_FIELDS,
+        )
+
+        # Upsert her veritabanında id döndürmediği için id'leri tek sorguda al
+        ids = dict(
+            Workers.objects.filter(sicil_no__in=sicils).values_list("sicil_no", "id")
+        )
+        for w in workers:
+            w.pk = ids[w.sicil_no]
+
+        monthly = _sync_monthly_salaries(workers, df, existing)
+
+    return {
+        "rows": len(workers),
+        "created": len(workers) - len(existing),
+        "updated": len(existing),
+        "monthly": monthly,
+        # sicil_no boş ya da sheet içinde tekrar eden satırlar
+        "skipped": total - len(workers),
+    }
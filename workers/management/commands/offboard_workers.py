@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from workers.archive import OFFBOARD_BATCH_SIZE, OUTCOME_SKIPPED, OffboardingError, offboard_excel
+
+
+class _DryRun(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Çıkış listesindeki (sicil_no, exit_date, exit_reason) worker'ları toplu arşivler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("excel_file", help="Çıkış listesi (.xlsx)")
+        parser.add_argument(
+            "--batch-size", type=int, default=OFFBOARD_BATCH_SIZE,
+            help="Tek seferde arşivlenen worker sayısı.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Sonuçları göster, değişiklikleri geri al.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                result = offboard_excel(options["excel_file"], options["batch_size"])
+                if options["dry_run"]:
+                    raise _DryRun
+        except _DryRun:
+            self.stdout.write(self.style.WARNING("Dry run, nothing was changed."))
+        except (OffboardingError, OSError) as e:
+            raise CommandError(str(e))
+
+        for outcome in result["outcomes"]:
+            line = f"row {outcome['row']:>5}  {outcome['sicil_no']:<12} {outcome['status']:<9} {outcome['detail']}"
+            if outcome["status"] == OUTCOME_SKIPPED:
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['rows']} rows: {result['archived']} archived, "
+            f"{result['deleted']} deleted without archive, {result['skipped']} skipped."
+        ))
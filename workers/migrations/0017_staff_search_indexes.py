@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def create_trigram_extension(apps, schema_editor):
+    # Arama indeksleri (trigram, search_key üzerinde) 0018'de kurulur; burada sadece extension
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0016_alter_archivedworkergrossmonthly_department_short_name_and_more'),
+    ]
+
+    operations = [
+        # Geri alınırken pg_trgm extension'ı bırakılır (başka indeksler kullanıyor olabilir)
+        migrations.RunPython(create_trigram_extension, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:11
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+# workers/text.py'deki normalizasyonun bu migration yazıldığı andaki kopyası:
+# o dosya sonradan değişirse bu migration'ın anlamı değişmesin
+TR_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ü": "u", "ü": "u",
+    "Ö": "o", "ö": "o",
+    "Ç": "c", "ç": "c",
+})
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_search_text(value):
+    if value is None:
+        return ""
+
+    text = str(value).translate(TR_FOLD)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+def build_search_key(name_surname, sicil_no):
+    parts = (normalize_search_text(name_surname), normalize_search_text(sicil_no))
+    return " ".join(p for p in parts if p)
+
+SEARCH_TABLES = ["workers", "archived_workers"]
+
+
+def backfill_search_key(apps, schema_editor):
+    for model_name in ["Workers", "ArchivedWorker"]:
+        model = apps.get_model("workers", model_name)
+        batch = []
+        for obj in model.objects.only("id", "name_surname", "sicil_no").iterator(chunk_size=BACKFILL_BATCH_SIZE):
+            obj.search_key = build_search_key(obj.name_surname, obj.sicil_no)
+            batch.append(obj)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                model.objects.bulk_update(batch, ["search_key"])
+                batch = []
+        model.objects.bulk_update(batch, ["search_key"])
+
+
+def create_search_key_indexes(apps, schema_editor):
+    """
+    Postgres'te search_key için trigram indeks (contains araması); prefix araması
+    db_index'in varchar_pattern_ops indeksini kullanır.
+
+    0017'nin eski sürümünü uygulamış veritabanlarında kalan sicil_no / name_surname
+    arama indeksleri kaldırılır (yoksa DROP IF EXISTS bir şey yapmaz).
+    """
+    qn = schema_editor.quote_name
+    for table in SEARCH_TABLES:
+        for name in ["sicil_no_search", "name_surname_search", "name_surname_trgm"]:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {qn(f'{table}_{name}')}")
+
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {qn(f'{table}_search_key_trgm')} "
+                f"ON {qn(table)} USING gin ({qn('search_key')} gin_trgm_ops)"
+            )
+
+
+def drop_search_key_indexes(apps, schema_editor):
+    qn = schema_editor.quote_name
+    for table in SEARCH_TABLES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {qn(f'{table}_search_key_trgm')}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0017_staff_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedworker',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=160),
+        ),
+        migrations.AddField(
+            model_name='workers',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=160),
+        ),
+        migrations.RunPython(backfill_search_key, migrations.RunPython.noop),
+        migrations.RunPython(create_search_key_indexes, drop_search_key_indexes),
+    ]
@@ -9,6 +9,7 @@ from .lookups import (
     Group, ShortClass, DirectorName, Currency,
     WorkClass, ClassName, Department, CostCenter, ExitReason, LocationName
 )
+from .text import build_search_key
 
 
 
@@ -250,10 +251,25 @@ class BaseWorker(models.Model):
         MinValueValidator(0),
         MaxValueValidator(100)
     ])
+    # Türkçe normalize edilmiş "isim sicil" (workers/text.py), aramalar bu kolonda yapılır
+    search_key = models.CharField(max_length=160, blank=True, default="", db_index=True, editable=False)
 
     class Meta:
         abstract = True
 
+    def refresh_search_key(self):
+        # bulk_create / bulk_update save() çağırmaz → toplu yazan yerler bunu kullanır
+        self.search_key = build_search_key(self.name_surname, self.sicil_no)
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_key()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"name_surname", "sicil_no"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_key"}
+
+        super().save(*args, **kwargs)
+
 
 class Workers(BaseWorker):
     created_date = models.DateTimeField(auto_now_add=True)
@@ -283,42 +299,35 @@ class Workers(BaseWorker):
                 Decimal(str(self.gross_payment)) / total_hours
             ).quantize(Decimal("0.01"))
 
-        super().save(*args, **kwargs)
-
-        # update_date_user yoksa veya yeni kayıtsa monthly oluşturma
-        if not is_update or not self.update_date_user:
+        if not is_update:
+            super().save(*args, **kwargs)
             return
 
-        update_year = self.update_date_user.year
-        start_month = self.update_date_user.month
-
-        # Seçilen aydan yıl sonuna kadar WorkerGrossMonthly senkronu
-        for month in range(start_month, 13):
-            salary_obj, created = WorkerGrossMonthly.objects.get_or_create(
-                worker=self,
-                year=update_year,
-                month=month,
-                defaults={
-                    "gross_salary_hourly": self.gross_payment_hourly,
-                    "currency": self.currency,
-                    "sicil_no": self.sicil_no,
-                }
-            )
+        # Maaş kayıtlarının özeti propagate_monthly_salaries içinde kendi ayları için izlenir.
+        # Personel satırı özete sadece iki yoldan dokunur: sicil (tüm geçmiş ona bağlı) ve
+        # yan hakların maaş kaydı olmayan aylarda personelden okunan org / para birimi alanları.
+        from reports.summary import SUMMARY_DIMENSIONS, PayrollScope, track_payroll
+        benefit_keys = [f"{d}_id" for d in SUMMARY_DIMENSIONS] + ["currency_id"]
+        old = Workers.objects.filter(pk=self.pk).values("sicil_no", *benefit_keys).first()
 
-            salary_obj.group = self.group
-            salary_obj.short_class = self.short_class
-            salary_obj.class_name = self.class_name
-            salary_obj.department = self.department
-            salary_obj.work_class = self.work_class
-            salary_obj.location_name = self.location_name
-            salary_obj.s_no = self.s_no
-            salary_obj.department_short_name = self.department_short_name
-            salary_obj.bonus = self.bonus
+        scope = PayrollScope()
+        if old and old["sicil_no"] != self.sicil_no:
+            scope = PayrollScope.of([self.sicil_no, old["sicil_no"]])
+        elif old and any(old[f] != getattr(self, f) for f in benefit_keys):
+            periods = set(self.benefits.values_list("year", "month"))
+            if periods:
+                scope = PayrollScope.of([self.sicil_no], periods)
 
-            salary_obj.gross_salary_hourly = self.gross_payment_hourly
-            salary_obj.currency = self.currency
-            salary_obj.sicil_no = self.sicil_no
-            salary_obj.save()  # burada 7,5 × gün sayısı ile gross_payment hesaplanıyor
+        with track_payroll(scope):
+            super().save(*args, **kwargs)
+
+            # update_date_user yoksa monthly oluşturma
+            if not self.update_date_user:
+                return
+
+            # Seçilen aydan yıl sonuna kadar WorkerGrossMonthly senkronu (tek upsert)
+            from .salaries import propagate_monthly_salaries
+            propagate_monthly_salaries(self)
 
 
 
@@ -433,7 +442,28 @@ class WorkerGrossMonthly(models.Model):
                 Decimal(str(self.gross_salary_hourly)) * Decimal("7.5") * days
             ).quantize(Decimal("0.01"))
 
-        super().save(*args, **kwargs)
+        # Bordro özeti (reports/summary.py) bu ayın katkısı üzerinden delta ile güncellenir;
+        # kayıt başka bir personele / aya taşınmış olabilir: eski yeri de kapsamda
+        from reports.summary import PayrollScope, track_payroll
+
+        scope = PayrollScope.of([self.worker.sicil_no], [(self.year, self.month)])
+        if self.pk:
+            old = (
+                WorkerGrossMonthly.objects.filter(pk=self.pk)
+                .values_list("worker__sicil_no", "year", "month")
+                .first()
+            )
+            if old:
+                scope.merge(PayrollScope.of([old[0]], [old[1:]]))
+
+        with track_payroll(scope):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        from reports.summary import PayrollScope, track_payroll
+
+        with track_payroll(PayrollScope.of([self.worker.sicil_no], [(self.year, self.month)])):
+            return super().delete(*args, **kwargs)
 
 
 
@@ -0,0 +1,70 @@
+# pagination.py
+from django.conf import settings
+
+
+def page_size_from_request(request, default=None):
+    """?per_page=… → 1..DASHBOARD_MAX_PAGE_SIZE aralığına sıkıştırılmış sayfa boyutu"""
+    if default is None:
+        default = getattr(settings, "DASHBOARD_PAGE_SIZE", 5)
+    maximum = getattr(settings, "DASHBOARD_MAX_PAGE_SIZE", 500)
+
+    try:
+        per_page = int(request.GET.get("per_page", default))
+    except (TypeError, ValueError):
+        per_page = default
+    return max(1, min(per_page, maximum))
+
+
+def _cursor(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class KeysetPage:
+    """
+    Seek pagination sonucu. Paginator'ın Page'i gibi iterable;
+    toplam sayı / sayfa numarası yoktur, sadece önceki/sonraki cursor.
+    """
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        return self.object_list[-1].pk if self.has_next and self.object_list else None
+
+    @property
+    def previous_cursor(self):
+        return self.object_list[0].pk if self.has_previous and self.object_list else None
+
+
+def keyset_paginate(queryset, per_page, after=None, before=None):
+    """
+    pk üzerinden seek pagination: OFFSET yok, her sayfa tek indeksli sorgu
+    (WHERE id > cursor ORDER BY id LIMIT per_page + 1).
+
+    after  → bu pk'dan sonraki sayfa
+    before → bu pk'dan önceki sayfa
+    """
+    after, before = _cursor(after), _cursor(before)
+
+    if before is not None:
+        rows = list(queryset.filter(pk__lt=before).order_by("-pk")[:per_page + 1])
+        has_previous = len(rows) > per_page
+        return KeysetPage(rows[:per_page][::-1], has_next=True, has_previous=has_previous)
+
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+
+    rows = list(queryset.order_by("pk")[:per_page + 1])
+    return KeysetPage(rows[:per_page], has_next=len(rows) > per_page, has_previous=after is not None)
@@ -0,0 +1,162 @@
+# registry.py
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .lookups import (
+    Group, ShortClass, DirectorName, Currency,
+    WorkClass, ClassName, Department, CostCenter, ExitReason, LocationName
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+LOOKUP_MODELS = [
+    Group, ShortClass, DirectorName, Currency, WorkClass,
+    ClassName, Department, CostCenter, LocationName, ExitReason,
+]
+
+# Excel / sheet'lerde lookup'ın hangi alanla yazıldığı (diğerleri "name")
+LOOKUP_KEY_FIELDS = {
+    Currency: "code",
+    CostCenter: "code",
+}
+
+
+class _Table:
+    def __init__(self, model, version):
+        self.version = version
+        self.loaded_at = self.checked_at = time.monotonic()
+        # manage_lookups ve dropdown'larla aynı sıra (pk)
+        self.items = tuple(model.objects.order_by("pk"))
+        self.by_id = {obj.pk: obj for obj in self.items}
+        self._keys = {}
+
+    def key_map(self, field):
+        if field not in self._keys:
+            self._keys[field] = {getattr(obj, field): obj.pk for obj in self.items}
+        return self._keys[field]
+
+
+class LookupRegistry:
+    """
+    Lookup tabloları (yılda birkaç kez değişir) process içinde bellekte tutulur.
+
+    Her tablonun versiyonu Django cache'tedir: signal'lar versiyonu artırır, cache
+    paylaşımlıysa (redis/memcached/db) diğer process'ler bir sonraki erişimde yeniler.
+    Paylaşımsız cache'te (varsayılan locmem) LOOKUP_CACHE_TIMEOUT üst sınırdır.
+
+    Versiyon cache'ten en fazla LOOKUP_VERSION_CHECK_SECONDS'ta bir okunur; paylaşımlı
+    cache'te satır başına get() round-trip'e dönüşmesin. Aynı process'teki değişiklik
+    (invalidate) anında görünür.
+    """
+
+    def __init__(self):
+        self._tables = {}
+
+    @staticmethod
+    def _version_key(model):
+        return f"lookup-registry:{model._meta.label_lower}"
+
+    def _timeout(self):
+        return getattr(settings, "LOOKUP_CACHE_TIMEOUT", 300)
+
+    def _cached_version(self, model):
+        try:
+            return cache.get(self._version_key(model), 0)
+        except Exception:
+            logger.warning("Lookup version unavailable for %s", model._meta.label, exc_info=True)
+            return None
+
+    def _table(self, model):
+        now = time.monotonic()
+        table = self._tables.get(model)
+        if (
+            table is not None
+            and now - table.checked_at < getattr(settings, "LOOKUP_VERSION_CHECK_SECONDS", 1)
+            and now - table.loaded_at <= self._timeout()
+        ):
+            return table
+
+        version = self._cached_version(model)
+        if version is None and table is not None:
+            # Cache'e ulaşılamadı: eldeki tablo LOOKUP_CACHE_TIMEOUT'a kadar kullanılır
+            version = table.version
+        if (
+            table is None
+            or table.version != version
+            or now - table.loaded_at > self._timeout()
+        ):
+            table = self._tables[model] = _Table(model, version)
+        table.checked_at = now
+        return table
+
+    def all(self, model):
+        return self._table(model).items
+
+    def get(self, model, pk):
+        if pk in (None, ""):
+            return None
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+        return self._table(model).by_id.get(pk)
+
+    def id_map(self, model, field=None):
+        """{name/code: id} — importer'lar için"""
+        return self._table(model).key_map(field or LOOKUP_KEY_FIELDS.get(model, "name"))
+
+    def invalidate(self, model=None):
+        for m in [model] if model else LOOKUP_MODELS:
+            self._tables.pop(m, None)
+            try:
+                try:
+                    cache.incr(self._version_key(m))
+                except ValueError:
+                    cache.set(self._version_key(m), 1, timeout=None)
+            except Exception:
+                logger.warning("Lookup version not bumped for %s", m._meta.label, exc_info=True)
+
+    def attach(self, objects, fields=None):
+        """
+        objects üzerindeki lookup FK'larını registry'den doldurur
+        ({{ worker.group }} gibi template erişimleri sorgu atmaz).
+        """
+        objects = list(objects)
+        if not objects:
+            return objects
+
+        lookup_fields = [
+            f for f in objects[0]._meta.concrete_fields
+            if f.is_relation and f.related_model in LOOKUP_MODELS
+            and (fields is None or f.name in fields)
+        ]
+        # Tablo (ve versiyon kontrolü) alan başına bir kez, satır başına değil
+        tables = [(field, self._table(field.related_model).by_id) for field in lookup_fields]
+        for obj in objects:
+            for field, by_id in tables:
+                field_id = getattr(obj, field.attname)
+                if field_id is not None and not field.is_cached(obj):
+                    field.set_cached_value(obj, by_id.get(field_id))
+        return objects
+
+
+lookup_registry = LookupRegistry()
+
+
+def _invalidate_lookup(sender, **kwargs):
+    lookup_registry.invalidate(sender)
+    # Transaction commit olmadan önce başka bir istek eski veriyi yüklemiş olabilir
+    transaction.on_commit(lambda: lookup_registry.invalidate(sender))
+
+
+def connect_signals():
+    for model in LOOKUP_MODELS:
+        post_save.connect(_invalidate_lookup, sender=model, dispatch_uid=f"lookup-registry-save-{model.__name__}")
+        post_delete.connect(_invalidate_lookup, sender=model, dispatch_uid=f"lookup-registry-delete-{model.__name__}")
@@ -0,0 +1,129 @@
+# salaries.py
+import calendar
+from decimal import Decimal
+
+from django.db.models import Min
+
+from reports.summary import PayrollScope, track_payroll
+from .models import WorkerGrossMonthly
+
+
+# Worker → WorkerGrossMonthly kopyalanan organizasyon alanları
+MONTHLY_ORG_FIELDS = [
+    "group",
+    "short_class",
+    "class_name",
+    "department",
+    "work_class",
+    "location_name",
+    "department_short_name",
+    "s_no",
+    "currency",
+]
+
+# Upsert sırasında çakışan (worker, year, month) satırında güncellenen alanlar
+MONTHLY_UPSERT_FIELDS = MONTHLY_ORG_FIELDS + [
+    "sicil_no",
+    "bonus",
+    "gross_salary_hourly",
+    "gross_payment",
+    "updated_at",
+]
+
+
+def monthly_gross_payment(gross_salary_hourly, year, month):
+    """
+    Saatlik ücret → günlük 7.5 saat * gün sayısı
+    WorkerGrossMonthly.save() ile aynı hesap; saatlik ücret yoksa None döner.
+    """
+    if not gross_salary_hourly:
+        return None
+
+    days = calendar.monthrange(year, month)[1]
+    return (
+        Decimal(str(gross_salary_hourly)) * WorkerGrossMonthly.DAILY_WORK_HOURS * days
+    ).quantize(Decimal("0.01"))
+
+
+def first_salary_months(worker_ids, years):
+    """
+    Her (worker_id, year) için mevcut ilk ay numarasını tek sorguda döner.
+
+    Örn: {(12, 2025): 3}
+    """
+    rows = (
+        WorkerGrossMonthly.objects
+        .filter(worker_id__in=worker_ids, year__in=years)
+        .values("worker_id", "year")
+        .annotate(first_month=Min("month"))
+        .order_by()
+    )
+    return {(r["worker_id"], r["year"]): r["first_month"] for r in rows}
+
+
+def build_monthly_salaries(worker, year, start_month, gross_salary_hourly, first_month=None):
+    """
+    start_month → 12 arası aylar için kaydedilmemiş WorkerGrossMonthly objeleri üretir.
+
+    Bonus kuralı WorkerGrossMonthly.save() ile aynıdır: yılın ilk ayı bonus alır,
+    diğer aylar 0. Yıl içinde start_month'tan önce kayıt varsa (first_month)
+    yeni aylardan hiçbiri ilk ay sayılmaz.
+    """
+    start_is_first = first_month is None or first_month >= start_month
+
+    rows = []
+    for month in range(start_month, 13):
+        is_first_month = month == start_month and start_is_first
+
+        salary = WorkerGrossMonthly(
+            worker_id=worker.pk,
+            year=year,
+            month=month,
+            sicil_no=worker.sicil_no,
+            bonus=worker.bonus if is_first_month else 0,
+            gross_salary_hourly=gross_salary_hourly,
+            gross_payment=monthly_gross_payment(gross_salary_hourly, year, month),
+        )
+        for field in MONTHLY_ORG_FIELDS:
+            setattr(salary, f"{field}_id", getattr(worker, f"{field}_id"))
+        rows.append(salary)
+
+    return rows
+
+
+def upsert_monthly_salaries(rows, update_fields=None, batch_size=500):
+    """
+    (worker, year, month) unique key üzerinden tek INSERT ... ON CONFLICT DO UPDATE.
+    Postgres ve SQLite (3.24+) için native upsert kullanır.
+    """
+    if not rows:
+        return
+
+    with track_payroll(PayrollScope.from_rows(rows, "sicil_no")):
+        WorkerGrossMonthly.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["worker", "year", "month"],
+            update_fields=update_fields or MONTHLY_UPSERT_FIELDS,
+        )
+
+
+def propagate_monthly_salaries(worker):
+    """
+    Worker'ın update_date_user ayından yıl sonuna kadar aylık maaş kayıtlarını
+    senkronlar: 1 SELECT (ilk ay) + 1 upsert.
+    """
+    year = worker.update_date_user.year
+    start_month = worker.update_date_user.month
+    hourly = worker.gross_payment_hourly
+
+    first_month = first_salary_months([worker.pk], [year]).get((worker.pk, year))
+    rows = build_monthly_salaries(worker, year, start_month, hourly, first_month)
+
+    # Saatlik ücret yoksa mevcut gross_payment değerlerine dokunma (save() davranışı)
+    update_fields = None
+    if not hourly:
+        update_fields = [f for f in MONTHLY_UPSERT_FIELDS if f != "gross_payment"]
+
+    upsert_monthly_salaries(rows, update_fields=update_fields)
@@ -0,0 +1,108 @@
+# search.py
+from django.db import connection
+from django.db.models import Case, FloatField, Q, Value, When
+
+from .models import Workers, ArchivedWorker
+from .text import normalize_search_text
+
+
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+def uses_trigram():
+    # pg_trgm sadece Postgres'te; SQLite'ta LIKE + sabit sıralama puanı kullanılır
+    return connection.vendor == "postgresql"
+
+
+def staff_filter(query, prefix=""):
+    """
+    sicil_no / name_surname araması için tek Q: normalize edilmiş search_key üzerinde
+    LIKE '%q%' (Postgres'te gin_trgm_ops indeksi). "ŞAHİN", "sahin", "Şahin" aynı sonucu verir.
+    prefix: ilişki üzerinden arama için, örn. "worker__"
+    """
+    return Q(**{f"{prefix}search_key__contains": normalize_search_text(query)})
+
+
+def _ranked(queryset, query):
+    key = normalize_search_text(query)
+    rank = Case(
+        When(sicil_no__iexact=query, then=Value(4.0)),
+        When(sicil_no__istartswith=query, then=Value(3.0)),
+        When(search_key__startswith=key, then=Value(2.0)),
+        When(search_key__contains=key, then=Value(1.0)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    match = staff_filter(query)
+
+    if uses_trigram():
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        # Yazım hatalarına tolerans: "mehmet yilmas" → "Mehmet Yılmaz"
+        rank = rank + TrigramSimilarity("search_key", key)
+        match |= Q(search_key__trigram_similar=key)
+
+    return (
+        queryset.filter(match)
+        .annotate(score=rank)
+        .order_by("-score", "name_surname", "pk")
+    )
+
+
+def search_staff(query, limit=SEARCH_LIMIT, include_archived=True):
+    """
+    Aktif + arşivdeki personel içinde sıralı arama.
+    Tablo başına tek sorgu, her biri en fazla `limit` satır.
+
+    Dönüş: [{"kind", "id", "sicil_no", "name_surname", "exit_date", "score"}, ...]
+    """
+    query = (query or "").strip()
+    if not normalize_search_text(query):
+        return []
+
+    results = [
+        {**row, "kind": "active", "exit_date": None}
+        for row in _ranked(Workers.objects.all(), query)
+        .values("id", "sicil_no", "name_surname", "score")[:limit]
+    ]
+
+    if include_archived:
+        results += [
+            {**row, "kind": "archived"}
+            for row in _ranked(ArchivedWorker.objects.all(), query)
+            .values("id", "sicil_no", "name_surname", "exit_date", "score")[:limit]
+        ]
+
+    # Aynı puanda aktif personel önce
+    results.sort(key=lambda r: (-r["score"], r["kind"] != "active", r["name_surname"]))
+    return results[:limit]
+
+
+AUTOCOMPLETE_LIMIT = 20
+
+
+def autocomplete_workers(query, after=None, limit=AUTOCOMPLETE_LIMIT):
+    """
+    Aktif personel için sicil_no / isim prefix araması (form alanları için).
+    İkisi de indeksli prefix LIKE 'q%'; sayfalama sicil_no üzerinden keyset
+    (after = önceki sayfanın son sicil_no'su).
+
+    Dönüş: (rows, next_cursor) — rows: [{"sicil_no", "name_surname"}, ...]
+    """
+    query = (query or "").strip()
+    queryset = Workers.objects.all()
+
+    if query:
+        match = Q(sicil_no__startswith=query) | Q(sicil_no__startswith=query.upper())
+        key = normalize_search_text(query)
+        if key:
+            match |= Q(search_key__startswith=key)
+        queryset = queryset.filter(match)
+
+    if after:
+        queryset = queryset.filter(sicil_no__gt=after)
+
+    rows = list(queryset.order_by("sicil_no").values("sicil_no", "name_surname")[:limit + 1])
+    next_cursor = rows[limit - 1]["sicil_no"] if len(rows) > limit else None
+    return rows[:limit], next_cursor
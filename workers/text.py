@@ -0,0 +1,38 @@
+# text.py
+import re
+import unicodedata
+
+
+# Türkçe harfler → ASCII. I / ı / İ / i hepsi "i": kullanıcılar "Işık" için "isik",
+# "İŞÇİ" için "isci" yazıyor; str.lower() ise "İ" → "i̇" (noktalı) üretir
+TR_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ü": "u", "ü": "u",
+    "Ö": "o", "ö": "o",
+    "Ç": "c", "ç": "c",
+})
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_search_text(value):
+    """
+    Arama için normalize edilmiş metin:
+    "  ŞAHİN, Işık " → "sahin isik"
+    Türkçe harfler katlanır, diğer aksanlar atılır, noktalama boşluğa çevrilir.
+    """
+    if value is None:
+        return ""
+
+    text = str(value).translate(TR_FOLD)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+def build_search_key(name_surname, sicil_no):
+    """Workers / ArchivedWorker.search_key → "mehmet yilmaz 1001" (isim önde: prefix arama)"""
+    parts = (normalize_search_text(name_surname), normalize_search_text(sicil_no))
+    return " ".join(p for p in parts if p)
@@ -1,21 +1,28 @@
 from django.shortcuts import render, HttpResponse, redirect, get_object_or_404
+from django.http import Http404, JsonResponse
+from django.urls import reverse
 from user.permissions import write_access_required
 from .forms import WorkersForm, GrossSalaryBulkForm, WorkerGrossMonthlyForm, WorkerImportForm
 from django.core.paginator import Paginator
+from .pagination import keyset_paginate, page_size_from_request
+from .search import search_staff, staff_filter, autocomplete_workers, SEARCH_LIMIT, MAX_SEARCH_LIMIT, AUTOCOMPLETE_LIMIT
+from .registry import lookup_registry
 from django.contrib import messages
-from .models import Workers, ArchivedWorker, WorkerGrossMonthly, ArchivedWorkerGrossMonthly
+from .models import Workers, ArchivedWorker, WorkerGrossMonthly
 from django.contrib.auth.decorators import login_required
 from django.db import IntegrityError
 from .lookups import Group, ShortClass, DirectorName, Currency, WorkClass, ClassName, Department, CostCenter, ExitReason, LocationName
 from django.forms import modelform_factory
 from django.views.decorators.http import require_POST
 from django.apps import apps
-from decimal import Decimal
 import calendar
 import datetime
-import pandas as pd
-from benefits.models import Benefit, ArchivedBenefit
-from benefits.utils import is_after_exit, parse_tr_decimal
+from .archive import archive_workers, delete_without_archive, is_archive_exempt, offboard_excel
+from .history import find_worker, salary_history, year_range
+from jobs.models import ImportJob
+from benchmarks.profiling import profiling_requested
+from jobs.runner import enqueue_import
+from reports.summary import PayrollScope, track_payroll
 
 
 
@@ -33,6 +40,15 @@ lookup_models = {
 }
 
 
+# dashboard.html'de gösterilen lookup'lar
+DASHBOARD_LOOKUPS = [
+    "group", "department_short_name", "s_no", "department",
+    "work_class", "short_class", "class_name", "location_name",
+]
+
+DASHBOARD_PAGE_SIZES = [5, 25, 100, 250, 500]
+
+
 def is_sicil_no_exist(sicil_no: str) -> bool:
     return (
         Workers.objects.filter(sicil_no=sicil_no).exists()
@@ -51,20 +67,30 @@ def detail(request, id):
 @login_required(login_url="user:login")
 def dashboard(request):
     query = request.GET.get("q")
-    workers = Workers.objects.all()
+    keyset = request.GET.get("mode") == "keyset"
+    per_page = page_size_from_request(request)
+
+    # Sabit sıralama; lookup FK'ları sayfalamadan sonra registry'den doldurulur
+    workers = Workers.objects.order_by("id")
 
     # Arama
     if query:
-        workers = workers.filter(
-            sicil_no__icontains=query
-        ) | workers.filter(
-            name_surname__icontains=query
-        )
+        workers = workers.filter(staff_filter(query))
 
     # Sayfalama
-    paginator = Paginator(workers, 5)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    if keyset:
+        # OFFSET yok: büyük sayfa boyutlarında (100-500) da sabit sayıda sorgu
+        page_obj = keyset_paginate(
+            workers, per_page,
+            after=request.GET.get("after"), before=request.GET.get("before"),
+        )
+    else:
+        paginator = Paginator(workers, per_page)
+        page_number = request.GET.get("page")
+        page_obj = paginator.get_page(page_number)
+
+    # dashboard.html'deki lookup'lar satır başına sorgu atmaz
+    page_obj.object_list = lookup_registry.attach(page_obj.object_list, DASHBOARD_LOOKUPS)
 
     return render(
         request,
@@ -72,12 +98,64 @@ def dashboard(request):
         {
             "page_obj": page_obj,
             "query": query,
-            "exit_reasons": ExitReason.objects.all(),  
+            "keyset": keyset,
+            "per_page": per_page,
+            "page_sizes": DASHBOARD_PAGE_SIZES,
+            "exit_reasons": lookup_registry.all(ExitReason),
         }
     )
 
 
 
+@login_required(login_url="user:login")
+def search_workers(request):
+    """Aktif + arşiv personel araması (JSON), sıralı sonuçlar"""
+    try:
+        limit = min(int(request.GET.get("limit", SEARCH_LIMIT)), MAX_SEARCH_LIMIT)
+    except ValueError:
+        limit = SEARCH_LIMIT
+
+    include_archived = request.GET.get("archived", "1") != "0"
+    results = search_staff(request.GET.get("q"), limit=max(limit, 1), include_archived=include_archived)
+
+    return JsonResponse({"results": [
+        {
+            **row,
+            "score": round(row["score"], 3),
+            "url": (
+                reverse("workers:list_worker_salaries", args=[row["id"]])
+                if row["kind"] == "active"
+                else reverse("workers:salary_history", args=[row["sicil_no"]])
+            ),
+        }
+        for row in results
+    ]})
+
+
+@login_required(login_url="user:login")
+def worker_autocomplete(request):
+    """
+    Form alanları için aktif personel (JSON): ?q=<sicil/isim başı>&after=<cursor>
+    {"results": [{"id": sicil_no, "text": ...}], "next": sonraki sayfanın cursor'ı}
+    """
+    try:
+        limit = min(int(request.GET.get("limit", AUTOCOMPLETE_LIMIT)), MAX_SEARCH_LIMIT)
+    except ValueError:
+        limit = AUTOCOMPLETE_LIMIT
+
+    rows, next_cursor = autocomplete_workers(
+        request.GET.get("q"), after=request.GET.get("after"), limit=max(limit, 1)
+    )
+    return JsonResponse({
+        "results": [
+            {"id": row["sicil_no"], "text": f"{row['sicil_no']} — {row['name_surname']}"}
+            for row in rows
+        ],
+        "next": next_cursor,
+    })
+
+
+
 @login_required(login_url="user:login")
 @write_access_required
 def AddWorkers(request):
@@ -135,8 +213,9 @@ def deleteWorkers(request, id):
     worker = get_object_or_404(Workers, id=id)
 
     #if sicil_no startwith("P"): then deletion but no archive
-    if worker.sicil_no and worker.sicil_no.startswith("P"):
-        worker.delete()
+    if is_archive_exempt(worker.sicil_no):
+        # Bordro özeti de güncellenir (maaş / yan hak kayıtları cascade ile silinir)
+        delete_without_archive([worker])
         messages.warning(
             request,
             f"The record was deleted without being archived or asking for the exit date because the Sicil No {worker.sicil_no} starts with 'P'."
@@ -151,119 +230,10 @@ def deleteWorkers(request, id):
         return redirect("workers:dashboard")
 
     exit_reason_id = request.POST.get("exit_reason")
-    exit_reason = ExitReason.objects.filter(id=exit_reason_id).first()
-
-    archived_worker = ArchivedWorker.objects.filter(sicil_no=worker.sicil_no).first()
-
-    # ArchivedWorker creation
-    if archived_worker is None:
-        # İlk kez arşivleniyor
-        archived_worker = ArchivedWorker.objects.create(
-            original_id=worker.id,
-            created_date=worker.created_date,
-            author=worker.author,
-            group=worker.group,
-            sicil_no=worker.sicil_no,
-            s_no=worker.s_no,
-            department_short_name=worker.department_short_name,
-            department=worker.department,
-            short_class=worker.short_class,
-            name_surname=worker.name_surname,
-            date_of_recruitment=worker.date_of_recruitment,
-            work_class=worker.work_class,
-            class_name=worker.class_name,
-            gross_payment=worker.gross_payment,
-            total_work_hours=worker.total_work_hours,
-            gross_payment_hourly=worker.gross_payment_hourly,
-            currency=worker.currency,
-            bonus=worker.bonus,
-            exit_date=exit_date,
-            exit_reason=exit_reason
-        )
-    else:
-        # Daha önce arşivlenmiş olabilir → son bilgileri güncelle
-        archived_worker.group = worker.group
-        archived_worker.s_no = worker.s_no
-        archived_worker.department_short_name = worker.department_short_name
-        archived_worker.department = worker.department
-        archived_worker.short_class = worker.short_class
-        archived_worker.name_surname = worker.name_surname
-        archived_worker.date_of_recruitment = worker.date_of_recruitment
-        archived_worker.work_class = worker.work_class
-        archived_worker.class_name = worker.class_name
-        archived_worker.gross_payment_hourly = worker.gross_payment_hourly
-        archived_worker.currency = worker.currency
-        archived_worker.bonus = worker.bonus
-        archived_worker.exit_date = exit_date
-        archived_worker.exit_reason = exit_reason
-        archived_worker.save()
-
-
-    # Worker’a ait Benefit kayıtlarını arşivle
-    benefits = Benefit.objects.filter(worker=worker)
-    archived_benefits = []
-    for b in benefits:
-        if is_after_exit(b.year, b.month, exit_date):
-            continue
-        
-        archived_benefits.append(ArchivedBenefit(
-            archived_worker=archived_worker,
-            sicil_no=worker.sicil_no,
-            year=b.year,
-            month=b.month,
-            aile_yakacak=b.aile_yakacak,
-            erzak=b.erzak,
-            altin=b.altin,
-            bayram=b.bayram,
-            dogum_evlenme=b.dogum_evlenme,
-            fon=b.fon,
-            harcirah=b.harcirah,
-            yol_parasi=b.yol_parasi,
-            prim=b.prim
-        ))
-
-    if archived_benefits:
-        ArchivedBenefit.objects.bulk_create(archived_benefits)
-
-    # Orijinal benefit kayıtlarını sil
-    benefits.delete()
-
-    # Worker’a ait maaş kayıtlarını al
-    salaries = WorkerGrossMonthly.objects.filter(worker=worker)
-    archived_salaries = []
-
-    for s in salaries:
-        if is_after_exit(s.year, s.month, exit_date):
-            continue
-        archived_salaries.append(ArchivedWorkerGrossMonthly(
-            archived_worker=archived_worker,
-            year=s.year,
-            month=s.month,
-            group=s.group,
-            short_class=s.short_class,
-            class_name=s.class_name,
-            department=s.department,
-            work_class=s.work_class,
-            location_name=s.location_name,
-            department_short_name=s.department_short_name,
-            s_no=s.s_no,
-            bonus=s.bonus,
-            gross_salary_hourly=s.gross_salary_hourly,
-            currency=s.currency,
-            sicil_no=s.sicil_no,
-            created_at=s.created_at,
-            updated_at=s.updated_at,
-            gross_payment=s.gross_payment
-        ))
-
-    if archived_salaries:
-        ArchivedWorkerGrossMonthly.objects.bulk_create(archived_salaries)
-
-    # Orijinal maaş kayıtlarını sil
-    salaries.delete()
-
-    # Worker kaydını sil
-    worker.delete()
+    exit_reason = lookup_registry.get(ExitReason, exit_reason_id)
+
+    # Arşive kopyalama + silme tek transaction ve set bazlı sorgularla
+    archive_workers([(worker, exit_date, exit_reason.id if exit_reason else None)])
 
     messages.success(
         request,
@@ -279,7 +249,7 @@ def manage_lookups(request):
     for name, model in lookup_models.items():
         form_class = modelform_factory(model, fields="__all__")
         form = form_class(prefix=name)
-        items = model.objects.all()
+        items = lookup_registry.all(model)
         forms_and_items.append({
             "name": name,
             "form": form,
@@ -347,34 +317,36 @@ def bulk_set_gross_salaries(request):
             gross_salary_hourly = form.cleaned_data['gross_salary_hourly']
             overwrite = form.cleaned_data['overwrite_existing']
 
-            for m in months:
-
-                if overwrite:
-                    # UPDATE ya da CREATE
-                    result = WorkerGrossMonthly.objects.update_or_create(
-                        worker=worker,
-                        year=year,
-                        month=m,
-                        defaults={
-                            'gross_salary_hourly': gross_salary_hourly,
-                            'currency': worker.currency,
-                        },
-                    )
-                    result[0].save()   # gross_payment calcuation için 
-
-                else:
-                    # just create if not exists
-                    result = WorkerGrossMonthly.objects.get_or_create(
-                        worker=worker,
-                        year=year,
-                        month=m,
-                        defaults={
-                            'gross_salary_hourly': gross_salary_hourly,
-                            'currency': worker.currency,
-                        },
-                    )
-                    # yeni oluşturulan instance yine hesaplanmalı
-                    result[0].save()
+            # Bordro özeti seçilen aylar için bir kez toplanır (her save ayrı ayrı değil)
+            with track_payroll(PayrollScope.of([worker.sicil_no], [(year, m) for m in months])):
+                for m in months:
+
+                    if overwrite:
+                        # UPDATE ya da CREATE
+                        result = WorkerGrossMonthly.objects.update_or_create(
+                            worker=worker,
+                            year=year,
+                            month=m,
+                            defaults={
+                                'gross_salary_hourly': gross_salary_hourly,
+                                'currency': worker.currency,
+                            },
+                        )
+                        result[0].save()   # gross_payment calcuation için 
+
+                    else:
+                        # just create if not exists
+                        result = WorkerGrossMonthly.objects.get_or_create(
+                            worker=worker,
+                            year=year,
+                            month=m,
+                            defaults={
+                                'gross_salary_hourly': gross_salary_hourly,
+                                'currency': worker.currency,
+                            },
+                        )
+                        # yeni oluşturulan instance yine hesaplanmalı
+                        result[0].save()
 
             messages.success(request, f"{worker.sicil_no} ({worker.name_surname}) için kayıtlar güncellendi.")
             return redirect("workers:list_worker_salaries", worker_id=worker.id)
@@ -504,10 +476,7 @@ def list_worker_salaries(request, worker_id):
 
     # --- Worker Search WITHOUT redirect ---
     if worker_search:
-        workers = (
-            Workers.objects.filter(name_surname__icontains=worker_search)
-            | Workers.objects.filter(sicil_no__icontains=worker_search)
-        )
+        workers = Workers.objects.filter(staff_filter(worker_search))
 
         # Eğer arama sonucu bulunursa gösterilecek worker'ı değiştir
         found_worker = workers.first()
@@ -526,7 +495,8 @@ def list_worker_salaries(request, worker_id):
     year_list = list(range(2020, datetime.date.today().year + 3))
 
     salaries = WorkerGrossMonthly.objects.filter(worker=worker, year=selected_year)
-    salaries_dict = {s.month: s for s in salaries}
+    salaries_dict = {s.month: s for s in lookup_registry.attach(salaries)}
+    lookup_registry.attach([worker])
 
     # --- months_data (month_num EKLENDİ) ---
     months_data = []
@@ -547,6 +517,26 @@ def list_worker_salaries(request, worker_id):
     })
 
 
+@login_required(login_url="user:login")
+def worker_salary_history(request, sicil_no):
+    """Çok yıllı maaş / org matrisi (aktif + arşiv), ?from=2021&to=2025"""
+    worker, kind = find_worker(sicil_no)
+    if worker is None:
+        raise Http404("Worker not found")
+
+    start_year, end_year = year_range(request.GET.get("from"), request.GET.get("to"))
+    lookup_registry.attach([worker])
+
+    return render(request, "worker_salary_history.html", {
+        "worker": worker,
+        "kind": kind,
+        "start_year": start_year,
+        "end_year": end_year,
+        "month_names": [calendar.month_abbr[m] for m in range(1, 13)],
+        **salary_history(sicil_no, start_year, end_year),
+    })
+
+
 @write_access_required
 def delete_salary_record(request, salary_id):
     salary = get_object_or_404(WorkerGrossMonthly, pk=salary_id)
@@ -564,160 +554,40 @@ def import_workers(request):
         if form.is_valid():
             excel_file = form.cleaned_data["excel_file"]
 
-            try:
-                df = pd.read_excel(excel_file)
-
-                # column mapping (excel kolonlarının adları)
-                column_mapping = {
-                    "Group": "group",
-                    "Sicil No": "sicil_no",
-                    "CostCenter": "s_no",
-                    "Directorships": "department_short_name",
-                    "Status": "short_class",
-                    "Name surname": "name_surname",
-                    "Date of recruitment": "date_of_recruitment",
-                    "Work class": "work_class",
-                    "Class name": "class_name",
-                    "Department": "department",
-                    "Currency": "currency",
-                    "Bonus": "bonus",
-                    "LocationName": "location_name",
-                    "Gross payment": "gross_payment",           
-                    "Update Date": "update_date_user",             
-                }
-
-                df.rename(columns=lambda c: c.strip(), inplace=True)
-                df.rename(columns=column_mapping, inplace=True)
-
-                required = ["group","s_no","short_class","department_short_name",
-                            "name_surname","date_of_recruitment","work_class",
-                            "class_name","department","currency","sicil_no","location_name"]
-
-                missing = [c for c in required if c not in df.columns]
-                if missing:
-                    messages.error(request,f"❌ Eksik kolon: {', '.join(missing)}")
-                    return redirect("workers:import_workers")
-                
-                excel_sicils = (
-                    df["sicil_no"]
-                    .astype(str)
-                    .str.strip()
-                )
+            # Import arka planda çalışır (python manage.py run_import_jobs)
+            job = enqueue_import(
+                ImportJob.KIND_WORKERS, excel_file, request.user, profile=profiling_requested(request)
+            )
+            messages.info(request, "Import kuyruğa alındı, ilerlemeyi bu sayfadan takip edebilirsiniz.")
+            return redirect("jobs:detail", job_id=job.id)
 
-                excel_sicils = [s for s in excel_sicils if s and s.lower() != "nan"]
-                excel_sicils_unique = list(set(excel_sicils))
+    else:
+        form = WorkerImportForm()
 
-                archived_hits = list(
-                    ArchivedWorker.objects
-                    .filter(sicil_no__in=excel_sicils_unique)
-                    .values_list("sicil_no", flat=True)
-                )
+    return render(request,"import_workers.html",{"form":form})
 
-                if archived_hits:
-                    messages.error(request,"Some ID numbers already exist in the archived records. Please check the Archived table.")
-                    return redirect("workers:import_workers")
-
-                lookups = {
-                    "s_no": (CostCenter, "code"),
-                    "group": (Group, "name"),
-                    "short_class": (ShortClass, "name"),
-                    "department_short_name": (DirectorName, "name"),
-                    "currency": (Currency, "code"),
-                    "work_class": (WorkClass, "name"),
-                    "class_name": (ClassName, "name"),
-                    "department": (Department, "name"),
-                    "location_name": (LocationName, "name"),
-                }
 
-                for index, row in df.iterrows():
-                    sicil_no = str(row.get("sicil_no")).strip()
-
-                    # date convert
-                    date_val = row.get("date_of_recruitment")
-                    if isinstance(date_val, str):
-                        date_val = datetime.datetime.strptime(date_val, "%Y-%m-%d")
-
-                    # 🔥 excelden gross payment / update tarihini al
-                    gross_payment = parse_tr_decimal(row.get("gross_payment", None))
-                    update_date_user = row.get("update_date_user", None)
-
-                    # convert update_date format
-                    if isinstance(update_date_user, str) and update_date_user:
-                        update_date_user = datetime.datetime.strptime(update_date_user, "%Y-%m-%d").date()
-
-                    # hourly hesapla
-                    total_hours = 225
-                    gross_hourly = round(float(gross_payment)/total_hours, 2) if gross_payment else 0
-
-                    # Lookup objeleri çek
-                    lookup_ids = {}
-                    for col, (Model, field) in lookups.items():
-                        value = row.get(col)
-                        obj = Model.objects.filter(**{field: value}).first()
-                        lookup_ids[f"{col}_id"] = obj.id if obj else None
-
-
-                    # 🔥 Worker Insert/Update
-                    worker_obj, created = Workers.objects.update_or_create(
-                        sicil_no=sicil_no,
-                        defaults={
-                            "name_surname": row.get("name_surname"),
-                            "date_of_recruitment": date_val,
-                            "gross_payment": gross_payment,
-                            "gross_payment_hourly": gross_hourly,
-                            "update_date_user": update_date_user,
-                            "bonus": row.get("bonus", 0),
-                            "author_id": request.user.id,
-                            **lookup_ids
-                        }
-                    )
-
-                    # ----------------------------------------------------
-                    # 📌 Monthly Salary Update / Insert
-                    # ----------------------------------------------------
-                    if update_date_user and gross_payment:
-                        year = update_date_user.year
-                        start_month = update_date_user.month
-
-                        for month in range(start_month, 13):
-                            salary_obj, _ = WorkerGrossMonthly.objects.get_or_create(
-                                worker=worker_obj,
-                                year=year,
-                                month=month,
-                                defaults={
-                                    "gross_salary_hourly": gross_hourly,
-                                    "currency": worker_obj.currency,
-                                    "sicil_no": worker_obj.sicil_no
-                                }
-                            )
-
-                            days = calendar.monthrange(year, month)[1]
-
-                            salary_obj.gross_salary_hourly = gross_hourly
-                            salary_obj.currency = worker_obj.currency
-                            salary_obj.sicil_no = worker_obj.sicil_no
-                            salary_obj.group = worker_obj.group
-                            salary_obj.short_class = worker_obj.short_class
-                            salary_obj.class_name = worker_obj.class_name
-                            salary_obj.department = worker_obj.department
-                            salary_obj.work_class = worker_obj.work_class
-                            salary_obj.location_name = worker_obj.location_name
-                            salary_obj.department_short_name = worker_obj.department_short_name
-                            salary_obj.s_no = worker_obj.s_no
-
-                            salary_obj.gross_payment = Decimal(str(gross_hourly)) * Decimal("7.5") * days
-
-                            salary_obj.save()
-
-
-                messages.success(request, "✔ Import işlemi tamamlandı ve maaşlar güncellendi.")
-                return redirect("workers:dashboard")
+@login_required
+@write_access_required
+def offboard_workers(request):
+    """Çıkış listesi (sicil_no, exit_date, exit_reason) ile toplu arşivleme"""
+    result = None
 
+    if request.method == "POST":
+        form = WorkerImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            try:
+                result = offboard_excel(form.cleaned_data["excel_file"])
             except Exception as e:
+                # OffboardingError (eksik kolon) veya okunamayan dosya; hiçbir kayıt değişmez
                 messages.error(request, f"⚠ Hata: {e}")
-                return redirect("workers:import_workers")
-
+            else:
+                messages.success(
+                    request,
+                    f"{result['archived']} archived, {result['deleted']} deleted without archive, "
+                    f"{result['skipped']} skipped."
+                )
     else:
         form = WorkerImportForm()
 
-    return render(request,"import_workers.html",{"form":form})
+    return render(request, "offboard_workers.html", {"form": form, "result": result})